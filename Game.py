@@ -1,12 +1,36 @@
-import os, sys, json, math, random, array as _array, pygame
+import os, sys, json, pygame
 from states.title import Title
 from objects.Player import Player
+from objects.Rocks import BLACKHOLE
+from objects.Enemy import Drone, Fighter, Striker
+from objects.Boss import BOSS_WIDTH, BOSS_HEIGHT
+from engine.assets import AssetRegistry
+from engine.loader import BackgroundLoader
+from engine.audio import VoiceManager, PRIORITY_NORMAL, PRIORITY_HIGH
+from engine.batch import RenderBatch, collect_group
+from engine.dirty import DirtyRenderer
+from engine.music import MusicManager
+from engine.registry import IndexedGroup
+from engine.interpolation import Interpolator
+from engine.profiler import FrameProfiler
+from engine.target_index import FrameTargets
+from engine import synth
+from engine.text import TextRenderer
 
 BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
 SCORES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scores.json")
 CONTROLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "controls.json")
 MAX_SCORES = 10
 MAX_PLAYERS = 3
+# The simulation always advances in ticks of TICK_DT; per-frame speeds in
+# objects/ (dx, DRIFT_SPEED, ...) are pixels per tick.
+TICK_DT = 1 / 60
+HEADLESS_DT = TICK_DT
+MAX_TICKS_PER_FRAME = 5
+MAX_FPS = 240
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+SOUND_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sounds")
 
 BINDABLE_ACTIONS = [
     ("left", "Move Left"),
@@ -44,6 +68,30 @@ PLAYER_BINDINGS = [
 
 ALWAYS_RESERVED = {pygame.K_RETURN, pygame.K_ESCAPE}
 
+# Voice category (engine.audio) of each play_sound name.
+SOUND_CATEGORIES = {
+    "shoot": "shoot",
+    "spread": "weapon", "laser": "weapon", "missile": "weapon",
+    "explosion": "explosion",
+    "powerup": "ui",
+    "death": "death",
+}
+
+# Sub-collections the game's groups keep indexed (see engine/registry.py).
+PROJECTILE_PARTITIONS = {
+    "normal": lambda p: not p.piercing,
+    "piercing": lambda p: p.piercing,
+}
+ROCK_PARTITIONS = {
+    "blackholes": lambda r: r.rock_type == BLACKHOLE,
+    "solid": lambda r: r.rock_type != BLACKHOLE,
+}
+ENEMY_PARTITIONS = {
+    "Drone": lambda e: isinstance(e, Drone),
+    "Fighter": lambda e: isinstance(e, Fighter),
+    "Striker": lambda e: isinstance(e, Striker),
+}
+
 
 def _key_label(keys):
     """Human-readable label for a list of key codes."""
@@ -74,18 +122,43 @@ def binding_labels_for(bindings):
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, headless=False, projectile_engine="sprite",
+                 profile=False, profile_dir=None, record_dir=None,
+                 dirty_rects=False) -> None:
+        self.headless = headless
+        self.projectile_engine = projectile_engine
+        self.profiler = FrameProfiler(enabled=profile, csv_dir=profile_dir)
+        if headless:
+            # Must be set before pygame.init(); no window, no audio device.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self.GAME_WIDTH, self.GAME_HEIGHT = 1280, 600
         self.screen = pygame.display.set_mode((self.GAME_WIDTH, self.GAME_HEIGHT))
         self.game_canvas = self.screen
+        self.batch = RenderBatch()
+        self.dirty = None
+        if dirty_rects:
+            self.dirty = DirtyRenderer(self.screen)
+            self.game_canvas = self.dirty.canvas
         pygame.display.set_caption("Friends on Fire!")
         self.running, self.playing = True, True
         self.actions = self._make_menu_actions()
         self.num_players = 1
         self.player_actions = [self._make_player_actions() for _ in range(MAX_PLAYERS)]
         self.last_keydown = None
+        # Keys pressed since the last tick, and the releases held back for them.
+        self._fresh_presses = set()
+        self._held_releases = {}
         self.delta_time = 0
+        self.frame_time = 0
+        self.accumulator = 0.0
+        self.render_alpha = 0.0
+        self.interpolate = True
+        self.interpolator = Interpolator(self)
+        self.tick = 0
+        self.targets = FrameTargets(self)
+        self.voices = VoiceManager(frame=lambda: self.tick)
         self.paused = False
         self.active_game_world = None
         self.state_stack = []
@@ -94,13 +167,22 @@ class Game:
         self.all_bindings = self._load_bindings()
         self._build_key_maps()
         self.load_states()
-        self.projectiles = pygame.sprite.Group()
-        self.rocks = pygame.sprite.Group()
+        if projectile_engine == "array":
+            from engine.projectile_store import ProjectileStore, ProjectileGroup
+            self.projectiles = ProjectileGroup(ProjectileStore(self), PROJECTILE_PARTITIONS)
+        else:
+            self.projectiles = IndexedGroup(PROJECTILE_PARTITIONS)
+        self.rocks = IndexedGroup(ROCK_PARTITIONS)
         self.pickups = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = IndexedGroup(ENEMY_PARTITIONS)
         self.enemy_projectiles = pygame.sprite.Group()
         self.players = [Player(self, index=0)]
         self.high_scores = self.load_scores()
+        self.replaying = False
+        self.recorder = None
+        if record_dir:
+            from engine.replay import ReplayWriter
+            self.recorder = ReplayWriter.start(self, record_dir)
 
     @staticmethod
     def _make_menu_actions():
@@ -123,133 +205,318 @@ class Game:
         self.num_players = n
         self.players = [Player(self, index=i) for i in range(n)]
 
+    def start_game(self, game_mode="endless", level_num=0, num_players=None):
+        """Push a Game_World directly, skipping the menus. Returns the world."""
+        from states.game_world import Game_World
+        if self.recorder is not None:
+            self.recorder.event("start_game", game_mode=game_mode,
+                                level_num=level_num, num_players=num_players)
+        if num_players is not None:
+            self.num_players = num_players
+        world = Game_World(self, game_mode=game_mode, level_num=level_num)
+        world.enter_state()
+        return world
+
+    def run_frames(self, n, dt=HEADLESS_DT, render=False):
+        """Step the simulation n times at a fixed dt, as fast as possible.
+
+        No events are polled and no frame cap is applied, so callers drive
+        input by writing to self.actions / self.player_actions directly.
+        """
+        for _ in range(n):
+            if not self.running:
+                break
+            self.profiler.begin_frame()
+            self.delta_time = dt
+            self.update()
+            if render:
+                self.render()
+            self.profiler.end_frame(self._entity_counts())
+
     def game_loop(self):
+        profiler = self.profiler
         while self.playing:
+            profiler.begin_frame()
             self.get_delta_time()
+            profiler.lap("wait")
             self.get_events()
-            self.update()
+            profiler.lap("events")
+            self.advance(self.frame_time)
             self.render()
+            profiler.end_frame(self._entity_counts())
+
+    def advance(self, frame_time):
+        """Run as many fixed ticks as frame_time covers; returns the tick count.
+
+        Leftover time carries over to the next frame and sets render_alpha,
+        how far the real clock is between the last two ticks.  A frame never
+        runs more than MAX_TICKS_PER_FRAME ticks: past that the backlog is
+        dropped and the game slows down instead of spiralling.
+        """
+        self.accumulator += frame_time
+        # The epsilon keeps float drift from swallowing a whole tick.
+        ticks = int(self.accumulator / TICK_DT + 1e-9)
+        if ticks > MAX_TICKS_PER_FRAME:
+            ticks = MAX_TICKS_PER_FRAME
+            self.accumulator = ticks * TICK_DT
+        self.delta_time = TICK_DT
+        for i in range(ticks):
+            if not self.playing:
+                break
+            if i == ticks - 1 and self.interpolate:
+                self.interpolator.snapshot()
+            self.update()
+            # Held until a tick has seen it; frames without a tick keep it.
+            self.last_keydown = None
+            self._release_held_keys()
+        self.accumulator = max(0.0, self.accumulator - ticks * TICK_DT)
+        self.render_alpha = min(1.0, self.accumulator / TICK_DT)
+        return ticks
+
+    def _entity_counts(self):
+        if not self.profiler.enabled:
+            return None
+        gw = self.active_game_world
+        return {
+            "projectiles": len(self.projectiles),
+            "enemy_projectiles": len(self.enemy_projectiles),
+            "rocks": len(self.rocks),
+            "enemies": len(self.enemies),
+            "pickups": len(self.pickups),
+            "particles": len(gw.particles) if gw else 0,
+            "boss_bullets": len(gw.boss.bullets) if gw and gw.boss else 0,
+            "sounds_requested": self.voices.frame_counts()["requested"],
+            "sounds_played": self.voices.counts["played"],
+            "blit_calls": self.batch.calls,
+            "dirty_fraction": self.dirty.last_fraction if self.dirty else 1.0,
+        }
 
     def get_events(self):
-        self.last_keydown = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.playing = False
                 self.running = False
             if event.type == pygame.KEYDOWN:
                 self.last_keydown = event.key
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
                 for action in self._menu_key_down_map.get(event.key, ()):
-                    self.actions[action] = True
+                    self._press(self.actions, "menu", action)
                 for i, kmap in enumerate(self._player_key_down_maps):
                     for action in kmap.get(event.key, ()):
-                        self.player_actions[i][action] = True
+                        self._press(self.player_actions[i], i, action)
             if event.type == pygame.KEYUP:
                 for action in self._menu_key_up_map.get(event.key, ()):
-                    self.actions[action] = False
+                    self._release(self.actions, "menu", action)
                 for i, kmap in enumerate(self._player_key_up_maps):
                     for action in kmap.get(event.key, ()):
-                        self.player_actions[i][action] = False
+                        self._release(self.player_actions[i], i, action)
+
+    # A key pressed and released between two ticks (a quick tap, or a frame
+    # that ran no tick) would otherwise never be seen by update(): its
+    # release is held back until a tick has run with the action set.
+
+    def _press(self, actions, owner, action):
+        actions[action] = True
+        self._fresh_presses.add((owner, action))
+        self._held_releases.pop((owner, action), None)
+
+    def _release(self, actions, owner, action):
+        if (owner, action) in self._fresh_presses:
+            self._held_releases[(owner, action)] = actions
+        else:
+            actions[action] = False
+
+    def _release_held_keys(self):
+        for (_, action), actions in self._held_releases.items():
+            actions[action] = False
+        self._held_releases.clear()
+        self._fresh_presses.clear()
 
     def update(self):
         if not self.state_stack:
             return
+        self.tick += 1
+        self.music.update(self.delta_time)
+        if self.recorder is not None:
+            self.recorder.record(self)
+        profiler = self.profiler
         self.state_stack[-1].update(self.delta_time, self.actions)
+        profiler.lap("update.state")
         if getattr(self.state_stack[-1], "game_over", False):
             return
         self.projectiles.update()
+        profiler.lap("update.projectiles")
         self.enemy_projectiles.update()
+        profiler.lap("update.enemy_projectiles")
         self.pickups.update()
+        profiler.lap("update.pickups")
         for i, player in enumerate(self.players):
             if player.alive:
                 player.update(self.delta_time, self.player_actions[i])
+        profiler.lap("update.players")
 
     def render(self):
         if not self.state_stack:
             return
-        self.state_stack[-1].render(self.game_canvas)
-
+        profiler = self.profiler
+        state = self.state_stack[-1]
+        dirty = self.dirty
+        if dirty is not None:
+            key = None if profiler.overlay else state.dirty_key()
+            if not dirty.begin(state, key):
+                return
+        state.render(self.game_canvas)
+        profiler.lap("render.state")
+
+        undo = None
         if self.is_gameplay_active():
-            from objects.Rocks import BLACKHOLE
-            for rock in self.rocks:
-                if rock.rock_type == BLACKHOLE:
-                    rock.draw_blackhole_effects(self.game_canvas)
-            self.rocks.draw(self.game_canvas)
-            self.pickups.draw(self.game_canvas)
-            self.projectiles.draw(self.game_canvas)
-            self.enemy_projectiles.draw(self.game_canvas)
+            if self.interpolate:
+                undo = self.interpolator.apply(self.render_alpha)
+            canvas = self.game_canvas
+            batch = self.batch
+            batch.begin()
+            overlays = batch["overlays"]
+            for rock in self.rocks.partition("blackholes"):
+                rock.draw_blackhole_effects(canvas)
+            profiler.lap("render.blackholes")
+            collect_group(self.rocks, batch["rocks"])
+            batch.flush(canvas, "rocks")
+            profiler.lap("render.rocks")
+            collect_group(self.pickups, batch["pickups"])
+            batch.flush(canvas, "pickups")
+            profiler.lap("render.pickups")
+            collect_group(self.projectiles, batch["projectiles"])
+            batch.flush(canvas, "projectiles")
+            profiler.lap("render.projectiles")
+            collect_group(self.enemy_projectiles, batch["enemy_projectiles"])
+            batch.flush(canvas, "enemy_projectiles")
+            profiler.lap("render.enemy_projectiles")
+            layer = batch["enemies"]
             for enemy in self.enemies:
-                enemy.draw(self.game_canvas)
+                enemy.collect(layer, overlays)
+            batch.flush(canvas, "enemies")
+            profiler.lap("render.enemies")
+            layer = batch["players"]
             for player in self.players:
                 if player.alive:
-                    player.render(self.game_canvas)
+                    player.collect(layer, overlays)
+            batch.flush(canvas, "players")
+            profiler.lap("render.players")
             gw = self.active_game_world
             if gw and gw.boss and gw.boss.alive_flag:
-                gw.boss.draw(self.game_canvas)
+                gw.boss.collect(batch["boss"], overlays)
+            batch.flush(canvas, "boss")
+            profiler.lap("render.boss")
             if gw:
-                for p in gw.particles:
-                    p.draw(self.game_canvas)
-
-        pygame.display.flip()
+                layer = batch["particles"]
+                gw.particles.collect(layer)
+                for effect in gw.effects:
+                    effect.collect(layer)
+            batch.flush(canvas, "particles")
+            profiler.lap("render.particles")
+            batch.flush(canvas, "overlays")
+            profiler.lap("render.overlays")
+            self.interpolator.restore(undo)
+
+        if profiler.overlay:
+            profiler.draw_overlay(self.game_canvas, self.text)
+            profiler.lap("render.overlay")
+        if dirty is not None:
+            dirty.present(flip=not self.headless)
+        elif not self.headless:
+            pygame.display.flip()
+        profiler.lap("render.flip")
+        if not self.loader.started:
+            # Background loading begins once the first frame is up.
+            self.loader.start()
 
     def is_gameplay_active(self):
         gw = self.active_game_world
         return gw is not None and not gw.game_over and not gw.level_won
 
     def get_delta_time(self):
-        self.delta_time = self.clock.tick(60) / 1000.0
+        """Measure the wall time of the last frame into frame_time."""
+        if self.headless:
+            self.frame_time = HEADLESS_DT
+            return
+        self.frame_time = self.clock.tick(MAX_FPS) / 1000.0
 
     def draw_text(self, surface, text, color, x, y):
-        key = (text, color, 30)
-        text_surface = self._text_cache.get(key)
-        if text_surface is None:
-            text_surface = self.font.render(text, True, color)
-            self._text_cache[key] = text_surface
-        text_rect = text_surface.get_rect()
-        text_rect.center = (x, y)
-        surface.blit(text_surface, text_rect)
+        self.text.draw(surface, text, color, (x, y), 30)
 
     def get_font(self, size):
-        font = self._font_cache.get(size)
-        if font is None:
-            font = pygame.font.SysFont("comicsans", size)
-            self._font_cache[size] = font
-        return font
+        return self.text.font(size)
 
     def draw_text_sized(self, surface, text, color, x, y, size):
-        key = (text, color, size)
-        text_surface = self._text_cache.get(key)
-        if text_surface is None:
-            text_surface = self.get_font(size).render(text, True, color)
-            self._text_cache[key] = text_surface
-        text_rect = text_surface.get_rect()
-        text_rect.center = (x, y)
-        surface.blit(text_surface, text_rect)
+        self.text.draw(surface, text, color, (x, y), size)
 
     def load_assets(self):
         self.assets_dir = os.path.join(BASE_DIR, "assets")
         self.sprite_dir = os.path.join(self.assets_dir, "sprites")
         self.sound_dir = os.path.join(self.assets_dir, "sounds")
-        self.background = pygame.image.load(
-            os.path.join(self.assets_dir, "bg.jpeg")
-        ).convert()
-        self._font_cache = {}
-        self._text_cache = {}
-        self.font = self.get_font(30)
-        self.load_sounds()
+        self.assets = AssetRegistry(self.assets_dir,
+                                    in_gameplay=lambda: self.active_game_world is not None)
+        self._declare_assets()
+        # Only what the title screen shows is loaded before the first frame.
+        # Gameplay images, the sound effects and the game track are decoded
+        # by self.loader meanwhile; the boss track waits for the countdown.
+        self.assets.prewarm(["background"])
+        self.background = self.assets.get("background")
+        self.text = TextRenderer(os.path.join(self.assets_dir, "fonts", "game.ttf"))
+        self.sounds = {}
+        self.shoot_sounds = []
+        self.explosion_sounds = []
+        self.weapon_sounds = {}
+        self.loader = BackgroundLoader()
+        self.loader.add("sounds", self.load_sounds)
+        for name in self.assets.names("image"):
+            if name != "background":
+                self.loader.add(name, lambda name=name: self.assets.decode(name))
+        self.music = MusicManager(self.loader, self._music_path,
+                                  first_channel=self.voices.num_channels)
+        self.music.preload("menu")
+        self.music.preload("game")
+
+    def _music_path(self, name):
+        key = f"music_{name}"
+        if key in self.assets.names("music") and self.assets.exists(key):
+            return self.assets.path(key)
+        return None
+
+    def require_assets(self, *names):
+        """Block until the named loader jobs are done and ready them for use."""
+        self.loader.wait_for(*names)
+        self.assets.prewarm([n for n in names if n in self.assets.names()])
+
+    def _declare_assets(self):
+        assets = self.assets
+        assets.image("background", "bg.jpeg", alpha=False)
+        assets.image("ammo", os.path.join("ammo", "ammo_1.png"))
+        for i in range(1, 5):
+            assets.image(f"asteroid_{i}", os.path.join("sprites", "asteroids", f"asteroid_{i}.png"))
+        assets.music("music_menu", os.path.join("sounds", "menu_music.mp3"))
+        assets.music("music_game", os.path.join("sounds", "game_music.ogg"))
+        assets.music("music_boss", os.path.join("sounds", "boss_music.wav"))
+        # Last, so the loader reaches it after everything a run starts with.
+        assets.image("boss", os.path.join("enemies", "enemy_1.png"),
+                     size=(BOSS_WIDTH, BOSS_HEIGHT))
 
     def load_sounds(self):
-        self.sounds = {}
+        """Decode every sound effect; runs as a loader job, so the tables
+        are only swapped in once they are complete."""
+        sounds = {}
         for name in ("death", "powerup"):
             path = os.path.join(self.sound_dir, f"{name}.wav")
             if os.path.exists(path):
-                self.sounds[name] = pygame.mixer.Sound(path)
+                sounds[name] = pygame.mixer.Sound(path)
             else:
-                self.sounds[name] = None
-        self.shoot_sounds = []
-        self.explosion_sounds = []
-        self.weapon_sounds = {}
+                sounds[name] = None
+        shoot_sounds = []
+        explosion_sounds = []
+        weapon_sounds = {}
         for i in range(1, 4):
-            for prefix, target in (("shoot", self.shoot_sounds), ("explosion", self.explosion_sounds)):
+            for prefix, target in (("shoot", shoot_sounds), ("explosion", explosion_sounds)):
                 path = os.path.join(self.sound_dir, f"{prefix}_{i}.wav")
                 if os.path.exists(path):
                     target.append(pygame.mixer.Sound(path))
@@ -260,15 +527,14 @@ class Game:
                 if os.path.exists(path):
                     group.append(pygame.mixer.Sound(path))
             if group:
-                self.weapon_sounds[weapon_prefix] = group
-        self.weapon_sounds["spread"] = self._generate_swing_sounds()
-        self.music_paths = {
-            "menu": os.path.join(self.sound_dir, "menu_music.mp3"),
-            "game": os.path.join(self.sound_dir, "game_music.ogg"),
-            "boss": os.path.join(self.sound_dir, "boss_music.wav"),
-        }
-
-    def _generate_swing_sounds(self):
+                weapon_sounds[weapon_prefix] = group
+        weapon_sounds["spread"] = self._generate_swing_sounds(weapon_sounds.get("spread", []))
+        self.sounds = sounds
+        self.shoot_sounds = shoot_sounds
+        self.explosion_sounds = explosion_sounds
+        self.weapon_sounds = weapon_sounds
+
+    def _generate_swing_sounds(self, fallback):
         """Generate 3 lightsaber-swing variations for the spread weapon."""
         variants = [
             (0.32, 190, 580, 150),
@@ -280,77 +546,43 @@ class Game:
             snd = self._synth_swing(dur, base, peak, end)
             if snd:
                 sounds.append(snd)
-        return sounds or self.weapon_sounds.get("spread", [])
+        return sounds or fallback
 
     @staticmethod
-    def _synth_swing(duration, base_freq, peak_freq, end_freq):
+    def _synth_swing(duration, base_freq, peak_freq, end_freq, cache_dir=SOUND_CACHE_DIR):
         mixer_init = pygame.mixer.get_init()
         if not mixer_init:
             return None
-        sample_rate, _, channels = mixer_init
-        num_samples = int(sample_rate * duration)
-        buf = _array.array('h')
-        phase = 0.0
-        for i in range(num_samples):
-            t = i / sample_rate
-            p = t / duration
-            if p < 0.22:
-                freq = base_freq + (peak_freq - base_freq) * (p / 0.22)
-            else:
-                freq = peak_freq - (peak_freq - end_freq) * ((p - 0.22) / 0.78)
-            phase += 2 * math.pi * freq / sample_rate
-            tone = (math.sin(phase) * 0.40
-                    + math.sin(phase * 2) * 0.18
-                    + math.sin(phase * 3) * 0.07
-                    + math.sin(phase * 5.02) * 0.04)
-            noise = (random.random() * 2 - 1) * 0.06
-            if p < 0.06:
-                env = p / 0.06
-            elif p > 0.65:
-                env = (1.0 - p) / 0.35
-            else:
-                env = 1.0
-            val = int(max(-1.0, min(1.0, (tone + noise) * env * 0.85)) * 32000)
-            for _ in range(channels):
-                buf.append(val)
-        return pygame.mixer.Sound(buffer=buf)
+        samples = synth.cached(synth.swing, (duration, base_freq, peak_freq, end_freq),
+                               mixer_init, cache_dir)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
 
     def play_boss_death_sound(self):
         """Layer all explosion sounds at staggered volumes for an epic boom."""
         for i, snd in enumerate(self.explosion_sounds):
-            ch = pygame.mixer.find_channel()
-            if ch:
-                ch.set_volume(1.0 - i * 0.15)
-                ch.play(snd)
+            self.voices.play(("boss_death", i), [snd], "death",
+                             priority=PRIORITY_HIGH, volume=1.0 - i * 0.15)
 
-    def play_sound(self, name):
+    def play_sound(self, name, priority=PRIORITY_NORMAL):
         if name == "shoot":
-            if self.shoot_sounds:
-                random.choice(self.shoot_sounds).play()
-            return
-        if name == "explosion":
-            if self.explosion_sounds:
-                random.choice(self.explosion_sounds).play()
-            return
-        if self.weapon_sounds.get(name):
-            random.choice(self.weapon_sounds[name]).play()
-            return
-        sound = self.sounds.get(name)
-        if sound:
-            sound.play()
+            sounds = self.shoot_sounds
+        elif name == "explosion":
+            sounds = self.explosion_sounds
+        elif self.weapon_sounds.get(name):
+            sounds = self.weapon_sounds[name]
+        else:
+            sound = self.sounds.get(name)
+            sounds = [sound] if sound else []
+        self.voices.play(name, sounds, SOUND_CATEGORIES.get(name, "ui"), priority)
 
     def play_music(self, name, loops=-1, volume=0.8):
-        path = self.music_paths.get(name)
-        if path and os.path.exists(path):
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(loops)
+        self.music.play(name, loops, volume)
 
     def stop_music(self):
-        pygame.mixer.music.stop()
+        self.music.stop()
 
     def stop_all_sounds(self):
-        pygame.mixer.stop()
+        self.voices.stop()
 
     @staticmethod
     def default_bindings(player_idx=None):
@@ -369,8 +601,8 @@ class Game:
         return reserved
 
     def get_binding_labels(self):
-        """Build display labels for all players from current bindings."""
-        return [binding_labels_for(b) for b in self.all_bindings]
+        """Display labels for all players (rebuilt by _build_key_maps)."""
+        return self._binding_labels
 
     @staticmethod
     def _bindings_to_key_maps(bindings):
@@ -392,6 +624,7 @@ class Game:
     def _build_key_maps(self):
         """Build per-player key maps and a combined menu key map."""
         all_bindings = self.all_bindings
+        self._binding_labels = [binding_labels_for(b) for b in all_bindings]
 
         self._player_key_down_maps = []
         self._player_key_up_maps = []
@@ -485,6 +718,8 @@ class Game:
         self.high_scores.append({"time": time_alive, "kills": kills})
         self.high_scores.sort(key=lambda s: (s["kills"], s["time"]), reverse=True)
         self.high_scores = self.high_scores[:MAX_SCORES]
+        if self.replaying:
+            return
         try:
             with open(SCORES_FILE, "w") as f:
                 json.dump(self.high_scores, f)
@@ -492,12 +727,14 @@ class Game:
             pass
 
     def return_to_menu(self):
+        self.profiler.end_session()
         self.rocks.empty()
         self.projectiles.empty()
         self.pickups.empty()
         self.enemies.empty()
         self.enemy_projectiles.empty()
         self.active_game_world = None
+        self.interpolator.clear()
         self.paused = False
         while len(self.state_stack) > 1:
             self.state_stack.pop()
@@ -505,6 +742,8 @@ class Game:
         self.reset_keys()
 
     def reset_keys(self):
+        self._fresh_presses.clear()
+        self._held_releases.clear()
         for action in self.actions:
             self.actions[action] = False
         for pa in self.player_actions:
@@ -513,6 +752,13 @@ class Game:
 
 
 if __name__ == "__main__":
-    game_instance = Game()
+    profile = "--profile" in sys.argv[1:]
+    record = "--record" in sys.argv[1:]
+    game_instance = Game(profile=profile, profile_dir=PROFILE_DIR if profile else None,
+                         record_dir=REPLAY_DIR if record else None,
+                         dirty_rects="--dirty" in sys.argv[1:])
     while game_instance.running:
         game_instance.game_loop()
+    game_instance.profiler.end_session()
+    if game_instance.recorder is not None:
+        game_instance.recorder.close()
@@ -0,0 +1,97 @@
+"""Sound effect load in a three-player fire fight: free-for-all vs voice pool.
+
+Runs the suite's three-players-with-every-secondary scene, plus a stream of
+rock explosions, for a fixed number of ticks.  ``legacy_play_sound`` (a
+verbatim copy of the pre-voice-manager Game.play_sound, kept as the
+"before" reference) starts a Sound for every request; the current path goes
+through engine.audio.VoiceManager.  Reports sounds started per second of
+game time, the average number of mixer channels busy each tick (what the
+mixer has to mix) and the time spent inside play_sound.  Run from the
+repository root:
+
+    python -m benchmarks.bench_audio [ticks]
+"""
+
+import random
+import sys
+import time
+
+import pygame
+
+from Game import Game, TICK_DT
+from benchmarks.suite import _three_players_armed
+from engine import rng
+from objects.Rocks import Rock
+
+TICKS = 600
+EXPLOSIONS_PER_TICK = 2
+
+
+def legacy_play_sound(self, name, priority=None):
+    if name == "shoot":
+        if self.shoot_sounds:
+            random.choice(self.shoot_sounds).play()
+        return
+    if name == "explosion":
+        if self.explosion_sounds:
+            random.choice(self.explosion_sounds).play()
+        return
+    if self.weapon_sounds.get(name):
+        random.choice(self.weapon_sounds[name]).play()
+        return
+    sound = self.sounds.get(name)
+    if sound:
+        sound.play()
+
+
+def run(ticks, legacy):
+    Rock.sprites = None
+    rng.seed_all(1)
+    game = Game(headless=True)
+    game.require_assets("sounds")
+    _three_players_armed(game, random.Random(1))
+    play = legacy_play_sound.__get__(game) if legacy else game.play_sound
+    calls = [0, 0.0]
+
+    def timed(name, *args, **kwargs):
+        start = time.perf_counter()
+        play(name, *args, **kwargs)
+        calls[0] += 1
+        calls[1] += time.perf_counter() - start
+
+    game.play_sound = timed
+    started = [0]
+    real_play = game.voices.play
+
+    def counting_voice(*args, **kwargs):
+        channel = real_play(*args, **kwargs)
+        started[0] += channel is not None
+        return channel
+
+    game.voices.play = counting_voice
+    game.delta_time = TICK_DT
+    busy = 0
+    for _ in range(ticks):
+        game.update()
+        for _ in range(EXPLOSIONS_PER_TICK):
+            game.play_sound("explosion")
+        busy += sum(pygame.mixer.Channel(i).get_busy()
+                    for i in range(pygame.mixer.get_num_channels()))
+        # Real time for the mixer to advance, as at 60 fps.
+        time.sleep(TICK_DT)
+    game.stop_all_sounds()
+    seconds = ticks * TICK_DT
+    plays = calls[0] if legacy else started[0]
+    return calls[0] / seconds, plays / seconds, busy / ticks, calls[1] * 1000.0 / ticks
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else TICKS
+    for label, legacy in (("legacy", True), ("voices", False)):
+        requested, started, busy, ms = run(ticks, legacy)
+        print(f"{label:7s} {requested:6.1f} requests/s  {started:6.1f} sounds started/s  "
+              f"{busy:4.1f} channels busy  {ms:.3f} ms/tick in play_sound")
+
+
+if __name__ == "__main__":
+    main()
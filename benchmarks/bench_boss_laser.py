@@ -0,0 +1,128 @@
+"""Boss laser streams: the old list-rebuilding stream vs the ring buffer.
+
+Two concurrent lasers run through their whole life on a patrolling,
+bobbing boss while a column of player positions is tested against them
+every frame.  ``LegacyBossLaser`` is a verbatim copy of the pre-ring-buffer
+update / draw / hits_player kept here as the "before" reference.  Run from
+the repository root:
+
+    python -m benchmarks.bench_boss_laser
+"""
+
+import time
+
+import pygame
+
+from Game import Game, TICK_DT
+from engine import rng
+from objects.Boss import (
+    Boss, BossLaser, LASER_BEAM_RADIUS, LASER_BEAM_SPEED, LASER_CHARGE_DURATION,
+    LASER_ACTIVE_DURATION, LASER_EMIT_INTERVAL,
+)
+
+FRAMES = 300
+PROBE_STEP = 40
+
+
+class LegacyBossLaser(BossLaser):
+    def __init__(self, boss, offset_y, game):
+        super().__init__(boss, offset_y, game)
+        self.points = []
+
+    def update(self, dt):
+        self.timer += dt
+        if self.phase == "charging" and self.timer >= LASER_CHARGE_DURATION:
+            self.phase = "active"
+            self.timer = 0.0
+            self.emit_timer = 0.0
+        elif self.phase == "active" and self.timer >= LASER_ACTIVE_DURATION:
+            self.phase = "fading"
+        elif self.phase == "fading" and not self.points:
+            self.phase = "done"
+
+        speed = LASER_BEAM_SPEED * dt
+        self.points = [(x - speed, y) for x, y in self.points
+                       if x - speed > -20]
+
+        if self.phase == "active":
+            self.emit_timer += dt
+            while self.emit_timer >= LASER_EMIT_INTERVAL:
+                self.emit_timer -= LASER_EMIT_INTERVAL
+                bx = float(self.boss.rect.left)
+                by = float(self.boss.rect.centery + self.offset_y)
+                self.points.append((bx, by))
+
+    def draw(self, surface):
+        if len(self.points) < 2:
+            return
+        pts = [(int(x), int(y)) for x, y in self.points]
+        r = LASER_BEAM_RADIUS
+        pygame.draw.lines(surface, (100, 0, 100), False, pts, r * 2 + 4)
+        pygame.draw.lines(surface, (220, 60, 220), False, pts, r + 2)
+        pygame.draw.lines(surface, (255, 180, 255), False, pts, max(2, r // 2))
+        if self.phase == "active" and self.points:
+            lx, ly = self.points[-1]
+            gr = 10
+            glow = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (255, 200, 255, 220), (gr, gr), gr)
+            surface.blit(glow, (int(lx) - gr, int(ly) - gr))
+
+    def hits_player(self, player):
+        if not self.active or not self.points:
+            return False
+        px, py = int(player.position_x), int(player.position_y)
+        img = player.curr_image
+        pr = pygame.Rect(px, py, img.get_width(), img.get_height())
+        r = LASER_BEAM_RADIUS
+        step = max(1, len(self.points) // 50)
+        for i in range(0, len(self.points), step):
+            sx, sy = self.points[i]
+            seg_rect = pygame.Rect(int(sx) - r, int(sy) - r, r * 2, r * 2)
+            if pr.colliderect(seg_rect):
+                return True
+        return False
+
+
+def time_lasers(laser_cls, frames=FRAMES, seed=1):
+    """(update ms, draw ms, collide ms) per frame for two concurrent lasers."""
+    rng.seed_all(seed)
+    game = Game(headless=True)
+    boss = Boss(game, attack_level=2, hp_override=100)
+    boss.entering = False
+    boss.rect.x = boss.park_x
+    boss.base_y = float(boss.rect.centery)
+    lasers = [laser_cls(boss, -70, game), laser_cls(boss, 70, game)]
+    player = game.players[0]
+    player.position_x = game.GAME_WIDTH // 4
+    canvas = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    totals = [0.0, 0.0, 0.0]
+    for _ in range(frames):
+        boss.attack_timer = 9999
+        boss.update(TICK_DT)
+        t0 = time.perf_counter()
+        for laser in lasers:
+            laser.update(TICK_DT)
+        t1 = time.perf_counter()
+        for laser in lasers:
+            laser.draw(canvas)
+        t2 = time.perf_counter()
+        for y in range(0, game.GAME_HEIGHT, PROBE_STEP):
+            player.position_y = y
+            for laser in lasers:
+                laser.hits_player(player)
+        t3 = time.perf_counter()
+        totals[0] += t1 - t0
+        totals[1] += t2 - t1
+        totals[2] += t3 - t2
+    return [t / frames * 1000.0 for t in totals]
+
+
+def main():
+    print(f"{'stream':<8} {'update ms':>10} {'draw ms':>8} {'collide ms':>11}")
+    for name, cls in (("legacy", LegacyBossLaser), ("ring", BossLaser)):
+        update_ms, draw_ms, collide_ms = time_lasers(cls)
+        print(f"{name:<8} {update_ms:>10.3f} {draw_ms:>8.3f} {collide_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Tier-5 boss bullet field: live bullet count and frame cost.
+
+First runs a full headless game frame (update + render) against a tier-5
+boss that keeps its galaxy and bloom patterns going, and reports how many
+bullets are live and the milliseconds per frame against the 60 FPS budget.
+Then times the bullet work alone, update + player collision + draw, for the
+same number of hostile bullets held as BossProjectile sprites (grid
+broadphase plus mask test, as in Game_World) vs in the array-backed
+BulletField.  Run from the repository root:
+
+    python -m benchmarks.bench_bullets
+"""
+
+import math
+import random
+import statistics
+import time
+
+import pygame
+
+from Game import Game, TICK_DT
+from engine import rng
+from engine.spatial_hash import SpatialHash, player_rect
+from objects.Boss import Boss, BossProjectile
+from objects.Rocks import Rock
+from objects.bullet_patterns import BulletField, PLAYER_HIT_RADIUS, TAU
+
+COUNTS = [500, 1000, 2000, 3000]
+FRAMES = 300
+WARMUP_FRAMES = 240
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+def time_tier5(frames=FRAMES, seed=1):
+    """(median ms per frame, mean live bullets, peak live bullets)."""
+    Rock.sprites = None
+    rng.seed_all(seed)
+    game = Game(headless=True)
+    game.delta_time = TICK_DT
+    world = game.start_game("endless")
+    world.rock_spawn_interval = math.inf
+    world.enemy_spawn_interval = math.inf
+    world._enemies_started = True
+    world.next_boss_time = math.inf
+    game.players[0].hit_invuln = math.inf
+    boss = Boss(game, attack_level=5, hp_override=10**6)
+    boss.entering = False
+    boss.rect.x = boss.park_x
+    world.boss = boss
+    world.boss_phase = True
+
+    times, live = [], []
+    for i in range(WARMUP_FRAMES + frames):
+        if not boss.patterns:
+            boss._attack_galaxy()
+            boss._attack_bloom()
+        start = time.perf_counter()
+        game.update()
+        game.render()
+        if i >= WARMUP_FRAMES:
+            times.append(time.perf_counter() - start)
+            live.append(len(boss.bullets))
+    return statistics.median(times) * 1000.0, statistics.mean(live), max(live)
+
+
+def _random_heading(r):
+    return r.uniform(0, TAU)
+
+
+def time_sprites(count, frames=60, seed=1):
+    game = Game(headless=True)
+    r = random.Random(seed)
+    canvas = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    player = game.players[0]
+    group = pygame.sprite.Group()
+    grid = SpatialHash()
+    px, py = int(player.position_x), int(player.position_y)
+    total = 0.0
+    for _ in range(frames):
+        while len(group) < count:
+            a = _random_heading(r)
+            group.add(BossProjectile(r.uniform(0, game.GAME_WIDTH), r.uniform(0, game.GAME_HEIGHT),
+                                     3 * math.cos(a), 3 * math.sin(a), game,
+                                     destroyable=False, size=8))
+        start = time.perf_counter()
+        group.update()
+        grid.rebuild(group)
+        for bp in grid.query(player_rect(player)):
+            offset = (bp.rect.x - px, bp.rect.y - py)
+            if player.mask.overlap(bp.mask, offset):
+                bp.kill()
+        group.draw(canvas)
+        total += time.perf_counter() - start
+    return total / frames * 1000.0
+
+
+def time_field(count, frames=60, seed=1):
+    game = Game(headless=True)
+    r = random.Random(seed)
+    canvas = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    player = game.players[0]
+    field = BulletField(game.GAME_WIDTH, game.GAME_HEIGHT)
+    total = 0.0
+    for _ in range(frames):
+        while len(field) < count:
+            field.emit(r.uniform(0, game.GAME_WIDTH), r.uniform(0, game.GAME_HEIGHT),
+                       [_random_heading(r)], 3.0)
+        start = time.perf_counter()
+        field.update()
+        field.collide_circle(player.position_x, player.position_y, PLAYER_HIT_RADIUS)
+        field.draw(canvas)
+        total += time.perf_counter() - start
+    return total / frames * 1000.0
+
+
+def main():
+    ms, mean_live, peak = time_tier5()
+    print(f"tier-5 boss frame: {ms:.2f} ms median ({FRAME_BUDGET_MS:.1f} ms budget), "
+          f"{mean_live:.0f} bullets live on average, {peak} peak")
+    print(f"{'bullets':>7} {'sprite ms':>10} {'field ms':>9} {'speedup':>8}")
+    for count in COUNTS:
+        sprite_ms = time_sprites(count)
+        field_ms = time_field(count)
+        print(f"{count:>7} {sprite_ms:>10.3f} {field_ms:>9.3f} {sprite_ms / field_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
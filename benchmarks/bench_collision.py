@@ -0,0 +1,76 @@
+"""Broadphase scaling: pygame.sprite.groupcollide vs SpatialHash.
+
+Builds a scene of player projectiles and rocks scattered over the playfield
+and times one projectile-vs-rock pass both ways (the grid timing includes
+its per-frame rebuild).  Run from the repository root:
+
+    python -m benchmarks.bench_collision
+"""
+
+import random
+import time
+
+import pygame
+
+from Game import Game
+from engine.spatial_hash import SpatialHash, groupcollide
+from objects.Projectile import Projectile
+from objects.Rocks import Rock, BASIC, IRON
+
+SIZES = [(50, 10), (100, 20), (200, 30), (500, 40), (1000, 60)]
+REPEATS = 30
+
+
+def build_scene(game, n_proj, n_rocks, seed=1):
+    rng = random.Random(seed)
+    projectiles = pygame.sprite.Group()
+    rocks = pygame.sprite.Group()
+    for _ in range(n_proj):
+        projectiles.add(Projectile("crimson", rng.randint(0, game.GAME_WIDTH),
+                                   rng.randint(0, game.GAME_HEIGHT), game))
+    for i in range(n_rocks):
+        w = rng.randint(20, 70)
+        rocks.add(Rock(rng.randint(0, game.GAME_WIDTH), rng.randint(0, game.GAME_HEIGHT),
+                       w, w, game, rock_type=IRON if i % 3 == 0 else BASIC))
+    return projectiles, rocks
+
+
+def time_pass(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def run(sizes=SIZES, repeats=REPEATS):
+    game = Game(headless=True)
+    results = []
+    for n_proj, n_rocks in sizes:
+        projectiles, rocks = build_scene(game, n_proj, n_rocks)
+        grid = SpatialHash()
+
+        def brute():
+            pygame.sprite.groupcollide(projectiles, rocks, False, False,
+                                       collided=pygame.sprite.collide_mask)
+
+        def hashed():
+            grid.rebuild(rocks)
+            groupcollide(projectiles, grid, False, False,
+                         collided=pygame.sprite.collide_mask)
+
+        results.append((n_proj, n_rocks, time_pass(brute, repeats),
+                        time_pass(hashed, repeats)))
+    return results
+
+
+def main():
+    print(f"{'proj':>6} {'rocks':>6} {'groupcollide ms':>16} {'grid ms':>9} {'speedup':>8}")
+    for n_proj, n_rocks, brute_ms, grid_ms in run():
+        print(f"{n_proj:>6} {n_rocks:>6} {brute_ms:>16.3f} {grid_ms:>9.3f} "
+              f"{brute_ms / grid_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
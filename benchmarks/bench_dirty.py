@@ -0,0 +1,98 @@
+"""Render + present time per frame: full redraw and flip vs dirty rectangles.
+
+Runs an idle title screen, the title with the selection moving twice a
+second, and a few of the suite's gameplay scenes, once with the default
+full redraw and ``pygame.display.flip()`` and once with
+``Game(dirty_rects=True)`` (engine.dirty).  The display is a real window
+surface on SDL's software "dummy" driver unless SDL_VIDEODRIVER says
+otherwise, so flips and updates are actually issued.  Reports the best
+median ms per frame of a few alternating rounds for both, and the average
+fraction of the screen pushed to the display in dirty mode.  The dummy
+driver's flip is free, so here the times only cover drawing; on a windowed
+software driver every flip also copies the whole frame to the window, and
+the pushed fraction is how much of that copy dirty mode keeps.  Run from the
+repository root:
+
+    python -m benchmarks.bench_dirty [frames]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from Game import Game, TICK_DT
+from benchmarks.suite import SCENES
+from engine import rng
+from objects.Rocks import Rock
+
+FRAMES = 240
+ROUNDS = 3
+GAMEPLAY_SCENES = ("projectiles_200", "rocks_30_mixed", "boss_tier4_spiral_ring",
+                   "players_3_all_secondaries", "projectiles_1000")
+
+
+def _title(moving):
+    def build(game, r):
+        game.loader.wait_all()
+        title = game.state_stack[-1]
+
+        def step():
+            if moving and game.tick % 30 == 0:
+                title.selected = (title.selected + 1) % 4
+            game.tick += 1
+        return step
+    return build
+
+
+def _gameplay(name):
+    def build(game, r):
+        refill = SCENES[name](game, r)
+
+        def step():
+            refill()
+            game.update()
+        return step
+    return build
+
+
+CASES = [("title_idle", _title(False)), ("title_moving", _title(True))] + [
+    (name, _gameplay(name)) for name in GAMEPLAY_SCENES]
+
+
+def run(build, frames, dirty):
+    Rock.sprites = None
+    rng.seed_all(1)
+    game = Game(dirty_rects=dirty)
+    game.delta_time = TICK_DT
+    step = build(game, random.Random(1))
+    times = []
+    for _ in range(frames):
+        step()
+        start = time.perf_counter()
+        game.render()
+        times.append(time.perf_counter() - start)
+    fraction = game.dirty.stats()["pixels_per_frame"] if dirty else 1.0
+    return statistics.median(times) * 1000.0, fraction
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    print(f"video driver: {os.environ['SDL_VIDEODRIVER']}")
+    for name, build in CASES:
+        full, dirty = [], []
+        for _ in range(ROUNDS):
+            full.append(run(build, frames, dirty=False)[0])
+            ms, fraction = run(build, frames, dirty=True)
+            dirty.append(ms)
+        full, dirty = min(full), min(dirty)
+        print(f"{name:26s} full {full:6.2f} ms  dirty {dirty:6.2f} ms  "
+              f"({full / max(dirty, 1e-6):4.1f}x, {fraction * 100:5.1f}% of the screen pushed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Game_World HUD render time for 1 vs 3 players, cached vs rebuilt.
+
+Every player carries all secondaries with one of them cooling down, so both
+the static layer and the animated overlay have work to do.  "rebuilt" drops
+the cached HUD layers before every frame, which is what every frame cost
+before the cache existed.  Run from the repository root:
+
+    python -m benchmarks.bench_hud
+"""
+
+import time
+
+from Game import Game
+from objects.Player import SEC_COOLDOWN
+from objects.Weapon import SECONDARY_WEAPONS
+
+FRAMES = 300
+
+
+def build_world(num_players):
+    game = Game(headless=True)
+    world = game.start_game("endless", num_players=num_players)
+    for player in game.players:
+        for weapon_cls in SECONDARY_WEAPONS:
+            player.set_secondary(weapon_cls)
+        player.has_shield = True
+        player.sec_state = SEC_COOLDOWN
+        player.sec_state_timer = 2.0
+    return game, world
+
+
+def time_hud(num_players, cached, frames=FRAMES):
+    game, world = build_world(num_players)
+    canvas = game.game_canvas
+    total = 0.0
+    for _ in range(frames):
+        if not cached:
+            world._hud_layers.clear()
+        start = time.perf_counter()
+        world.render(canvas)
+        total += time.perf_counter() - start
+    return total / frames * 1000.0
+
+
+def main():
+    print(f"{'players':>7} {'rebuilt ms':>11} {'cached ms':>10} {'speedup':>8}")
+    for n in (1, 3):
+        rebuilt = time_hud(n, cached=False)
+        cached = time_hud(n, cached=True)
+        print(f"{n:>7} {rebuilt:>11.3f} {cached:>10.3f} {rebuilt / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Black-hole effect render time: the old per-frame code vs LensingRenderer.
+
+Two black holes sit on the background (one fully on screen, one clipped by
+the right edge) and the effect pass is timed per frame.  ``legacy_draw`` is
+a verbatim copy of the pre-cache Rock.draw_blackhole_effects kept here as
+the "before" reference.  Run from the repository root:
+
+    python -m benchmarks.bench_lensing
+"""
+
+import time
+
+import pygame
+
+from Game import Game
+from engine.lensing import LensingRenderer
+from objects.Rocks import Rock, BLACKHOLE
+
+FRAMES = 120
+QUALITIES = (1.0, 0.5, 0.25)
+
+
+def legacy_draw(rock, surface):
+    cx, cy = rock.rect.centerx, rock.rect.centery
+    cr = rock.core_radius
+    gr = int(rock.gravity_radius)
+
+    dist_r = max(30, int(gr * 0.55))
+    sw, sh = surface.get_size()
+    x1 = max(0, cx - dist_r)
+    y1 = max(0, cy - dist_r)
+    x2 = min(sw, cx + dist_r)
+    y2 = min(sh, cy + dist_r)
+    cap_w, cap_h = x2 - x1, y2 - y1
+
+    if cap_w > 8 and cap_h > 8:
+        captured = surface.subsurface((x1, y1, cap_w, cap_h)).copy()
+        lcx, lcy = cx - x1, cy - y1
+
+        layers = [
+            (dist_r,           0.96, 20),
+            (dist_r * 2 // 3,  0.91, 45),
+            (dist_r // 3,      0.84, 75),
+        ]
+        for radius, shrink, alpha in layers:
+            if radius < 4:
+                continue
+            small_w = max(4, int(cap_w * shrink))
+            small_h = max(4, int(cap_h * shrink))
+            distorted = pygame.transform.smoothscale(
+                pygame.transform.smoothscale(captured, (small_w, small_h)),
+                (cap_w, cap_h),
+            )
+            result = pygame.Surface((cap_w, cap_h), pygame.SRCALPHA)
+            result.blit(distorted, (0, 0))
+            mask = pygame.Surface((cap_w, cap_h), pygame.SRCALPHA)
+            pygame.draw.circle(mask, (255, 255, 255, alpha),
+                               (lcx, lcy), radius)
+            result.blit(mask, (0, 0),
+                        special_flags=pygame.BLEND_RGBA_MULT)
+            surface.blit(result, (x1, y1))
+
+    vig_r = cr + 22 + int(12 * rock.bh_growth)
+    vig_surf = pygame.Surface((vig_r * 2, vig_r * 2), pygame.SRCALPHA)
+    vc = vig_r
+    step = max(2, vig_r // 9)
+    for i in range(9, 0, -1):
+        r = cr + i * step
+        a = min(220, 12 + (9 - i) * 22)
+        pygame.draw.circle(vig_surf, (3, 0, 8, a), (vc, vc), r)
+    surface.blit(vig_surf, (cx - vc, cy - vc))
+
+    glow_r = cr + 3
+    glow_size = glow_r * 2 + 6
+    glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+    gc = glow_r + 3
+    pygame.draw.circle(glow_surf, (50, 12, 100, 35), (gc, gc), glow_r + 2)
+    pygame.draw.circle(glow_surf, (90, 25, 160, 60), (gc, gc), glow_r, 1)
+    surface.blit(glow_surf, (cx - gc, cy - gc))
+
+
+def time_frames(game, black_holes, draw, frames=FRAMES):
+    canvas = game.game_canvas
+    total = 0.0
+    for _ in range(frames):
+        canvas.blit(game.background, (0, 0))
+        start = time.perf_counter()
+        for bh in black_holes:
+            draw(bh, canvas)
+        total += time.perf_counter() - start
+    return total / frames * 1000.0
+
+
+def run(frames=FRAMES):
+    game = Game(headless=True)
+    black_holes = [
+        Rock(500, 300, 16, 16, game, rock_type=BLACKHOLE),
+        Rock(game.GAME_WIDTH - 60, 200, 16, 16, game, rock_type=BLACKHOLE),
+    ]
+    black_holes[1].feed(6)
+    results = [("before", time_frames(game, black_holes, legacy_draw, frames))]
+    for quality in QUALITIES:
+        renderer = LensingRenderer(quality)
+
+        def draw(bh, surface):
+            renderer.draw(surface, bh.rect.centerx, bh.rect.centery,
+                          bh.core_radius, bh.gravity_radius, bh.bh_growth)
+
+        results.append((f"cached q={quality}", time_frames(game, black_holes, draw, frames)))
+    return results
+
+
+def main():
+    results = run()
+    before = results[0][1]
+    print(f"{'renderer':>14} {'ms/frame':>9} {'speedup':>8}")
+    for name, ms in results:
+        print(f"{name:>14} {ms:>9.3f} {before / ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Main-thread stall of music switches: mixer.music.load vs the music manager.
+
+Plays the game -> boss -> game -> boss cycle of an endless run a few times.
+``legacy_play_music`` (a verbatim copy of the original path-based
+Game.play_music, kept as the "before" reference) opens and starts each track
+on the calling frame; engine.music.MusicManager decodes tracks on the
+loader thread and only starts a channel on the frame.  Reports the worst
+main-thread stall per switch, and for the manager how long after the
+request the new track actually started.  Run from the repository root:
+
+    python -m benchmarks.bench_music [cycles]
+"""
+
+import os
+import sys
+import time
+
+import pygame
+
+from Game import Game, TICK_DT
+from objects.Rocks import Rock
+
+CYCLES = 5
+SWITCHES = [("game", "boss"), ("boss", "game")]
+
+
+def legacy_play_music(game, name, loops=-1, volume=0.8):
+    path = {
+        "menu": os.path.join(game.sound_dir, "menu_music.mp3"),
+        "game": os.path.join(game.sound_dir, "game_music.ogg"),
+        "boss": os.path.join(game.sound_dir, "boss_music.wav"),
+    }.get(name)
+    if path and os.path.exists(path):
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+
+def run_legacy(game, cycles):
+    worst = {}
+    legacy_play_music(game, "game")
+    for _ in range(cycles):
+        for key in SWITCHES:
+            start = time.perf_counter()
+            legacy_play_music(game, key[1])
+            worst[key] = max(worst.get(key, 0.0), (time.perf_counter() - start) * 1000.0)
+    pygame.mixer.music.stop()
+    return worst
+
+
+def run_manager(game, cycles):
+    music = game.music
+    music.preload("boss")
+    game.loader.start()
+    game.loader.wait_all()
+    music.play("game")
+    worst = {}
+    for _ in range(cycles):
+        for key in SWITCHES:
+            start = time.perf_counter()
+            music.play(key[1])
+            while music.current != key[1]:
+                music.update(TICK_DT)
+            worst[key] = max(worst.get(key, 0.0), (time.perf_counter() - start) * 1000.0)
+    music.stop()
+    return worst, music.latency
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES
+    Rock.sprites = None
+    game = Game(headless=True)
+    legacy = run_legacy(game, cycles)
+    manager, latency = run_manager(game, cycles)
+    for key in SWITCHES:
+        print(f"{key[0]:>4s} -> {key[1]:4s}  worst stall: legacy {legacy[key]:6.2f} ms, "
+              f"manager {manager[key]:6.2f} ms (track started "
+              f"{latency[key]:.2f} ms after the request)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Projectile update + draw: sprite group vs the NumPy projectile store.
+
+Fills the playfield with a mix of cannon shots, pulse orbs and wave shots
+(shots that leave the screen are respawned outside the timed region) and
+times one update and one draw per frame for each engine.  Run from the
+repository root:
+
+    python -m benchmarks.bench_projectiles
+"""
+
+import math
+import random
+import time
+
+import pygame
+
+from Game import Game
+from objects.Projectile import Projectile
+
+COUNTS = [100, 500, 1000, 2000]
+FRAMES = 60
+
+
+def _spawn(game, rng):
+    x, y = rng.randint(0, game.GAME_WIDTH // 2), rng.randint(20, game.GAME_HEIGHT - 20)
+    kind = rng.random()
+    if kind < 0.6:
+        return Projectile("crimson", x, y, game, dx=8, dy=rng.choice((-1, 0, 1)))
+    if kind < 0.85:
+        a = rng.uniform(-0.6, 0.6)
+        return Projectile("orchid", x, y, game, dx=8 * math.cos(a), dy=8 * math.sin(a),
+                          pulse=True, width=24, height=24)
+    return Projectile("lime", x, y, game, dx=7, wave=(20, 0.15, rng.uniform(0, math.pi)))
+
+
+def time_engine(engine, count, frames=FRAMES, seed=1):
+    game = Game(headless=True, projectile_engine=engine)
+    rng = random.Random(seed)
+    canvas = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    total = 0.0
+    for _ in range(frames):
+        missing = count - len(game.projectiles)
+        if missing:
+            game.projectiles.add(*[_spawn(game, rng) for _ in range(missing)])
+        start = time.perf_counter()
+        game.projectiles.update()
+        game.projectiles.draw(canvas)
+        total += time.perf_counter() - start
+    return total / frames * 1000.0
+
+
+def main():
+    print(f"{'shots':>6} {'sprite ms':>10} {'array ms':>9} {'speedup':>8}")
+    for count in COUNTS:
+        sprite_ms = time_engine("sprite", count)
+        array_ms = time_engine("array", count)
+        print(f"{count:>6} {sprite_ms:>10.3f} {array_ms:>9.3f} {sprite_ms / array_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
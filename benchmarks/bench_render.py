@@ -0,0 +1,281 @@
+"""Canvas calls per frame in Game.render: per-entity drawing vs layer batches.
+
+Runs a few of the suite's scenes plus an enemy wave (thirty enemies with
+health bars, three shielded players showing damage hearts) and counts, per
+frame, every blit, blits and pygame.draw call that lands on the canvas:
+HUD and text included.  ``legacy_render`` and the ``_legacy_*`` helpers are
+copies of the gameplay part of the pre-batch Game.render and of the
+Enemy.draw, Player.render and Boss.draw it called, kept as the "before"
+reference: each group and entity draws on its own, bars with
+pygame.draw.rect.  The current Game.render collects entries into
+engine.batch layers and submits each layer once.  Reports calls per frame
+and the median render time.  Run from the repository root:
+
+    python -m benchmarks.bench_render [frames]
+"""
+
+import math
+import random
+import statistics
+import sys
+import time
+
+import pygame
+
+from Game import Game, TICK_DT
+from benchmarks.suite import SCENES, _quiet_world
+from engine import rng
+from objects.Boss import (BOSS_WIDTH, LASER_BEAM_RADIUS, LASER_CHARGE_DURATION,
+                          LASER_RING_SIZE, SHIELD_COLOR_BASE, SHIELD_RADIUS)
+from objects.Enemy import Drone, Fighter, Striker
+from objects.Player import MAX_LIVES
+from objects.Rocks import Rock
+
+FRAMES = 240
+BENCH_SCENES = ("rocks_30_mixed", "pickups_40", "boss_tier4_spiral_ring",
+                "players_3_all_secondaries")
+DRAW_FUNCTIONS = ("rect", "line", "lines", "polygon", "circle", "ellipse")
+
+
+class CountingCanvas(pygame.Surface):
+    def __init__(self, like):
+        super().__init__(like.get_size(), 0, like)
+        self.calls = 0
+
+    def blit(self, *args, **kwargs):
+        self.calls += 1
+        return super().blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        self.calls += 1
+        return super().blits(*args, **kwargs)
+
+    def fill(self, *args, **kwargs):
+        self.calls += 1
+        return super().fill(*args, **kwargs)
+
+
+def count_draw_calls(canvas):
+    """Count pygame.draw calls made on canvas; returns an undo function."""
+    originals = {name: getattr(pygame.draw, name) for name in DRAW_FUNCTIONS}
+
+    def counting(fn):
+        def wrapper(surface, *args, **kwargs):
+            if surface is canvas:
+                canvas.calls += 1
+            return fn(surface, *args, **kwargs)
+        return wrapper
+
+    for name, fn in originals.items():
+        setattr(pygame.draw, name, counting(fn))
+    return lambda: [setattr(pygame.draw, n, fn) for n, fn in originals.items()]
+
+
+def _legacy_enemy(enemy, surface):
+    if not enemy.alive_flag:
+        return
+    surface.blit(enemy.image, enemy.rect)
+    if enemy.max_hp > 1:
+        bar_w = enemy.width + 4
+        bar_h = 4
+        x = enemy.rect.centerx - bar_w // 2
+        y = enemy.rect.top - 8
+        pygame.draw.rect(surface, (40, 40, 40), (x - 1, y - 1, bar_w + 2, bar_h + 2))
+        fill_w = max(0, int(bar_w * enemy.hp / enemy.max_hp))
+        color = (220, 40, 40) if enemy.hp / enemy.max_hp < 0.35 else (40, 220, 40)
+        pygame.draw.rect(surface, color, (x, y, fill_w, bar_h))
+
+
+def _legacy_tiny_heart(display, x, y, size, filled=True, alpha=255):
+    s = size
+    r = s // 4
+    heart = pygame.Surface((s, s), pygame.SRCALPHA)
+    hcx = s // 2
+    if filled:
+        base_color = (220, 40, 40, alpha)
+        highlight = (255, 130, 130, min(255, alpha))
+    else:
+        base_color = (60, 60, 65, alpha // 2)
+        highlight = None
+    pygame.draw.circle(heart, base_color, (hcx - r + 1, r + 2), r)
+    pygame.draw.circle(heart, base_color, (hcx + r - 1, r + 2), r)
+    pygame.draw.polygon(heart, base_color, [(1, r + 2), (s - 1, r + 2), (hcx, s - 2)])
+    if highlight:
+        pygame.draw.circle(heart, highlight, (hcx - r, r), max(1, r // 2))
+    display.blit(heart, (x, y))
+
+
+def _legacy_player(player, display):
+    if player.hit_invuln > 0:
+        ghost = player.curr_image.copy()
+        ghost.set_alpha(70)
+        display.blit(ghost, (player.position_x, player.position_y))
+    else:
+        display.blit(player.curr_image, (player.position_x, player.position_y))
+    if player.has_shield:
+        cx = int(player.position_x) + player.curr_image.get_width() // 2
+        cy = int(player.position_y) + player.curr_image.get_height() // 2
+        r = max(player.curr_image.get_width(), player.curr_image.get_height()) // 2 + 6
+        pulse = int(25 + 15 * math.sin(pygame.time.get_ticks() * 0.005))
+        shield_surf = pygame.Surface((r * 2 + 4, r * 2 + 4), pygame.SRCALPHA)
+        sc = r + 2
+        pygame.draw.circle(shield_surf, (80, 180, 255, pulse), (sc, sc), r, 3)
+        pygame.draw.circle(shield_surf, (180, 220, 255, pulse // 2), (sc, sc), r - 2, 1)
+        display.blit(shield_surf, (cx - sc, cy - sc))
+    if player.shield_flash > 0:
+        player.shield_flash -= 1
+    if player.damage_indicator > 0:
+        hs = 10
+        gap = 2
+        total_w = MAX_LIVES * (hs + gap) - gap
+        ship_cx = int(player.position_x) + player.curr_image.get_width() // 2
+        start_x = ship_cx - total_w // 2
+        y = int(player.position_y) - hs - 6
+        t = pygame.time.get_ticks() / 1000.0
+        blink = 0.45 + 0.55 * math.sin(t * 8)
+        fade = min(1.0, player.damage_indicator / 0.5)
+        alpha = max(0, min(255, int(255 * blink * fade)))
+        for i in range(MAX_LIVES):
+            _legacy_tiny_heart(display, start_x + i * (hs + gap), y, hs,
+                               filled=(i < player.lives), alpha=alpha)
+
+
+def _legacy_laser(laser, surface):
+    if laser.phase == "charging":
+        progress = min(1.0, laser.timer / LASER_CHARGE_DURATION)
+        boss_left = laser.boss.rect.left
+        y = int(laser.boss.rect.centery + laser.offset_y)
+        end_x = max(0, boss_left - int(80 * progress))
+        pygame.draw.line(surface, (200, 0, 200), (boss_left, y), (end_x, y), 1)
+        gr = int(10 * progress)
+        if gr > 0:
+            glow = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (255, 100, 255, int(180 * progress)), (gr, gr), gr)
+            surface.blit(glow, (boss_left - gr, y - gr))
+    elif laser._count >= 2 and laser._strip is not None:
+        ox, oy = laser._strip_origin
+        pad = LASER_BEAM_RADIUS + 4
+        first = int(laser._keys[laser._head]) - ox - pad
+        last = int(laser._keys[(laser._head + laser._count - 1) % LASER_RING_SIZE]) - ox + pad
+        area = pygame.Rect(first, 0, last - first, laser._strip.get_height())
+        surface.blit(laser._strip, (ox + first - int(laser.scroll), oy), area)
+        if laser.phase == "active":
+            lx, ly = laser._points(laser._count - 1, laser._count)[0]
+            glow = laser._head_glow()
+            gr = glow.get_width() // 2
+            surface.blit(glow, (int(lx) - gr, int(ly) - gr))
+
+
+def _legacy_boss(boss, surface):
+    if not boss.alive_flag:
+        return
+    if boss.invuln_timer > 0:
+        cx, cy = boss.rect.centerx, boss.rect.centery
+        pulse = 0.85 + 0.15 * math.sin(pygame.time.get_ticks() / 1000 * 4)
+        radius = int(SHIELD_RADIUS * pulse)
+        shield_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        r, g, b = SHIELD_COLOR_BASE
+        pygame.draw.circle(shield_surf, (r, g, b, 50), (radius, radius), radius)
+        pygame.draw.circle(shield_surf, (r, g, b, 90), (radius, radius), int(radius * 0.85), 3)
+        pygame.draw.circle(shield_surf, (200, 230, 255, 120), (radius, radius), radius, 2)
+        surface.blit(shield_surf, (cx - radius, cy - radius))
+    for laser in boss.boss_lasers:
+        _legacy_laser(laser, surface)
+    surface.blit(boss.image, boss.rect)
+    boss.boss_projectiles.draw(surface)
+    boss.bullets.draw(surface)
+    bar_w = BOSS_WIDTH + 20
+    bar_h = 10
+    x = boss.rect.centerx - bar_w // 2
+    y = boss.rect.top - 20
+    pygame.draw.rect(surface, (60, 60, 60), (x - 1, y - 1, bar_w + 2, bar_h + 2))
+    pygame.draw.rect(surface, (80, 0, 0), (x, y, bar_w, bar_h))
+    fill_w = max(0, int(bar_w * boss.hp / boss.max_hp))
+    if boss.invuln_timer > 0:
+        color = (80, 180, 255)
+    else:
+        color = (220, 30, 30) if boss.hp / boss.max_hp < 0.3 else (30, 200, 30)
+    pygame.draw.rect(surface, color, (x, y, fill_w, bar_h))
+
+
+def legacy_render(self):
+    self.state_stack[-1].render(self.game_canvas)
+    if self.is_gameplay_active():
+        for rock in self.rocks.partition("blackholes"):
+            rock.draw_blackhole_effects(self.game_canvas)
+        self.rocks.draw(self.game_canvas)
+        self.pickups.draw(self.game_canvas)
+        self.projectiles.draw(self.game_canvas)
+        self.enemy_projectiles.draw(self.game_canvas)
+        for enemy in self.enemies:
+            _legacy_enemy(enemy, self.game_canvas)
+        for player in self.players:
+            if player.alive:
+                _legacy_player(player, self.game_canvas)
+        gw = self.active_game_world
+        if gw and gw.boss and gw.boss.alive_flag:
+            _legacy_boss(gw.boss, self.game_canvas)
+        if gw:
+            gw.particles.draw(self.game_canvas)
+            for effect in gw.effects:
+                effect.draw(self.game_canvas)
+
+
+def _enemy_wave(game, r):
+    _quiet_world(game, num_players=3)
+    for player in game.players:
+        player.hit_invuln = 0
+        player.has_shield = True
+        player.lives = 2
+    kinds = (Fighter, Striker, Drone)
+
+    def refill():
+        for player in game.players:
+            player.hit_invuln = math.inf
+            player.damage_indicator = 1.0
+        while len(game.enemies) < 30:
+            kind = r.choice(kinds)
+            game.enemies.add(kind(r.randint(game.GAME_WIDTH // 2, game.GAME_WIDTH - 40),
+                                  r.randint(40, game.GAME_HEIGHT - 40), game))
+    return refill
+
+
+CASES = [("enemy_wave_30", _enemy_wave)] + [(name, SCENES[name]) for name in BENCH_SCENES]
+
+
+def run(build, frames, legacy):
+    Rock.sprites = None
+    rng.seed_all(1)
+    game = Game(headless=True)
+    game.delta_time = TICK_DT
+    refill = build(game, random.Random(1))
+    canvas = CountingCanvas(game.screen)
+    game.game_canvas = canvas
+    undo = count_draw_calls(canvas)
+    render = legacy_render.__get__(game) if legacy else game.render
+    calls, times = 0, []
+    try:
+        for _ in range(frames):
+            refill()
+            game.update()
+            canvas.calls = 0
+            start = time.perf_counter()
+            render()
+            times.append(time.perf_counter() - start)
+            calls += canvas.calls
+    finally:
+        undo()
+    return calls / frames, statistics.median(times) * 1000.0
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    for name, build in CASES:
+        old_calls, old_ms = run(build, frames, legacy=True)
+        new_calls, new_ms = run(build, frames, legacy=False)
+        print(f"{name:26s} legacy {old_calls:6.1f} calls/frame {old_ms:5.2f} ms  "
+              f"batched {new_calls:6.1f} calls/frame {new_ms:5.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
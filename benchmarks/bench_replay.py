@@ -0,0 +1,55 @@
+"""Replay a recording headless and uncapped, with the frame profiler on.
+
+Record a session with ``python Game.py --record`` (files land in replays/),
+then replay it as many times as needed; each pass reproduces the same
+frames, so per-phase timings are directly comparable between revisions.
+Run from the repository root:
+
+    python -m benchmarks.bench_replay replays/replay_<stamp>.jsonl.gz [repeats]
+"""
+
+import sys
+import time
+
+from Game import Game
+from engine.profiler import FrameProfiler
+from engine.replay import Replay
+
+# Keep every tick in the rolling stats so they cover the whole replay.
+STATS_WINDOW = 1_000_000
+
+
+def run(path, repeats=1):
+    replay = Replay(path)
+    results = []
+    for _ in range(repeats):
+        game = Game(headless=True,
+                    projectile_engine=replay.header["projectile_engine"])
+        profiler = game.profiler = FrameProfiler(enabled=True, window=STATS_WINDOW)
+
+        def on_tick(g):
+            profiler.end_frame(g._entity_counts())
+            profiler.begin_frame()
+
+        start = time.perf_counter()
+        profiler.begin_frame()
+        ticks = replay.play(game, on_tick=on_tick)
+        elapsed = time.perf_counter() - start
+        results.append((ticks, elapsed, profiler.stats()))
+    return results
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    for i, (ticks, elapsed, stats) in enumerate(run(sys.argv[1], repeats)):
+        print(f"pass {i + 1}: {ticks} ticks in {elapsed:.2f} s "
+              f"({ticks / elapsed:.0f} ticks/s)")
+    print(f"{'phase':<24} {'avg ms':>8} {'p95 ms':>8}")
+    for name, avg, p95 in stats:
+        print(f"{name:<24} {avg:>8.3f} {p95:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Startup cost of Game(): the old per-sample swing synthesis vs NumPy + disk cache.
+
+Times the three spread-weapon swing sounds rendered by ``legacy_synth_swing``
+(a verbatim copy of the pre-NumPy per-sample loop, kept as the "before"
+reference), by engine.synth with an empty cache, and loaded back from the
+cache; then times whole headless ``Game()`` constructions, background
+loading included, with the legacy
+synthesis patched in and with the cached path.  Finally reports
+time-to-first-frame: from ``Game()`` to the first rendered title frame, and
+to the first gameplay frame when a run starts straight away, both with the
+background loader drained before the first frame (the old serial startup)
+and with it left running.  Run from the repository root:
+
+    python -m benchmarks.bench_startup [constructions]
+"""
+
+import array as _array
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import pygame
+
+import Game as game_module
+from Game import Game
+from objects.Rocks import Rock
+
+CONSTRUCTIONS = 10
+VARIANTS = [(0.32, 190, 580, 150), (0.28, 220, 680, 170), (0.36, 160, 500, 130)]
+
+
+def legacy_synth_swing(duration, base_freq, peak_freq, end_freq):
+    mixer_init = pygame.mixer.get_init()
+    if not mixer_init:
+        return None
+    sample_rate, _, channels = mixer_init
+    num_samples = int(sample_rate * duration)
+    buf = _array.array('h')
+    phase = 0.0
+    for i in range(num_samples):
+        t = i / sample_rate
+        p = t / duration
+        if p < 0.22:
+            freq = base_freq + (peak_freq - base_freq) * (p / 0.22)
+        else:
+            freq = peak_freq - (peak_freq - end_freq) * ((p - 0.22) / 0.78)
+        phase += 2 * math.pi * freq / sample_rate
+        tone = (math.sin(phase) * 0.40
+                + math.sin(phase * 2) * 0.18
+                + math.sin(phase * 3) * 0.07
+                + math.sin(phase * 5.02) * 0.04)
+        noise = (random.random() * 2 - 1) * 0.06
+        if p < 0.06:
+            env = p / 0.06
+        elif p > 0.65:
+            env = (1.0 - p) / 0.35
+        else:
+            env = 1.0
+        val = int(max(-1.0, min(1.0, (tone + noise) * env * 0.85)) * 32000)
+        for _ in range(channels):
+            buf.append(val)
+    return pygame.mixer.Sound(buffer=buf)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def time_swings():
+    """(legacy ms, numpy cold ms, cached ms) for all three variants."""
+    legacy = _time(lambda: [legacy_synth_swing(*v) for v in VARIANTS])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = _time(lambda: [Game._synth_swing(*v, cache_dir=cache_dir) for v in VARIANTS])
+        warm = _time(lambda: [Game._synth_swing(*v, cache_dir=cache_dir) for v in VARIANTS])
+    return legacy, cold, warm
+
+
+def time_constructions(n=CONSTRUCTIONS):
+    """Median ms per headless Game() with the legacy and the cached synthesis."""
+    def construct():
+        Rock.sprites = None
+        Game(headless=True).loader.wait_all()
+
+    construct()  # warm the disk cache and imports
+    current = [_time(construct) for _ in range(n)]
+    cached_synth = Game.__dict__["_synth_swing"]
+    Game._synth_swing = staticmethod(legacy_synth_swing)
+    try:
+        legacy = [_time(construct) for _ in range(n)]
+    finally:
+        Game._synth_swing = cached_synth
+    return statistics.median(legacy), statistics.median(current)
+
+
+def time_first_frames(n=CONSTRUCTIONS):
+    """Median (title ms, gameplay ms) for serial and staged startup."""
+    def first_frames(serial):
+        Rock.sprites = None
+        start = time.perf_counter()
+        game = Game(headless=True)
+        if serial:
+            game.loader.wait_all()
+        game.render()
+        title = time.perf_counter() - start
+        game.start_game("endless")
+        game.run_frames(1, render=True)
+        gameplay = time.perf_counter() - start
+        game.loader.wait_all()
+        return title * 1000.0, gameplay * 1000.0
+
+    first_frames(False)
+    results = {}
+    for serial in (True, False):
+        runs = [first_frames(serial) for _ in range(n)]
+        results[serial] = tuple(statistics.median(r[i] for r in runs) for i in range(2))
+    return results[True], results[False]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else CONSTRUCTIONS
+    Game(headless=True)
+    legacy, cold, warm = time_swings()
+    print(f"swing sounds: legacy {legacy:.1f} ms, numpy {cold:.1f} ms, cached {warm:.1f} ms")
+    before, after = time_constructions(n)
+    print(f"Game() startup: {before:.1f} ms before, {after:.1f} ms after "
+          f"(median of {n}, cache in {game_module.SOUND_CACHE_DIR})")
+    serial, staged = time_first_frames(n)
+    print(f"first title frame: {serial[0]:.1f} ms serial, {staged[0]:.1f} ms staged")
+    print(f"first gameplay frame: {serial[1]:.1f} ms serial, {staged[1]:.1f} ms staged")
+
+
+if __name__ == "__main__":
+    main()
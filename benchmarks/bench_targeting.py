@@ -0,0 +1,94 @@
+"""Homing and spread targeting: per-shot linear scans vs the target index.
+
+Scatters enemies and rocks over the playfield, then times one tick of
+target lookups: every live homing missile finding its nearest ship, plus
+three spread-shot volleys picking their five nearest rocks.  ``legacy_*``
+are verbatim copies of the pre-index scans kept as the "before" reference.
+Run from the repository root:
+
+    python -m benchmarks.bench_targeting
+"""
+
+import random
+import time
+
+from Game import Game
+from engine.target_index import TargetIndex
+from objects.Enemy import Fighter
+from objects.Projectile import HOMING_ACQUIRE_RANGE
+from objects.Rocks import Rock, BASIC
+
+CASES = [(10, 15, 20), (30, 45, 40), (60, 45, 80)]  # (enemies, missiles, rocks)
+SPREAD_VOLLEYS = 3
+REPEATS = 200
+
+
+def legacy_homing(game, cx, cy):
+    range_sq = HOMING_ACQUIRE_RANGE ** 2
+    best_dist = float("inf")
+    target = None
+    for e in game.enemies:
+        if not e.alive_flag:
+            continue
+        dx = e.rect.centerx - cx
+        dy = e.rect.centery - cy
+        d = dx * dx + dy * dy
+        if d < best_dist and d <= range_sq:
+            best_dist = d
+            target = e
+    return target
+
+
+def legacy_spread(game, x, y, n):
+    targets = [r for r in game.rocks if r.rect.centerx > x - 50]
+    targets.sort(key=lambda t: (t.rect.centerx - x) ** 2 + (t.rect.centery - y) ** 2)
+    return targets[:n]
+
+
+def _scene(enemies, rocks, seed=1):
+    r = random.Random(seed)
+    game = Game(headless=True)
+    for _ in range(enemies):
+        game.enemies.add(Fighter(r.randint(300, game.GAME_WIDTH), r.randint(40, 560), game))
+    for _ in range(rocks):
+        game.rocks.add(Rock(r.randint(100, game.GAME_WIDTH), r.randint(20, 580), 30, 30,
+                            game, rock_type=BASIC))
+    missiles = [(r.randint(50, 900), r.randint(20, 580)) for _ in range(200)]
+    return game, missiles
+
+
+def time_case(enemies, missiles, rocks):
+    game, spots = _scene(enemies, rocks)
+    spots = spots[:missiles]
+    shooters = spots[:SPREAD_VOLLEYS]
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for cx, cy in spots:
+            legacy_homing(game, cx, cy)
+        for x, y in shooters:
+            legacy_spread(game, x, y, 5)
+    legacy_ms = (time.perf_counter() - start) / REPEATS * 1000.0
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        ships = TargetIndex(e for e in game.enemies if e.alive_flag)
+        rock_index = TargetIndex(game.rocks)
+        for cx, cy in spots:
+            ships.nearest(cx, cy, HOMING_ACQUIRE_RANGE)
+        for x, y in shooters:
+            rock_index.k_nearest(x, y, 5, right_of=x - 50)
+    index_ms = (time.perf_counter() - start) / REPEATS * 1000.0
+    return legacy_ms, index_ms
+
+
+def main():
+    print(f"{'enemies':>7} {'missiles':>8} {'rocks':>5} {'scan ms':>8} {'index ms':>9} {'speedup':>8}")
+    for enemies, missiles, rocks in CASES:
+        legacy_ms, index_ms = time_case(enemies, missiles, rocks)
+        print(f"{enemies:>7} {missiles:>8} {rocks:>5} {legacy_ms:>8.3f} {index_ms:>9.3f} "
+              f"{legacy_ms / index_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
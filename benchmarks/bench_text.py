@@ -0,0 +1,90 @@
+"""HUD-style text: per-string surface cache vs the glyph-atlas renderer.
+
+Draws a frame's worth of changing labels ("Time alive: N s", "Kills: N",
+cooldown counters) for many frames with the values ticking, and reports
+milliseconds per frame plus how many bytes each cache holds at the end.
+``LegacyText`` mirrors the old Game.draw_text_sized / get_font pair (SysFont
+lookup, unbounded dict of rendered strings) as the "before" reference.
+Also times the first font lookup for each size.  Run from the repository
+root:
+
+    python -m benchmarks.bench_text
+"""
+
+import time
+
+import pygame
+
+from engine.text import TextRenderer
+
+FRAMES = 600
+SIZES = (14, 20, 26, 30, 34, 48)
+
+
+class LegacyText:
+    def __init__(self):
+        self._fonts = {}
+        self._cache = {}
+
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont("comicsans", size)
+            self._fonts[size] = font
+        return font
+
+    def draw(self, surface, text, color, pos, size):
+        key = (text, color, size)
+        surf = self._cache.get(key)
+        if surf is None:
+            surf = self.font(size).render(text, True, color)
+            self._cache[key] = surf
+        surface.blit(surf, surf.get_rect(center=pos))
+
+    def cache_bytes(self):
+        return sum(s.get_width() * s.get_height() * s.get_bytesize()
+                   for s in self._cache.values())
+
+
+def _frame_labels(i):
+    yield f"Time alive: {i // 6} s", (255, 255, 255), (200, 20), 30
+    yield f"Kills: {i // 4}", (255, 255, 255), (200, 60), 30
+    yield f"Asteroids: {i // 9}", (255, 220, 60), (200, 100), 30
+    for slot in range(3):
+        yield f"{(FRAMES - i + 37 * slot) % 50 / 10:.1f}", (255, 255, 255), (60 + 50 * slot, 140), 16
+
+
+def time_renderer(draw, frames=FRAMES):
+    canvas = pygame.Surface((1280, 600))
+    start = time.perf_counter()
+    for i in range(frames):
+        for text, color, pos, size in _frame_labels(i):
+            draw(canvas, text, color, pos, size)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def time_font_loads(make_font):
+    start = time.perf_counter()
+    for size in SIZES:
+        make_font(size)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    pygame.init()
+    legacy_fonts = time_font_loads(LegacyText().font)
+    atlas_fonts = time_font_loads(TextRenderer().font)
+    print(f"first lookup of {len(SIZES)} font sizes: SysFont {legacy_fonts:.1f} ms, "
+          f"bundled {atlas_fonts:.1f} ms")
+
+    legacy = LegacyText()
+    renderer = TextRenderer()
+    legacy_ms = time_renderer(legacy.draw)
+    atlas_ms = time_renderer(renderer.draw)
+    print(f"{'renderer':<10} {'ms/frame':>9} {'cache KiB':>10}")
+    print(f"{'legacy':<10} {legacy_ms:>9.3f} {legacy.cache_bytes() / 1024:>10.0f}")
+    print(f"{'atlas':<10} {atlas_ms:>9.3f} {renderer.stats()['bytes'] / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""Standard benchmark scenes and constructor microbenchmarks, with baselines.
+
+Each scene builds a fixed, seeded situation in a headless endless game with
+regular spawning switched off, keeps its population topped up between
+frames (outside the timed region), and records the median milliseconds of
+``Game.update`` and ``Game.render`` per frame, best of ROUNDS fresh runs.  The microbenchmarks time
+the constructors that run in bursts during play.  Run from the repository
+root:
+
+    python -m benchmarks.suite run [--frames N] [--out results.json]
+    python -m benchmarks.suite compare results.json [--baseline FILE] [--threshold 0.15]
+    python -m benchmarks.suite run --out benchmarks/baseline.json   # refresh the baseline
+
+``compare`` prints every metric next to the baseline and exits non-zero if
+any got slower by more than the threshold (and by more than MIN_DELTA_MS).
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from Game import Game, TICK_DT
+from engine import rng
+from objects.Boss import Boss, BossProjectile
+from objects.Enemy import EnemyProjectile
+from objects.Pickup import ShieldPickup, UpgradePickup
+from objects.Projectile import Projectile
+from objects.Rocks import Rock, BASIC, CLUSTER, IRON, BLACKHOLE
+from objects.Weapon import SECONDARY_WEAPONS
+
+FRAMES = 240
+WARMUP_FRAMES = 10
+ROUNDS = 3
+SEED = 1
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.15
+# Differences below this are timer noise, whatever the ratio says.
+MIN_DELTA_MS = 0.02
+MICRO_REPEATS = 5
+MICRO_NUMBER = 50
+
+
+# ---- scenes ----
+
+def _quiet_world(game, num_players=1):
+    world = game.start_game("endless", num_players=num_players)
+    world.rock_spawn_interval = math.inf
+    world.enemy_spawn_interval = math.inf
+    world._enemies_started = True
+    world.next_boss_time = math.inf
+    for player in game.players:
+        player.hit_invuln = math.inf
+    return world
+
+
+def _random_shot(game, r):
+    x, y = r.randint(0, game.GAME_WIDTH // 2), r.randint(20, game.GAME_HEIGHT - 20)
+    kind = r.random()
+    if kind < 0.6:
+        return Projectile("crimson", x, y, game, dx=8, dy=r.choice((-1, 0, 1)))
+    if kind < 0.85:
+        a = r.uniform(-0.6, 0.6)
+        return Projectile("orchid", x, y, game, dx=8 * math.cos(a), dy=8 * math.sin(a),
+                          pulse=True, width=24, height=24)
+    return Projectile("lime", x, y, game, dx=7, wave=(20, 0.15, r.uniform(0, math.pi)))
+
+
+def _top_up_shots(game, r, count):
+    missing = count - len(game.projectiles)
+    if missing > 0:
+        game.projectiles.add(*[_random_shot(game, r) for _ in range(missing)])
+
+
+def _projectiles_scene(count):
+    def build(game, r):
+        _quiet_world(game)
+        return lambda: _top_up_shots(game, r, count)
+    return build
+
+
+def _mixed_rocks(game, r):
+    _quiet_world(game)
+    types = (BASIC, BASIC, CLUSTER, IRON)
+
+    def refill():
+        while len(game.rocks) < 30:
+            size = r.randint(25, 70)
+            game.rocks.add(Rock(r.randint(game.GAME_WIDTH // 3, game.GAME_WIDTH + 40),
+                                r.randint(20, game.GAME_HEIGHT - 20), size, size, game,
+                                rock_type=r.choice(types)))
+    return refill
+
+
+def _black_holes(game, r):
+    """Two stationary black holes bending a stream of 100 shots."""
+    _quiet_world(game)
+    for x, y in ((game.GAME_WIDTH * 0.45, 200), (game.GAME_WIDTH * 0.8, 420)):
+        game.rocks.add(Rock(x, y, 16, 16, game, rock_type=BLACKHOLE, dx=0, dy=0))
+    game.players[0].position_x = 20
+    return lambda: _top_up_shots(game, r, 100)
+
+
+def _boss_tier4(game, r):
+    world = _quiet_world(game)
+    boss = Boss(game, attack_level=4, hp_override=10**6)
+    boss.entering = False
+    boss.rect.x = boss.park_x
+    world.boss = boss
+    world.boss_phase = True
+
+    def refill():
+        if len(boss.boss_projectiles) < 150:
+            boss._attack_spiral_storm()
+            boss._attack_ring_pulse()
+    return refill
+
+
+def _three_players_armed(game, r):
+    _quiet_world(game, num_players=3)
+    for i, player in enumerate(game.players):
+        player.primary.level = player.primary.max_level
+        for weapon_cls in SECONDARY_WEAPONS:
+            player.set_secondary(weapon_cls)
+            while player.upgrade_secondary():
+                pass
+        actions = game.player_actions[i]
+        actions["space"] = True
+        actions["secondary"] = True
+    return lambda: None
+
+
+def _pickup_field(game, r):
+    _quiet_world(game)
+
+    def refill():
+        while len(game.pickups) < 40:
+            x = r.randint(game.GAME_WIDTH // 4, game.GAME_WIDTH)
+            y = r.randint(30, game.GAME_HEIGHT - 30)
+            if r.random() < 0.3:
+                game.pickups.add(ShieldPickup(x, y, game))
+            else:
+                game.pickups.add(UpgradePickup(x, y, r.choice([None] + SECONDARY_WEAPONS), game))
+    return refill
+
+
+SCENES = {
+    "projectiles_50": _projectiles_scene(50),
+    "projectiles_200": _projectiles_scene(200),
+    "projectiles_1000": _projectiles_scene(1000),
+    "rocks_30_mixed": _mixed_rocks,
+    "black_holes_2": _black_holes,
+    "boss_tier4_spiral_ring": _boss_tier4,
+    "players_3_all_secondaries": _three_players_armed,
+    "pickups_40": _pickup_field,
+}
+
+
+def _time_scene(build, frames, seed):
+    Rock.sprites = None
+    rng.seed_all(seed)
+    game = Game(headless=True)
+    # game.update() steps by delta_time, which stays 0 until a frame sets it.
+    game.delta_time = TICK_DT
+    refill = build(game, random.Random(seed))
+    updates, renders = [], []
+    for i in range(WARMUP_FRAMES + frames):
+        refill()
+        t0 = time.perf_counter()
+        game.update()
+        t1 = time.perf_counter()
+        game.render()
+        t2 = time.perf_counter()
+        if i >= WARMUP_FRAMES:
+            updates.append(t1 - t0)
+            renders.append(t2 - t1)
+    return statistics.median(updates) * 1000.0, statistics.median(renders) * 1000.0
+
+
+def run_scene(build, frames=FRAMES, seed=SEED, rounds=ROUNDS):
+    timings = [_time_scene(build, frames, seed) for _ in range(rounds)]
+    return {
+        "update_ms": min(t[0] for t in timings),
+        "render_ms": min(t[1] for t in timings),
+    }
+
+
+# ---- constructor microbenchmarks ----
+
+def _micro_cases(game):
+    player = game.players[0]
+    # Measure _build_sprites with a secondary equipped, so it also composites
+    # the cannon module into every animation frame, as in most of a run.
+    player.set_secondary(SECONDARY_WEAPONS[0])
+    cases = {}
+    for rock_type in (BASIC, CLUSTER, IRON, BLACKHOLE):
+        cases[f"Rock[{rock_type}]"] = (
+            lambda t=rock_type: Rock(600, 300, 45, 45, game, rock_type=t))
+    kinds = {
+        "bullet": {},
+        "pulse": {"pulse": True, "width": 24, "height": 24},
+        "beam": {"piercing": True, "width": 40, "height": 6},
+        "missile": {"homing": True, "width": 22, "height": 10},
+        "fullbeam": {"fullbeam": True, "width": 1100, "height": 14},
+    }
+    for kind, kwargs in kinds.items():
+        cases[f"Projectile[{kind}]"] = (
+            lambda kw=kwargs: Projectile("crimson", 200, 300, game, **kw))
+    cases["EnemyProjectile"] = lambda: EnemyProjectile(900, 300, -5, 0, game)
+    cases["BossProjectile"] = lambda: BossProjectile(900, 300, -3, 1, game)
+    cases["Player._build_sprites"] = player._build_sprites
+    return cases
+
+
+def run_micro(number=MICRO_NUMBER, repeats=MICRO_REPEATS, seed=SEED):
+    Rock.sprites = None
+    rng.seed_all(seed)
+    game = Game(headless=True)
+    results = {}
+    for name, fn in _micro_cases(game).items():
+        fn()  # warm shared caches so the steady-state cost is measured
+        best = math.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"us": best / number * 1e6}
+    return results
+
+
+# ---- results / baselines ----
+
+def run(frames=FRAMES, scenes=None):
+    names = scenes or list(SCENES)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "frames": frames,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenes": {name: run_scene(SCENES[name], frames) for name in names},
+        "micro": run_micro(),
+    }
+
+
+def _metrics(results):
+    for section in ("scenes", "micro"):
+        for name, values in results.get(section, {}).items():
+            for metric, value in values.items():
+                yield f"{section}.{name}.{metric}", value
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """[(metric, baseline, current, ratio, regressed)] for metrics in both."""
+    base = dict(_metrics(baseline))
+    rows = []
+    for key, value in _metrics(results):
+        if key not in base:
+            continue
+        old = base[key]
+        ratio = value / old if old else math.inf
+        delta_ms = value - old if not key.endswith(".us") else (value - old) / 1000.0
+        regressed = ratio > 1 + threshold and delta_ms > MIN_DELTA_MS
+        rows.append((key, old, value, ratio, regressed))
+    return rows
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run")
+    run_p.add_argument("--frames", type=int, default=FRAMES)
+    run_p.add_argument("--out", default="bench_results.json")
+    run_p.add_argument("--scene", action="append", choices=list(SCENES))
+    cmp_p = sub.add_parser("compare")
+    cmp_p.add_argument("results")
+    cmp_p.add_argument("--baseline", default=BASELINE_PATH)
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.frames, args.scene)
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        for key, value in _metrics(results):
+            print(f"{key:<52} {value:>10.3f}")
+        print(f"wrote {args.out}")
+        return 0
+
+    rows = compare(_load(args.results), _load(args.baseline), args.threshold)
+    print(f"{'metric':<52} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for key, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{key:<52} {old:>10.3f} {new:>10.3f} {ratio:>6.2f}x{flag}")
+    regressions = sum(r[4] for r in rows)
+    print(f"{regressions} regression(s) over {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Central registry of the images and music tracks loaded from disk.
+
+Every asset is declared once by name with its path under assets/ and how to
+prepare it (alpha conversion, scaling).  ``prewarm`` loads a set of them up
+front: images are converted for the display and music files are read into
+memory as bytes.  (The game's own tracks only take their paths from here;
+engine.music decodes them.)  ``get`` still
+loads on demand, but if that happens while ``in_gameplay()`` is true the
+load is recorded in ``hitches`` and reported as an AssetHitchWarning, so a
+missing prewarm shows up in tests and profiling runs instead of as a
+dropped frame.
+
+``decode`` does only the disk read and decode, never touching the display,
+so a background loader (engine.loader) can call it from its own thread; the
+next ``get`` or ``prewarm`` then just converts the decoded surface.
+"""
+
+import os
+import threading
+import time
+import warnings
+
+import pygame
+
+
+class AssetHitchWarning(RuntimeWarning):
+    """A declared asset was loaded from disk during gameplay."""
+
+
+class AssetRegistry:
+    def __init__(self, assets_dir, in_gameplay=lambda: False):
+        self.assets_dir = assets_dir
+        self.in_gameplay = in_gameplay
+        self._specs = {}
+        self._loaded = {}
+        self._decoded = {}
+        self._lock = threading.Lock()
+        self.hitches = []
+
+    # ---- declarations ----
+
+    def image(self, name, path, alpha=True, size=None):
+        self._specs[name] = ("image", path, {"alpha": alpha, "size": size})
+
+    def music(self, name, path):
+        self._specs[name] = ("music", path, {})
+
+    def names(self, kind=None):
+        return [n for n, spec in self._specs.items() if kind is None or spec[0] == kind]
+
+    def path(self, name):
+        return os.path.join(self.assets_dir, self._specs[name][1])
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    # ---- loading ----
+
+    def _read(self, name):
+        if self._specs[name][0] == "music":
+            with open(self.path(name), "rb") as f:
+                return f.read()
+        return pygame.image.load(self.path(name))
+
+    def _prepare(self, name, raw):
+        kind, _, opts = self._specs[name]
+        if kind == "music":
+            return raw
+        image = raw.convert_alpha() if opts["alpha"] else raw.convert()
+        if opts["size"]:
+            image = pygame.transform.scale(image, opts["size"])
+        return image
+
+    def _load(self, name):
+        with self._lock:
+            raw = self._decoded.pop(name, None)
+        if raw is None:
+            raw = self._read(name)
+        return self._prepare(name, raw)
+
+    def decode(self, name):
+        """Read name from disk if it exists; safe off the main thread."""
+        with self._lock:
+            if name in self._loaded or name in self._decoded:
+                return
+        if not self.exists(name):
+            return
+        raw = self._read(name)
+        with self._lock:
+            if name not in self._loaded:
+                self._decoded[name] = raw
+
+    def get(self, name):
+        """The prepared asset, loading it now if it was not prewarmed."""
+        value = self._loaded.get(name)
+        if value is None:
+            start = time.perf_counter()
+            from_disk = name not in self._decoded
+            value = self._loaded[name] = self._load(name)
+            if from_disk and self.in_gameplay():
+                ms = (time.perf_counter() - start) * 1000.0
+                self.hitches.append((name, ms))
+                warnings.warn(f"asset {name!r} loaded during gameplay ({ms:.1f} ms)",
+                              AssetHitchWarning, stacklevel=2)
+        return value
+
+    def prewarm(self, names=None):
+        """Load every named (default: every declared) asset that exists on disk."""
+        for name in self.names() if names is None else names:
+            if name not in self._loaded and self.exists(name):
+                self._loaded[name] = self._load(name)
@@ -0,0 +1,119 @@
+"""Sound effect voices with a fixed channel budget per category.
+
+Each category owns its own range of mixer channels (reserved, so nothing
+else allocates them), and a burst of gunfire can never take the channel an
+explosion or a death sting needs.  Requests with the same key within one
+frame are coalesced into a single voice: three players firing on the same
+tick play one shot, not three.  When every channel of a category is busy a
+new voice replaces the lowest-priority one playing there, the oldest among
+equals, provided its own priority is at least as high; otherwise it is
+dropped.
+
+``counts`` holds this frame's requested / played / coalesced / stolen /
+dropped counters, ``last_frame`` the previous frame's and ``totals`` the
+whole run's.
+"""
+
+import random
+
+import pygame
+
+PRIORITY_BACKGROUND, PRIORITY_NORMAL, PRIORITY_HIGH = 0, 1, 2
+
+CATEGORY_CHANNELS = {
+    "shoot": 3,
+    "weapon": 4,
+    "explosion": 4,
+    "ui": 2,
+    "death": 3,
+}
+COUNTERS = ("requested", "played", "coalesced", "stolen", "dropped")
+
+
+def reserve_channels(n):
+    """Make sure the mixer has at least n channels, all reserved."""
+    if pygame.mixer.get_num_channels() < n:
+        pygame.mixer.set_num_channels(n)
+        pygame.mixer.set_reserved(n)
+
+
+class VoiceManager:
+    def __init__(self, frame=lambda: 0, budgets=CATEGORY_CHANNELS):
+        self.frame = frame
+        self._channels = {}
+        first = 0
+        for category, n in budgets.items():
+            self._channels[category] = range(first, first + n)
+            first += n
+        self.num_channels = first
+        self._voices = {}
+        self._serial = 0
+        self._frame_id = None
+        self._frame_keys = set()
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.last_frame = dict.fromkeys(COUNTERS, 0)
+        self.totals = dict.fromkeys(COUNTERS, 0)
+
+    def _roll(self):
+        frame = self.frame()
+        if frame != self._frame_id:
+            self._frame_id = frame
+            self.last_frame = self.counts
+            self.counts = dict.fromkeys(COUNTERS, 0)
+            self._frame_keys.clear()
+
+    def _count(self, name):
+        self.counts[name] += 1
+        self.totals[name] += 1
+
+    def frame_counts(self):
+        """Counters for the current frame."""
+        self._roll()
+        return self.counts
+
+    def _claim_channel(self, category, priority):
+        reserve_channels(self.num_channels)
+        victim = None
+        for idx in self._channels[category]:
+            channel = pygame.mixer.Channel(idx)
+            if not channel.get_busy():
+                return idx, channel
+            voice = self._voices.get(idx, (PRIORITY_BACKGROUND, 0))
+            if victim is None or voice < victim[0]:
+                victim = (voice, idx)
+        if victim[0][0] > priority:
+            return None, None
+        self._count("stolen")
+        return victim[1], pygame.mixer.Channel(victim[1])
+
+    def play(self, key, sounds, category, priority=PRIORITY_NORMAL, volume=1.0):
+        """Play one of sounds, picked at random, as key; returns the Channel.
+
+        Returns None when key already played this frame, there is nothing to
+        play, or the category is full of higher-priority voices.
+        """
+        self._roll()
+        self._count("requested")
+        if key in self._frame_keys:
+            self._count("coalesced")
+            return None
+        self._frame_keys.add(key)
+        if not sounds or not pygame.mixer.get_init():
+            return None
+        idx, channel = self._claim_channel(category, priority)
+        if channel is None:
+            self._count("dropped")
+            return None
+        self._serial += 1
+        self._voices[idx] = (priority, self._serial)
+        channel.set_volume(volume)
+        channel.play(sounds[0] if len(sounds) == 1 else random.choice(sounds))
+        self._count("played")
+        return channel
+
+    def stop(self):
+        """Silence every voice; channels outside the budgets are left alone."""
+        if pygame.mixer.get_init():
+            for idx in range(min(self.num_channels, pygame.mixer.get_num_channels())):
+                pygame.mixer.Channel(idx).stop()
+        self._voices.clear()
@@ -0,0 +1,111 @@
+"""Per-layer blit batches for Game.render.
+
+Game.render collects everything a draw layer shows as ``(surface, dest)``
+or ``(surface, dest, area)`` entries into that layer's BlitLayer, then
+submits the layer with a single ``Surface.blits`` call.  A layer's entry
+list is kept from frame to frame and only ever grows, so collecting
+overwrites last frame's slots instead of building a new list.  Layers are
+submitted in LAYERS order, which is the stacking order: health bars, damage
+hearts and other per-entity overlays go to "overlays", above every sprite.
+
+Entities describe themselves with ``collect(sprites, overlays)``: any two
+objects with ``append`` and ``extend`` (BlitLayers or plain lists).  Their
+``draw`` methods collect into one list and blit that, so drawing a single
+entity still works anywhere.
+
+Filled rectangles are blitted from shared one-color surfaces (``solid``)
+rather than drawn with ``pygame.draw.rect``, so they batch like sprites.
+"""
+
+from itertools import islice
+
+import pygame
+
+LAYERS = ("rocks", "pickups", "projectiles", "enemy_projectiles", "enemies",
+          "players", "boss", "particles", "overlays")
+
+_solids = {}
+
+
+def solid(color, size):
+    """A shared opaque surface of size filled with color; never draw onto it."""
+    key = (color, size)
+    surf = _solids.get(key)
+    if surf is None:
+        surf = _solids[key] = pygame.Surface(size)
+        surf.fill(color)
+    return surf
+
+
+def health_bar(x, y, width, height, fill_w, fill, frame, back=None):
+    """Blit entries for a bar at (x, y) with a 1px frame, filled fill_w wide."""
+    entries = [(solid(frame, (width + 2, height + 2)), (x - 1, y - 1))]
+    if back is not None:
+        entries.append((solid(back, (width, height)), (x, y)))
+    if fill_w > 0:
+        entries.append((solid(fill, (width, height)), (x, y), (0, 0, fill_w, height)))
+    return entries
+
+
+def collect_group(group, sink):
+    """Entries for every sprite of group, in Group.draw order."""
+    collect = getattr(group, "collect", None)
+    if collect is not None:
+        collect(sink)
+    else:
+        sink.extend([(sprite.image, sprite.rect) for sprite in group])
+
+
+class BlitLayer:
+    def __init__(self, capacity=64):
+        self._items = [None] * capacity
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, entry):
+        size = self._size
+        if size < len(self._items):
+            self._items[size] = entry
+        else:
+            self._items.append(entry)
+        self._size = size + 1
+
+    def extend(self, entries):
+        if not isinstance(entries, list):
+            entries = list(entries)
+        size = self._size
+        # Grows the list only when the slice runs past its end.
+        self._items[size:size + len(entries)] = entries
+        self._size = size + len(entries)
+
+    def flush(self, surface):
+        """Blit every entry in one call and empty the layer; True if it blitted."""
+        size = self._size
+        if not size:
+            return False
+        items = self._items
+        surface.blits(items if size == len(items) else islice(items, size), False)
+        self._size = 0
+        return True
+
+
+class RenderBatch:
+    def __init__(self, layers=LAYERS):
+        self.layers = {name: BlitLayer() for name in layers}
+        self.calls = 0
+        self.entries = 0
+
+    def __getitem__(self, name):
+        return self.layers[name]
+
+    def begin(self):
+        """Reset the per-frame counters."""
+        self.calls = 0
+        self.entries = 0
+
+    def flush(self, surface, name):
+        layer = self.layers[name]
+        self.entries += len(layer)
+        self.calls += layer.flush(surface)
@@ -0,0 +1,189 @@
+"""Dirty-rectangle presentation: redraw and push only what changed.
+
+With ``Game(dirty_rects=True)`` everything is drawn onto a TrackingSurface,
+an offscreen canvas that records the area of every blit, blits and fill
+made on it.  Drawing straight onto the canvas with ``pygame.draw`` bypasses
+that, so those call sites pass the returned rect to ``mark``.
+
+Each frame DirtyRenderer ``restore``s the background only under what was
+drawn the frame before, the state draws as usual, and ``present`` copies
+the union of last frame's and this frame's areas to the display with
+``pygame.display.update(rects)``.  Recorded rects are snapped to a grid of
+TILE-pixel tiles and merged into horizontal runs, so a few hundred sparks
+still make a short rect list.  When more than ``threshold`` of the screen is dirty the
+whole canvas is pushed with a single flip instead.
+
+``begin`` lets a state skip the frame altogether: a state whose
+``dirty_key()`` is unchanged since the last drawn frame is not redrawn or
+presented.  A new top state or a changed key redraws the whole screen;
+states returning None (the default, and Game_World) are redrawn every
+frame and presented incrementally.
+"""
+
+from itertools import chain
+
+import numpy as np
+import pygame
+
+DIRTY_THRESHOLD = 0.5
+TILE = 32
+
+
+class TrackingSurface(pygame.Surface):
+    def __init__(self, size, like=None):
+        if like is not None:
+            super().__init__(size, 0, like)
+        else:
+            super().__init__(size)
+        self.rects = []
+        self.tracking = True
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        if self.tracking:
+            self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = super().blits(blit_sequence, True)
+        if self.tracking:
+            self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = super().fill(color, rect, special_flags)
+        if self.tracking:
+            self.rects.append(rect)
+        return rect
+
+    def take(self):
+        """Hand over the rects recorded since the last call."""
+        rects, self.rects = self.rects, []
+        return rects
+
+
+def mark(surface, rect):
+    """Record rect as drawn when surface is a TrackingSurface."""
+    if isinstance(surface, TrackingSurface) and surface.tracking:
+        surface.rects.append(rect.clip(surface.get_clip()))
+
+
+class DirtyRenderer:
+    def __init__(self, screen, threshold=DIRTY_THRESHOLD, tile=TILE):
+        self.screen = screen
+        self.threshold = threshold
+        self.tile = tile
+        w, h = screen.get_size()
+        self.canvas = TrackingSurface((w, h), screen)
+        self._bounds = pygame.Rect(0, 0, w, h)
+        self._shape = (-(-h // tile), -(-w // tile))
+        self._drawn = np.zeros(self._shape, dtype=bool)
+        self._restore = None
+        self._full = True
+        self._state = None
+        self._key = None
+        self.frames = 0
+        self.full_frames = 0
+        self.skipped_frames = 0
+        self.pixels = 0
+        self.last_fraction = 1.0
+
+    def invalidate(self):
+        """Redraw and push the whole screen on the next frame."""
+        self._full = True
+
+    def begin(self, state, key):
+        """Whether state has to be drawn this frame (see the module doc)."""
+        if state is not self._state or key is None or key != self._key:
+            if state is not self._state or key is not None:
+                self.invalidate()
+            self._state = state
+            self._key = key
+            return True
+        self.skipped_frames += 1
+        return False
+
+    def restore(self, background):
+        """Put background back under everything drawn last frame."""
+        canvas = self.canvas
+        canvas.tracking = False
+        if self._full or self._restore is None:
+            canvas.blit(background, (0, 0))
+        else:
+            canvas.blits([(background, r, r) for r in self._restore], False)
+        canvas.tracking = True
+
+    def _grid(self, rects):
+        """Tiles touched by rects, marked through a 2D difference array."""
+        rows, cols = self._shape
+        t = self.tile
+        a = np.fromiter(chain.from_iterable(rects), np.int32, count=4 * len(rects))
+        a = a.reshape(-1, 4)
+        a = a[(a[:, 2] > 0) & (a[:, 3] > 0)]
+        x0, y0 = a[:, 0] // t, a[:, 1] // t
+        x1 = (a[:, 0] + a[:, 2] + t - 1) // t
+        y1 = (a[:, 1] + a[:, 3] + t - 1) // t
+        stride = cols + 1
+        corners = np.concatenate((y0 * stride + x0, y0 * stride + x1,
+                                  y1 * stride + x0, y1 * stride + x1))
+        weights = np.repeat(np.array([1, -1, -1, 1], dtype=np.int32), len(a))
+        diff = np.bincount(corners, weights, minlength=(rows + 1) * stride)
+        covered = diff.reshape(rows + 1, stride).cumsum(0).cumsum(1)
+        return covered[:rows, :cols] > 0
+
+    def _runs(self, grid):
+        """One rect per horizontal run of marked tiles, clipped to the screen."""
+        t = self.tile
+        padded = np.zeros((grid.shape[0], grid.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = grid
+        edges = np.diff(padded, axis=1)
+        rows, first = np.nonzero(edges == 1)
+        last = np.nonzero(edges == -1)[1]
+        width, height = self._bounds.size
+        x = first * t
+        y = rows * t
+        w = np.minimum(last * t, width) - x
+        h = np.minimum(y + t, height) - y
+        return [pygame.Rect(*r) for r in zip(x.tolist(), y.tolist(), w.tolist(), h.tolist())]
+
+    def present(self, flip=True):
+        """Push this frame to the screen; flip=False skips the display call."""
+        drawn = self._grid(self.canvas.take())
+        screen_area = self._bounds.width * self._bounds.height
+        rects = None
+        if not self._full:
+            changed = drawn | self._drawn
+            area = min(screen_area, int(changed.sum()) * self.tile * self.tile)
+            if area <= self.threshold * screen_area:
+                rects = self._runs(changed)
+        # Last frame's areas are already background again where nothing was
+        # drawn this time, so the pushed rects also serve as next frame's
+        # restore list; after a full frame the whole background goes back.
+        self._restore = rects
+        self._drawn = drawn
+        self._full = False
+        self.frames += 1
+        if rects is None:
+            self.full_frames += 1
+            self.pixels += screen_area
+            self.last_fraction = 1.0
+            self.screen.blit(self.canvas, (0, 0))
+            if flip:
+                pygame.display.flip()
+            return
+        self.pixels += area
+        self.last_fraction = area / screen_area
+        if rects:
+            self.screen.blits([(self.canvas, r, r) for r in rects], False)
+            if flip:
+                pygame.display.update(rects)
+
+    def stats(self):
+        screen_area = self._bounds.width * self._bounds.height
+        rendered = max(1, self.frames + self.skipped_frames)
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "skipped_frames": self.skipped_frames,
+            "pixels_per_frame": self.pixels / rendered / screen_area,
+        }
@@ -0,0 +1,104 @@
+"""Render-time interpolation between the last two simulation ticks.
+
+The simulation advances in fixed ticks, so at render time the real clock
+usually sits part-way between the previous tick and the current one.
+``snapshot`` records where every drawable was just before the last tick of
+a frame; ``apply`` then moves each rect (and each player's position) to the
+blend of the two states for the duration of the draw, and ``restore`` puts
+the simulated values back before the next tick runs.
+
+Entities created during the last tick have no previous state and are drawn
+where they are; anything that jumped further than ``MAX_LERP_DISTANCE`` in a
+single tick (respawns, teleports) is not blended either.
+
+Array-backed drawables (the boss's BulletField, the spark ParticleSystem and
+the BossLaser streams) have no rects to move.  They keep their own previous
+positions, copied by their ``snapshot``, and blend them in ``collect`` by
+their ``render_alpha``, which ``apply`` sets and ``restore`` puts back to 1.
+"""
+
+MAX_LERP_DISTANCE = 96
+
+
+class Interpolator:
+    def __init__(self, game):
+        self.game = game
+        self._rects = {}
+        self._players = {}
+        self._arrays = []
+
+    def clear(self):
+        self._rects.clear()
+        self._players.clear()
+        self._arrays = []
+
+    def _sprites(self):
+        game = self.game
+        yield from game.rocks
+        yield from game.pickups
+        yield from game.projectiles
+        yield from game.enemy_projectiles
+        yield from game.enemies
+        gw = game.active_game_world
+        if gw is not None and gw.boss is not None:
+            yield gw.boss
+            yield from gw.boss.boss_projectiles
+
+    def _array_drawables(self):
+        gw = self.game.active_game_world
+        if gw is None:
+            return
+        yield gw.particles
+        if gw.boss is not None:
+            yield gw.boss.bullets
+            yield from gw.boss.boss_lasers
+
+    def snapshot(self):
+        self._rects = {s: s.rect.topleft for s in self._sprites()}
+        self._players = {p: (p.position_x, p.position_y) for p in self.game.players}
+        self._arrays = list(self._array_drawables())
+        for drawable in self._arrays:
+            drawable.snapshot()
+
+    def apply(self, alpha):
+        """Blend toward the previous tick by (1 - alpha); returns an undo record."""
+        if alpha <= 0.0 or not (self._rects or self._players or self._arrays):
+            return None
+        moved = []
+        beta = 1.0 - alpha
+        limit = MAX_LERP_DISTANCE
+        prev_rects = self._rects
+        for sprite in self._sprites():
+            prev = prev_rects.get(sprite)
+            if prev is None:
+                continue
+            rect = sprite.rect
+            x, y = rect.topleft
+            px, py = prev
+            if (px == x and py == y) or abs(x - px) > limit or abs(y - py) > limit:
+                continue
+            moved.append((rect, x, y))
+            rect.topleft = (round(x - (x - px) * beta), round(y - (y - py) * beta))
+        players = []
+        for player, (px, py) in self._players.items():
+            x, y = player.position_x, player.position_y
+            if abs(x - px) > limit or abs(y - py) > limit:
+                continue
+            players.append((player, x, y))
+            player.position_x = x - (x - px) * beta
+            player.position_y = y - (y - py) * beta
+        for drawable in self._arrays:
+            drawable.render_alpha = alpha
+        return moved, players, self._arrays
+
+    @staticmethod
+    def restore(undo):
+        if undo is None:
+            return
+        moved, players, arrays = undo
+        for rect, x, y in moved:
+            rect.topleft = (x, y)
+        for player, x, y in players:
+            player.position_x, player.position_y = x, y
+        for drawable in arrays:
+            drawable.render_alpha = 1.0
@@ -0,0 +1,138 @@
+"""Cached renderer for the black-hole lensing, vignette and horizon glow.
+
+The effect used to rebuild every surface it touched on every frame.  Here
+the lens radius is quantized to LENS_RADIUS_STEP so the radial masks, the
+vignette and the glow are drawn once per size, and each lens size keeps its
+own scratch buffers that smoothscale writes into in place.
+
+Each blur layer is only computed over the square around its own circle.
+``quality`` scales the intermediate resolution of the blur: 1.0 matches the
+original shrink factors, lower values blur from a smaller copy (cheaper and
+softer).  It is clamped to [MIN_QUALITY, 1.0]: the blur buffers are sized for
+1.0, so nothing sharper fits.  Masking and compositing stay at full resolution.
+"""
+
+import pygame
+
+LENS_RADIUS_STEP = 8
+MIN_LENS_RADIUS = 30
+MIN_QUALITY = 0.05
+
+# (radius divisor, shrink, alpha) for the three blur layers, outermost first.
+LENS_LAYERS = ((1, 0.96, 20), (1.5, 0.91, 45), (3, 0.84, 75))
+
+
+class LensingRenderer:
+    def __init__(self, quality=1.0):
+        self.quality = quality
+        self._masks = {}
+        self._scratch = {}
+        self._vignettes = {}
+        self._glows = {}
+
+    @property
+    def quality(self):
+        return self._quality
+
+    @quality.setter
+    def quality(self, value):
+        self._quality = min(1.0, max(MIN_QUALITY, float(value)))
+
+    def clear(self):
+        self._masks.clear()
+        self._scratch.clear()
+        self._vignettes.clear()
+        self._glows.clear()
+
+    @staticmethod
+    def lens_radius(gravity_radius):
+        r = max(MIN_LENS_RADIUS, int(gravity_radius * 0.55))
+        return -(-r // LENS_RADIUS_STEP) * LENS_RADIUS_STEP
+
+    # ---- cached pieces ----
+
+    def _layer_masks(self, lens_r):
+        """Per layer: (radius, alpha mask sized 2*radius, offset in the box)."""
+        masks = self._masks.get(lens_r)
+        if masks is None:
+            masks = []
+            for div, _, alpha in LENS_LAYERS:
+                radius = int(lens_r / div)
+                mask = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(mask, (255, 255, 255, alpha), (radius, radius), radius)
+                masks.append((radius, mask, lens_r - radius))
+            self._masks[lens_r] = masks
+        return masks
+
+    def _buffers(self, lens_r):
+        """Scratch surfaces for one lens size; callers use subsurfaces."""
+        buf = self._scratch.get(lens_r)
+        if buf is None:
+            size = (lens_r * 2, lens_r * 2)
+            buf = tuple(pygame.Surface(size, pygame.SRCALPHA) for _ in range(3))
+            self._scratch[lens_r] = buf
+        return buf
+
+    def _vignette(self, core_r, vig_r):
+        key = (core_r, vig_r)
+        surf = self._vignettes.get(key)
+        if surf is None:
+            surf = pygame.Surface((vig_r * 2, vig_r * 2), pygame.SRCALPHA)
+            step = max(2, vig_r // 9)
+            for i in range(9, 0, -1):
+                a = min(220, 12 + (9 - i) * 22)
+                pygame.draw.circle(surf, (3, 0, 8, a), (vig_r, vig_r), core_r + i * step)
+            self._vignettes[key] = surf
+        return surf
+
+    def _glow(self, core_r):
+        surf = self._glows.get(core_r)
+        if surf is None:
+            glow_r = core_r + 3
+            gc = glow_r + 3
+            surf = pygame.Surface((glow_r * 2 + 6, glow_r * 2 + 6), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (50, 12, 100, 35), (gc, gc), glow_r + 2)
+            pygame.draw.circle(surf, (90, 25, 160, 60), (gc, gc), glow_r, 1)
+            self._glows[core_r] = surf
+        return surf
+
+    # ---- drawing ----
+
+    def _draw_lens(self, surface, cx, cy, lens_r):
+        box = pygame.Rect(cx - lens_r, cy - lens_r, lens_r * 2, lens_r * 2)
+        visible = box.clip(surface.get_rect())
+        if visible.width <= 8 or visible.height <= 8:
+            return
+        capture_buf, small_buf, layer_buf = self._buffers(lens_r)
+        capture = capture_buf.subsurface((0, 0, visible.width, visible.height))
+        capture.blit(surface, (0, 0), visible)
+
+        quality = self.quality
+        for (radius, mask, offset), (_, shrink, _) in zip(self._layer_masks(lens_r),
+                                                            LENS_LAYERS):
+            # Each layer only matters inside its own circle, so blur just
+            # that square (clipped to the screen) instead of the whole lens.
+            area = pygame.Rect(box.x + offset, box.y + offset, radius * 2, radius * 2)
+            area = area.clip(visible)
+            if area.width < 4 or area.height < 4:
+                continue
+            w, h = area.size
+            src = capture.subsurface(area.move(-visible.x, -visible.y))
+            small_size = (max(4, int(w * shrink * quality)),
+                          max(4, int(h * shrink * quality)))
+            small = small_buf.subsurface((0, 0) + small_size)
+            pygame.transform.smoothscale(src, small_size, small)
+            layer = layer_buf.subsurface((0, 0, w, h))
+            pygame.transform.smoothscale(small, (w, h), layer)
+            mask_area = area.move(-(box.x + offset), -(box.y + offset))
+            layer.blit(mask, (0, 0), mask_area, special_flags=pygame.BLEND_RGBA_MULT)
+            surface.blit(layer, area.topleft)
+
+    def draw(self, surface, cx, cy, core_radius, gravity_radius, growth):
+        self._draw_lens(surface, cx, cy, self.lens_radius(gravity_radius))
+
+        vig_r = core_radius + 22 + int(12 * growth)
+        surface.blit(self._vignette(core_radius, vig_r), (cx - vig_r, cy - vig_r))
+
+        gc = core_radius + 6
+        surface.blit(self._glow(core_radius), (cx - gc, cy - gc))
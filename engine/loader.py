@@ -0,0 +1,119 @@
+"""Startup work run on a background thread, with progress for a loading bar.
+
+Jobs are named callables queued with ``add`` before ``start``; the worker
+runs them one at a time in order.  ``wait_for(name, ...)`` blocks until
+those jobs have finished.  A job the worker has not reached yet (or any job,
+before ``start``) is run right away on the calling thread instead, so a
+caller only ever waits for what it asked for, plus whichever job is already
+in progress.  Jobs added after ``start`` are picked up by the worker, which
+is restarted if it had already run out of work.  An exception raised
+by a job is re-raised from ``wait_for``.
+
+Jobs must not touch the display surface: decode files here and convert
+them on the main thread.
+"""
+
+import threading
+import time
+
+PENDING, RUNNING, DONE = range(3)
+
+
+class BackgroundLoader:
+    def __init__(self):
+        self._jobs = {}
+        self._state = {}
+        self._errors = {}
+        self._cond = threading.Condition()
+        self._started = False
+        self._working = False
+        self.timings = {}
+
+    def add(self, name, fn):
+        with self._cond:
+            self._jobs[name] = fn
+            self._state[name] = PENDING
+            if self._started:
+                self._spawn()
+
+    def __contains__(self, name):
+        return name in self._jobs
+
+    def is_done(self, name):
+        return self._state.get(name) == DONE
+
+    @property
+    def started(self):
+        return self._started
+
+    def start(self):
+        with self._cond:
+            self._started = True
+            self._spawn()
+
+    def _spawn(self):
+        # Called with the lock held.
+        if not self._working:
+            self._working = True
+            threading.Thread(target=self._run, name="asset-loader", daemon=True).start()
+
+    def _claim(self, name):
+        with self._cond:
+            if self._state[name] != PENDING:
+                return False
+            self._state[name] = RUNNING
+            return True
+
+    def _execute(self, name):
+        start = time.perf_counter()
+        error = None
+        try:
+            self._jobs[name]()
+        except Exception as exc:
+            error = exc
+        with self._cond:
+            self.timings[name] = (time.perf_counter() - start) * 1000.0
+            if error is not None:
+                self._errors[name] = error
+            self._state[name] = DONE
+            self._cond.notify_all()
+
+    def _next(self):
+        with self._cond:
+            for name, state in self._state.items():
+                if state == PENDING:
+                    self._state[name] = RUNNING
+                    return name
+            self._working = False
+            return None
+
+    def _run(self):
+        while True:
+            name = self._next()
+            if name is None:
+                return
+            self._execute(name)
+
+    def wait_for(self, *names):
+        for name in names:
+            if self._claim(name):
+                self._execute(name)
+        with self._cond:
+            self._cond.wait_for(lambda: all(self._state[n] == DONE for n in names))
+        for name in names:
+            if name in self._errors:
+                raise self._errors[name]
+
+    def wait_all(self):
+        self.wait_for(*list(self._jobs))
+
+    def progress(self):
+        """Fraction of jobs finished, 1.0 when there are none."""
+        if not self._jobs:
+            return 1.0
+        with self._cond:
+            return sum(s == DONE for s in self._state.values()) / len(self._jobs)
+
+    @property
+    def done(self):
+        return self.progress() >= 1.0
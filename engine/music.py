@@ -0,0 +1,133 @@
+"""Music tracks decoded in the background and crossfaded on two channels.
+
+``preload(name)`` queues a loader job (engine.loader) that decodes the
+track's file into a Sound off the main thread.  ``play(name)`` switches to
+it: the outgoing channel ramps down while the incoming one ramps up, one
+volume step per ``update``.  A track that is not decoded yet is never waited
+for; the switch happens on the first update after its job finishes and the
+current track plays on until then.  Tracks without a file are ignored,
+leaving the current one on.
+
+Each switch records the main-thread time spent starting it, worst case per
+(from, to) pair, in ``stalls``, and the time from request to start in
+``latency``, both in milliseconds.
+"""
+
+import time
+
+import pygame
+
+from engine.audio import reserve_channels
+
+CROSSFADE = 1.5
+
+
+class _Slot:
+    __slots__ = ("volume", "target")
+
+    def __init__(self):
+        self.volume = 0.0
+        self.target = 0.0
+
+
+class MusicManager:
+    def __init__(self, loader, path_for, first_channel, crossfade=CROSSFADE):
+        self.loader = loader
+        self.path_for = path_for
+        self.first_channel = first_channel
+        self.crossfade = crossfade
+        self._tracks = {}
+        self._slots = (_Slot(), _Slot())
+        self._active = 0
+        self._pending = None
+        self.current = None
+        self.stalls = {}
+        self.latency = {}
+
+    def _channel(self, slot):
+        return pygame.mixer.Channel(self.first_channel + slot)
+
+    def preload(self, name):
+        """Start decoding name in the background, if it has a file."""
+        job = f"track_{name}"
+        path = self.path_for(name)
+        if path is not None and job not in self.loader:
+            self.loader.add(job, lambda: self._decode(name, path))
+
+    def _decode(self, name, path):
+        if pygame.mixer.get_init():
+            self._tracks[name] = pygame.mixer.Sound(path)
+
+    def ready(self, name):
+        return name in self._tracks
+
+    def play(self, name, loops=-1, volume=0.8):
+        if self.path_for(name) is None:
+            return
+        self.preload(name)
+        self._pending = (name, loops, volume, time.perf_counter())
+        self._switch()
+
+    def stop(self):
+        """Fade out whatever is playing and forget any pending switch."""
+        self._pending = None
+        self.current = None
+        for slot in self._slots:
+            slot.target = 0.0
+
+    def pause(self):
+        if pygame.mixer.get_init():
+            reserve_channels(self.first_channel + len(self._slots))
+            for i in range(len(self._slots)):
+                self._channel(i).pause()
+
+    def unpause(self):
+        if pygame.mixer.get_init():
+            reserve_channels(self.first_channel + len(self._slots))
+            for i in range(len(self._slots)):
+                self._channel(i).unpause()
+
+    def _switch(self):
+        name, loops, volume, requested = self._pending
+        sound = self._tracks.get(name)
+        if sound is None:
+            if self.loader.is_done(f"track_{name}"):
+                self._pending = None  # failed to decode; keep what is playing
+            return
+        start = time.perf_counter()
+        reserve_channels(self.first_channel + len(self._slots))
+        previous = self.current
+        self._slots[self._active].target = 0.0
+        self._active ^= 1
+        slot = self._slots[self._active]
+        # From silence the track starts at full volume, otherwise it fades in.
+        slot.volume = 0.0 if previous is not None else volume
+        slot.target = volume
+        channel = self._channel(self._active)
+        channel.set_volume(slot.volume)
+        channel.play(sound, loops=loops)
+        self.current = name
+        self._pending = None
+        end = time.perf_counter()
+        key = (previous, name)
+        self.stalls[key] = max(self.stalls.get(key, 0.0), (end - start) * 1000.0)
+        self.latency[key] = (end - requested) * 1000.0
+
+    def update(self, dt):
+        if self._pending is not None:
+            self._switch()
+        step = dt / self.crossfade
+        for i, slot in enumerate(self._slots):
+            if slot.volume == slot.target:
+                continue
+            if slot.volume < slot.target:
+                slot.volume = min(slot.target, slot.volume + step)
+            else:
+                slot.volume = max(slot.target, slot.volume - step)
+            if not pygame.mixer.get_init():
+                continue
+            channel = self._channel(i)
+            if slot.volume <= 0.0:
+                channel.stop()
+            else:
+                channel.set_volume(slot.volume)
@@ -0,0 +1,135 @@
+"""Fixed-capacity spark particle system backed by NumPy arrays.
+
+Every live spark is one row in a set of parallel arrays kept in spawn order,
+so the oldest sparks are always at the front.  ``update`` integrates and
+compacts all rows at once; ``draw`` picks a pre-rendered circle per
+(color, radius) and submits everything in one blits call.  When a burst
+would exceed ``capacity`` the oldest sparks are dropped first, which puts a
+hard ceiling on what explosions can cost per frame.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+PARTICLE_COLORS = (
+    (255, 200, 50), (255, 150, 30), (255, 100, 20),
+    (200, 180, 160), (180, 160, 140),
+)
+MAX_RADIUS = 5
+DEFAULT_CAPACITY = 512
+
+_FIELDS = ("x", "y", "px", "py", "dx", "dy", "age", "lifetime", "size", "color")
+
+
+class ParticleSystem:
+    _sprites = None
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.evicted = 0
+        # Draw-time blend toward px/py, set by engine.interpolation.
+        self.render_alpha = 1.0
+        self.rng = np.random.default_rng(seed)
+        for name in _FIELDS:
+            dtype = np.int64 if name == "color" else np.float64
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    @classmethod
+    def sprite_table(cls):
+        """Flat list of circle sprites indexed by color * (MAX_RADIUS + 1) + radius."""
+        if cls._sprites is None:
+            table = []
+            for color in PARTICLE_COLORS:
+                for radius in range(MAX_RADIUS + 1):
+                    # Padded by one pixel so the circle matches draw.circle
+                    # centred on the particle's integer position.
+                    size = radius * 2 + 2
+                    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                    if radius:
+                        pygame.draw.circle(surf, color, (radius + 1, radius + 1), radius)
+                    table.append(surf)
+            cls._sprites = table
+        return cls._sprites
+
+    def clear(self):
+        self.count = 0
+
+    def _drop_oldest(self, k):
+        n = self.count
+        for name in _FIELDS:
+            arr = getattr(self, name)
+            arr[:n - k] = arr[k:n]
+        self.count = n - k
+        self.evicted += k
+
+    def spawn(self, x, y, count=8):
+        """Burst of sparks flying out of (x, y) in random directions."""
+        count = min(count, self.capacity)
+        overflow = self.count + count - self.capacity
+        if overflow > 0:
+            self._drop_oldest(overflow)
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(60, 220, count)
+        s = slice(self.count, self.count + count)
+        self.x[s] = self.px[s] = x
+        self.y[s] = self.py[s] = y
+        self.dx[s] = np.cos(angle) * speed
+        self.dy[s] = np.sin(angle) * speed
+        self.age[s] = 0.0
+        self.lifetime[s] = rng.uniform(0.25, 0.5, count)
+        self.size[s] = rng.uniform(2, 5, count)
+        self.color[s] = rng.integers(0, len(PARTICLE_COLORS), count)
+        self.count += count
+
+    def snapshot(self):
+        """Remember every spark's position as the previous tick's."""
+        n = self.count
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.dx[:n] * dt
+        self.y[:n] += self.dy[:n] * dt
+        self.age[:n] += dt
+        alive = self.age[:n] < self.lifetime[:n]
+        k = int(np.count_nonzero(alive))
+        if k != n:
+            for name in _FIELDS:
+                arr = getattr(self, name)
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+    def collect(self, sink):
+        n = self.count
+        if not n:
+            return
+        remaining = 1 - self.age[:n] / self.lifetime[:n]
+        radius = np.clip((self.size[:n] * remaining).astype(np.int64), 1, MAX_RADIUS)
+        index = self.color[:n] * (MAX_RADIUS + 1) + radius
+        x, y = self.x[:n], self.y[:n]
+        a = self.render_alpha
+        if a < 1.0:
+            px, py = self.px[:n], self.py[:n]
+            x = px + (x - px) * a
+            y = py + (y - py) * a
+        left = x.astype(np.int64) - radius - 1
+        top = y.astype(np.int64) - radius - 1
+        table = self.sprite_table()
+        sink.extend(zip(map(table.__getitem__, index.tolist()),
+                        zip(left.tolist(), top.tolist())))
+
+    def draw(self, surface):
+        entries = []
+        self.collect(entries)
+        if entries:
+            surface.blits(entries, doreturn=False)
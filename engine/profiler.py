@@ -0,0 +1,173 @@
+"""Per-phase frame profiler with an on-screen overlay and CSV export.
+
+Code marks the end of each phase with ``profiler.lap(name)``; the time since
+the previous lap (or the start of the frame) is charged to that phase, so a
+frame's laps always add up to its total.  Laps repeated within one frame
+accumulate.  While the profiler is disabled ``lap`` returns immediately, so
+the instrumentation can stay in the hot paths.
+
+Each session (one Game_World, typically) keeps every frame's row in memory
+and, if ``csv_dir`` is set, is written out as one CSV file when it ends.
+"""
+
+import csv
+import os
+import time
+from collections import deque
+
+import pygame
+
+DEFAULT_WINDOW = 120
+OVERLAY_BG = (0, 0, 0, 170)
+OVERLAY_FONT_SIZE = 14
+
+
+class FrameProfiler:
+    def __init__(self, enabled=False, window=DEFAULT_WINDOW, csv_dir=None):
+        self.enabled = enabled
+        self.overlay = False
+        self._enabled_before_overlay = enabled
+        self.window = window
+        self.csv_dir = csv_dir
+        self.counts = {}
+        self._history = {}
+        self._totals = deque(maxlen=window)
+        self._frame = {}
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._session = None
+        self._rows = []
+        self._phases = []
+        self._panel = None
+
+    # ---- recording ----
+
+    def toggle_overlay(self):
+        """Show or hide the overlay; it records while shown."""
+        self.overlay = not self.overlay
+        if self.overlay:
+            self._enabled_before_overlay = self.enabled
+            self.enabled = True
+        else:
+            self.enabled = self._enabled_before_overlay
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        self._frame = {}
+
+    def lap(self, name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame[name] = self._frame.get(name, 0.0) + (now - self._last)
+        self._last = now
+
+    def end_frame(self, counts=None):
+        if not self.enabled or not self._frame_start:
+            return
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        self._totals.append(total)
+        frame = self._frame
+        for name, seconds in frame.items():
+            hist = self._history.get(name)
+            if hist is None:
+                hist = self._history[name] = deque(maxlen=self.window)
+                self._phases.append(name)
+            hist.append(seconds * 1000.0)
+        if counts is not None:
+            self.counts = counts
+        if self._session is not None:
+            row = {name: seconds * 1000.0 for name, seconds in frame.items()}
+            row["total"] = total
+            row.update(self.counts)
+            self._rows.append(row)
+        self._frame_start = 0.0
+
+    # ---- statistics ----
+
+    @staticmethod
+    def _p95(values):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def stats(self):
+        """[(phase, rolling avg ms, rolling p95 ms)] in first-seen order, then total."""
+        out = []
+        for name in self._phases:
+            hist = self._history[name]
+            out.append((name, sum(hist) / len(hist), self._p95(hist)))
+        if self._totals:
+            out.append(("total", sum(self._totals) / len(self._totals),
+                        self._p95(self._totals)))
+        return out
+
+    # ---- sessions / CSV ----
+
+    def begin_session(self, name):
+        self.end_session()
+        if self.enabled:
+            self._session = (name, time.strftime("%Y%m%d-%H%M%S"))
+            self._rows = []
+
+    def end_session(self):
+        """Close the current session, writing its CSV if csv_dir is set."""
+        path = None
+        if self._session is not None and self._rows and self.csv_dir:
+            name, stamp = self._session
+            os.makedirs(self.csv_dir, exist_ok=True)
+            path = os.path.join(self.csv_dir, f"profile_{stamp}_{name}.csv")
+            self.dump_csv(path)
+        self._session = None
+        self._rows = []
+        return path
+
+    def dump_csv(self, path):
+        columns = ["frame", "total"] + list(self._phases)
+        for row in self._rows:
+            for key in row:
+                if key not in columns:
+                    columns.append(key)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+            writer.writeheader()
+            for i, row in enumerate(self._rows):
+                writer.writerow(dict(row, frame=i))
+
+    # ---- overlay ----
+
+    def draw_overlay(self, surface, text):
+        """Draw the stats panel at the top right through text, a TextRenderer.
+
+        The columns are placed separately, so the proportional game font
+        lines up like a monospace one and the changing numbers reuse the
+        glyph atlas instead of rendering new surfaces.
+        """
+        size = OVERLAY_FONT_SIZE
+        font = text.font(size)
+        line_h = font.get_linesize()
+        rows = [("phase", "avg", "p95")] + [
+            (name, f"{avg:.2f}", f"{p95:.2f}") for name, avg, p95 in self.stats()]
+        name_w = max(font.size(name)[0] for name, _, _ in rows)
+        num_w = font.size("000.00")[0] + 8
+        width = name_w + 2 * num_w + 12
+        footer = "  ".join(f"{k}:{v}" for k, v in self.counts.items())
+        lines = len(rows) + (2 if footer else 0)
+        if footer:
+            width = max(width, font.size(footer)[0] + 12)
+        height = line_h * lines + 10
+        panel = self._panel
+        if panel is None or panel.get_size() != (width, height):
+            panel = self._panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BG)
+        color = (220, 255, 220)
+        for i, (name, avg, p95) in enumerate(rows):
+            y = 5 + i * line_h
+            text.draw(panel, name, color, (6, y), size, anchor="topleft")
+            text.draw(panel, avg, color, (6 + name_w + num_w, y), size, anchor="topright")
+            text.draw(panel, p95, color, (6 + name_w + 2 * num_w, y), size, anchor="topright")
+        if footer:
+            text.draw(panel, footer, color, (6, 5 + (len(rows) + 1) * line_h), size,
+                      anchor="topleft")
+        surface.blit(panel, (surface.get_width() - width - 8, 70))
@@ -0,0 +1,219 @@
+"""Struct-of-arrays engine for player projectiles.
+
+With ``Game(projectile_engine="array")`` the game's projectile group is a
+ProjectileGroup: sprites still exist (collision passes work on their rect and
+mask) but their motion lives in NumPy arrays owned by a ProjectileStore.
+One ``update()`` advances every shot with a handful of vectorized steps that
+reproduce Projectile.update exactly, including pygame's integer rect
+rounding, and ``draw()`` submits the whole group in a single blits call.
+"""
+
+import math
+
+import numpy as np
+from engine.registry import IndexedGroup
+from objects.Projectile import HOMING_TURN_RATE, HOMING_SPEED
+
+INITIAL_CAPACITY = 256
+
+_FLOAT_FIELDS = ("cx", "cy", "dx", "dy", "start_y",
+                 "wave_amp", "wave_freq", "wave_phase")
+_INT_FIELDS = ("age", "lifetime", "half_w", "half_h", "height",
+               "damage", "owner")
+_BOOL_FIELDS = ("has_wave", "homing", "piercing")
+
+
+def _round_half_away(values):
+    """The rounding pygame.Rect applies when an attribute is set to a float."""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+
+class ProjectileStore:
+    def __init__(self, game, capacity=INITIAL_CAPACITY):
+        self.game = game
+        self.count = 0
+        self.sprites = []
+        self.images = []
+        self.rects = []
+        self._capacity = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        n = self.count
+        for name in _FLOAT_FIELDS + _INT_FIELDS + _BOOL_FIELDS:
+            if name in _FLOAT_FIELDS:
+                dtype = np.float64
+            elif name in _INT_FIELDS:
+                dtype = np.int64
+            else:
+                dtype = np.bool_
+            arr = np.zeros(capacity, dtype=dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self._capacity = capacity
+
+    # ---- membership (driven by ProjectileGroup) ----
+
+    def attach(self, sprite):
+        if getattr(sprite, "_store", None) is self:
+            return
+        if self.count == self._capacity:
+            self._grow(self._capacity * 2)
+        i = self.count
+        rect = sprite.rect
+        self.cx[i], self.cy[i] = rect.centerx, rect.centery
+        self.dx[i], self.dy[i] = sprite.dx, sprite.dy
+        self.start_y[i] = sprite.start_y
+        wave = sprite.wave
+        self.has_wave[i] = bool(wave)
+        if wave:
+            self.wave_amp[i], self.wave_freq[i] = wave[0], wave[1]
+            self.wave_phase[i] = wave[2] if len(wave) > 2 else 0
+        self.age[i] = sprite.age
+        self.lifetime[i] = sprite.lifetime or 0
+        self.half_w[i] = rect.width // 2
+        self.half_h[i] = rect.height // 2
+        self.height[i] = rect.height
+        self.damage[i] = sprite.damage
+        self.owner[i] = sprite.owner.index if sprite.owner is not None else -1
+        self.homing[i] = sprite.homing
+        self.piercing[i] = sprite.piercing
+        self.sprites.append(sprite)
+        self.images.append(sprite.image)
+        self.rects.append(rect)
+        sprite._store = self
+        sprite._slot = i
+        self.count += 1
+
+    def detach(self, sprite):
+        """Swap-remove the sprite's row so the arrays stay dense."""
+        if getattr(sprite, "_store", None) is not self:
+            return
+        i = sprite._slot
+        last = self.count - 1
+        if i != last:
+            for name in _FLOAT_FIELDS + _INT_FIELDS + _BOOL_FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            self.images[i] = self.images[last]
+            self.rects[i] = self.rects[last]
+            moved._slot = i
+        self.sprites.pop()
+        self.images.pop()
+        self.rects.pop()
+        self.count = last
+        sprite._store = None
+        sprite._slot = None
+
+    def nudge(self, sprite, dx, dy):
+        """Move one row by whole pixels (e.g. black-hole pull)."""
+        i = sprite._slot
+        self.cx[i] += dx
+        self.cy[i] += dy
+
+    # ---- simulation ----
+
+    def _steer_homing(self, rows):
+        """Vectorized Projectile._steer_homing for the given row indices."""
+        cx, cy = self.cx, self.cy
+        sel, tx, ty = [], [], []
+        for i in rows.tolist():
+            target = self.sprites[i]._find_homing_target(int(cx[i]), int(cy[i]))
+            if target is not None:
+                sel.append(i)
+                tx.append(target.rect.centerx)
+                ty.append(target.rect.centery)
+        if not sel:
+            return
+        sel = np.array(sel)
+        px, py = cx[sel], cy[sel]
+        vx, vy = self.dx[sel], self.dy[sel]
+        desired = np.arctan2(np.array(ty) - py, np.array(tx) - px)
+        current = np.arctan2(vy, vx)
+        diff = (desired - current + math.pi) % (2 * math.pi) - math.pi
+        current = current + diff * HOMING_TURN_RATE
+        speed = np.maximum(np.hypot(vx, vy), HOMING_SPEED)
+        self.dx[sel] = speed * np.cos(current)
+        self.dy[sel] = speed * np.sin(current)
+
+    def update(self):
+        if self.game.paused or not self.count:
+            return
+        n = self.count
+        age = self.age[:n]
+        age += 1
+        lifetime = self.lifetime[:n]
+        expired = (lifetime > 0) & (age >= lifetime)
+
+        homing_rows = np.flatnonzero(self.homing[:n] & ~expired)
+        if homing_rows.size:
+            self._steer_homing(homing_rows)
+
+        cx = self.cx[:n]
+        cy = self.cy[:n]
+        live = ~expired
+        cx[live] = _round_half_away(cx[live] + self.dx[:n][live])
+        wave = self.has_wave[:n] & live
+        straight = live & ~wave
+        cy[straight] = _round_half_away(cy[straight] + self.dy[:n][straight])
+        if wave.any():
+            cy[wave] = np.trunc(
+                self.start_y[:n][wave] + self.wave_amp[:n][wave]
+                * np.sin(self.wave_freq[:n][wave] * age[wave]
+                         + self.wave_phase[:n][wave])
+            )
+
+        left = cx - self.half_w[:n]
+        top = cy - self.half_h[:n]
+        bottom = top + self.height[:n]
+        offscreen = ((left > self.game.GAME_WIDTH + 40) | (left < -60)
+                     | (bottom < -40) | (top > self.game.GAME_HEIGHT + 40))
+        dead = expired | offscreen
+
+        for rect, x, y in zip(self.rects, cx.astype(np.int64).tolist(),
+                              cy.astype(np.int64).tolist()):
+            rect.center = (x, y)
+        if dead.any():
+            doomed = [self.sprites[i] for i in np.flatnonzero(dead).tolist()]
+            for sprite in doomed:
+                sprite.kill()
+
+    def collect(self, sink):
+        if self.count:
+            sink.extend(zip(self.images, self.rects))
+
+    def draw(self, surface):
+        if self.count:
+            surface.blits(zip(self.images, self.rects), doreturn=False)
+
+
+class ProjectileGroup(IndexedGroup):
+    """Indexed group whose members are simulated by a ProjectileStore."""
+
+    def __init__(self, store, partitions=None, *sprites):
+        self.store = store
+        super().__init__(partitions, *sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.store.attach(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.store.detach(sprite)
+
+    def update(self, *args, **kwargs):
+        self.store.update()
+
+    def collect(self, sink):
+        self.store.collect(sink)
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        self.store.draw(surface)
+        return []
@@ -0,0 +1,40 @@
+"""Sprite groups that index their members into named partitions.
+
+An IndexedGroup is given ``{name: predicate}`` at construction.  Every sprite
+added is tested once against each predicate and recorded in the matching
+partitions; ``kill()`` / ``remove()`` take it out again through the same
+Group hooks.  Collision passes then read ready-made subsets (``piercing``
+shots, ``blackholes``, ``Drone`` enemies, ...) instead of rebuilding them
+with a scan every frame.
+
+Predicates must only look at attributes that are fixed for the sprite's
+lifetime.  Partitions keep insertion order, so iterating one visits sprites
+in the same order as iterating the whole group would.
+"""
+
+import pygame
+
+
+class IndexedGroup(pygame.sprite.Group):
+    def __init__(self, partitions=None, *sprites):
+        self._predicates = dict(partitions or {})
+        self._partitions = {name: {} for name in self._predicates}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        for name, predicate in self._predicates.items():
+            if predicate(sprite):
+                self._partitions[name][sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        for members in self._partitions.values():
+            members.pop(sprite, None)
+
+    def partition(self, name):
+        """Live view of the members in a partition (copy it to mutate while iterating)."""
+        return self._partitions[name].keys()
+
+    def count(self, name):
+        return len(self._partitions[name])
@@ -0,0 +1,169 @@
+"""Input recording and deterministic replay.
+
+A replay is a gzip-compressed JSON-lines file.  The first line is a header
+with the per-stream RNG seeds (see engine/rng.py) and the action key order;
+every following line is one simulation tick::
+
+    [delta_time, menu_action_bits, [player_action_bits, ...], last_keydown]
+
+``last_keydown`` is omitted when no key was pressed.  Calls that change the
+state stack from outside the input path (``Game.start_game``) are stored as
+``{"event": ...}`` lines in tick order.  Lines are written as the game runs,
+so a recording never accumulates in memory.
+
+A recording covers a whole run from the title screen.  Replaying it on a
+fresh headless Game with the same seeds feeds identical inputs into every
+tick and so reproduces the run exactly, as fast as the machine allows.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from engine import rng
+
+REPLAY_VERSION = 1
+FLUSH_TICKS = 600
+EVENTS = ("start_game",)
+
+
+def _bits(actions, keys):
+    mask = 0
+    for i, key in enumerate(keys):
+        if actions[key]:
+            mask |= 1 << i
+    return mask
+
+
+def _unpack(mask, keys, actions):
+    for i, key in enumerate(keys):
+        actions[key] = bool(mask >> i & 1)
+
+
+def reset_world_caches():
+    """Drop class-level caches whose contents depend on earlier random draws."""
+    from objects.Rocks import Rock
+    Rock.variants.clear()
+
+
+class ReplayWriter:
+    def __init__(self, path, game, seeds):
+        self.path = path
+        self.ticks = 0
+        self._menu_keys = list(game.actions)
+        self._player_keys = list(game.player_actions[0])
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        header = {
+            "version": REPLAY_VERSION,
+            "seeds": seeds,
+            "projectile_engine": game.projectile_engine,
+            "menu_keys": self._menu_keys,
+            "player_keys": self._player_keys,
+        }
+        self._file.write(json.dumps(header) + "\n")
+
+    @classmethod
+    def start(cls, game, replay_dir):
+        """Reseed every stream and open a new recording in replay_dir."""
+        os.makedirs(replay_dir, exist_ok=True)
+        seeds = rng.seed_all()
+        reset_world_caches()
+        path = os.path.join(replay_dir, f"replay_{time.strftime('%Y%m%d-%H%M%S')}.jsonl.gz")
+        return cls(path, game, seeds)
+
+    def record(self, game):
+        keys = self._player_keys
+        line = [game.delta_time, _bits(game.actions, self._menu_keys),
+                [_bits(pa, keys) for pa in game.player_actions]]
+        if game.last_keydown is not None:
+            line.append(game.last_keydown)
+        self._file.write(json.dumps(line, separators=(",", ":")) + "\n")
+        self.ticks += 1
+        if self.ticks % FLUSH_TICKS == 0:
+            self._file.flush()
+
+    def event(self, name, **kwargs):
+        self._file.write(json.dumps(dict(kwargs, event=name)) + "\n")
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class Replay:
+    def __init__(self, path):
+        self.path = path
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.header = json.loads(f.readline())
+        if self.header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version in {path}")
+
+    def lines(self):
+        """Yield every tick list and event dict after the header."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            f.readline()
+            for line in f:
+                yield json.loads(line)
+
+    def play(self, game, max_ticks=None, on_tick=None):
+        """Drive a freshly constructed game through the recording.
+
+        Reseeds the streams exactly where ReplayWriter.start did, then feeds
+        every recorded tick into game.update(); returns the ticks played.
+        on_tick(game) runs after every tick, e.g. to profile or sample state.
+        The game must use the projectile engine the header names, since the
+        two engines do not simulate identically.
+        """
+        engine = self.header.get("projectile_engine", "sprite")
+        if game.projectile_engine != engine:
+            raise ValueError(f"{self.path} was recorded with projectile_engine="
+                             f"{engine!r}, the game uses {game.projectile_engine!r}")
+        rng.seed_streams(self.header["seeds"])
+        reset_world_caches()
+        game.replaying = True
+        menu_keys = self.header["menu_keys"]
+        player_keys = self.header["player_keys"]
+        played = 0
+        for tick in self.lines():
+            if not game.running or (max_ticks is not None and played >= max_ticks):
+                break
+            if isinstance(tick, dict):
+                name = tick.pop("event")
+                if name not in EVENTS:
+                    raise ValueError(f"unknown replay event {name!r}")
+                getattr(game, name)(**tick)
+                continue
+            dt, menu_bits, player_bits = tick[:3]
+            keydown = tick[3] if len(tick) > 3 else None
+            game.delta_time = dt
+            _unpack(menu_bits, menu_keys, game.actions)
+            for pa, bits in zip(game.player_actions, player_bits):
+                _unpack(bits, player_keys, pa)
+            game.last_keydown = keydown
+            game.update()
+            played += 1
+            if on_tick is not None:
+                on_tick(game)
+        return played
+
+
+def state_digest(game):
+    """Hash of the simulated state, for checking that two runs agree."""
+    h = hashlib.sha256()
+    for group in (game.rocks, game.pickups, game.projectiles,
+                  game.enemy_projectiles, game.enemies):
+        for sprite in group:
+            h.update(repr((type(sprite).__name__, tuple(sprite.rect))).encode())
+    for player in game.players:
+        h.update(repr((player.position_x, player.position_y, player.lives,
+                       player.kills, player.alive)).encode())
+    gw = game.active_game_world
+    if gw is not None:
+        h.update(repr((gw.elapsed_time, gw.asteroids_killed,
+                       gw.game_over, gw.boss_encounter)).encode())
+        if gw.boss is not None:
+            h.update(repr((tuple(gw.boss.rect), gw.boss.hp)).encode())
+    h.update(repr(type(game.state_stack[-1]).__name__ if game.state_stack else None).encode())
+    return h.hexdigest()
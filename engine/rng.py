@@ -0,0 +1,49 @@
+"""Named random streams, one per gameplay consumer.
+
+Every module that makes gameplay decisions draws from its own stream
+instead of the shared ``random`` module, so the streams can be seeded
+independently and recorded in a replay header.  Streams are created once
+and reseeded in place, which lets modules bind them at import time::
+
+    from engine.rng import stream
+    _rng = stream("enemies")
+
+Audio variation still uses ``random`` directly: it never feeds back into
+the simulation.
+"""
+
+import random
+
+STREAMS = ("spawns", "rocks", "boss", "enemies", "pickups", "particles")
+
+_streams = {name: random.Random() for name in STREAMS}
+_seeds = {}
+
+
+def stream(name):
+    return _streams[name]
+
+
+def derive_seeds(master):
+    """Per-stream 64-bit seeds derived from one master seed."""
+    return {name: random.Random(f"{master}:{name}").getrandbits(64)
+            for name in STREAMS}
+
+
+def seed_streams(seeds):
+    for name, seed in seeds.items():
+        _streams[name].seed(seed)
+        _seeds[name] = seed
+
+
+def seed_all(master=None):
+    """Reseed every stream from master (fresh entropy if None); returns the seeds."""
+    if master is None:
+        master = random.SystemRandom().getrandbits(64)
+    seeds = derive_seeds(master)
+    seed_streams(seeds)
+    return seeds
+
+
+def current_seeds():
+    return dict(_seeds)
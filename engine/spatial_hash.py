@@ -0,0 +1,112 @@
+"""Uniform-grid broadphase for sprite collision passes.
+
+A SpatialHash buckets sprites by the grid cells their rect covers.  Collision
+passes query it with a rect and only run the (expensive) mask test on the
+candidates that share a cell, instead of on every pair.
+
+Query results come back in insertion order so that a pass driven by the grid
+visits targets in exactly the order pygame.sprite.groupcollide would.
+"""
+
+import pygame
+
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialHash:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._order = {}
+
+    def __len__(self):
+        return len(self._order)
+
+    def clear(self):
+        self._cells.clear()
+        self._order.clear()
+
+    def rebuild(self, sprites):
+        """Drop everything and re-index the given sprites (once per frame)."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, (rect.right - 1) // cs,
+                rect.top // cs, (rect.bottom - 1) // cs)
+
+    def insert(self, sprite):
+        """Index a sprite under every cell its rect touches."""
+        if sprite in self._order:
+            return
+        self._order[sprite] = len(self._order)
+        x0, x1, y0, y1 = self._cell_range(sprite.rect)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def query(self, rect):
+        """Sprites whose cells overlap rect, deduplicated, in insertion order.
+
+        This is a broadphase: callers still need a rect or mask test.
+        """
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            return list(cells.get((x0, y0), ()))
+        found = {}
+        order = self._order
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for sprite in cells.get((cx, cy), ()):
+                    found[sprite] = order[sprite]
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=found.__getitem__)
+
+    def collide(self, sprite, collided=None):
+        """Live indexed sprites that really touch sprite (rect, then collided)."""
+        rect = sprite.rect
+        hits = []
+        for other in self.query(rect):
+            if not other.alive() or not rect.colliderect(other.rect):
+                continue
+            if collided is None or collided(sprite, other):
+                hits.append(other)
+        return hits
+
+
+def groupcollide(sprites_a, grid_b, dokilla, dokillb, collided=None):
+    """pygame.sprite.groupcollide with group b replaced by its SpatialHash.
+
+    Returns the same {sprite_a: [sprites_b]} dict and honours the same kill
+    flags; sprites killed earlier in the pass are skipped.
+    """
+    hits = {}
+    if not len(grid_b):
+        return hits
+    for a in list(sprites_a):
+        found = grid_b.collide(a, collided)
+        if not found:
+            continue
+        hits[a] = found
+        if dokillb:
+            for b in found:
+                b.kill()
+        if dokilla:
+            a.kill()
+    return hits
+
+
+def player_rect(player):
+    """Collision rect of a Player (players are not Sprites)."""
+    img = player.curr_image
+    return pygame.Rect(int(player.position_x), int(player.position_y),
+                       img.get_width(), img.get_height())
@@ -0,0 +1,64 @@
+"""Bounded LRU cache for prebuilt sprite surfaces and masks.
+
+Entries are shared between every sprite that asks for the same key, so the
+surfaces handed out must be treated as read-only: blit from them, never draw
+onto them.
+"""
+
+from collections import OrderedDict
+
+
+class SurfaceCache:
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @staticmethod
+    def _size_of(value):
+        surf = value[0] if isinstance(value, tuple) else value
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def get(self, key, build):
+        """Return the cached value for key, calling build() on a miss."""
+        entries = self._entries
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = build()
+        entries[key] = value
+        self._bytes += self._size_of(value)
+        while len(entries) > 1 and (len(entries) > self.max_entries
+                                    or self._bytes > self.max_bytes):
+            _, old = entries.popitem(last=False)
+            self._bytes -= self._size_of(old)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,69 @@
+"""Procedural sound effects rendered with NumPy and cached on disk.
+
+Renderers take their parameters plus the mixer's sample rate and channel
+count and return interleaved int16 samples.  ``cached`` stores each result
+as a .npy file named by a hash of (renderer, parameters, mixer format,
+SYNTH_VERSION), so later startups load the buffer instead of rendering it.
+Bump SYNTH_VERSION whenever a renderer's output changes.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+SYNTH_VERSION = 1
+
+
+def swing(duration, base_freq, peak_freq, end_freq, sample_rate, channels):
+    """Lightsaber-style swing: a pitch sweep up then down with a few harmonics."""
+    n = int(sample_rate * duration)
+    p = np.arange(n) / sample_rate / duration
+    freq = np.where(
+        p < 0.22,
+        base_freq + (peak_freq - base_freq) * (p / 0.22),
+        peak_freq - (peak_freq - end_freq) * ((p - 0.22) / 0.78),
+    )
+    phase = np.cumsum(2 * np.pi * freq / sample_rate)
+    tone = (np.sin(phase) * 0.40
+            + np.sin(phase * 2) * 0.18
+            + np.sin(phase * 3) * 0.07
+            + np.sin(phase * 5.02) * 0.04)
+    # Seeded from the parameters so a variant always renders the same bytes.
+    seed = int(hashlib.sha1(repr((duration, base_freq, peak_freq, end_freq)).encode())
+               .hexdigest()[:8], 16)
+    noise = np.random.default_rng(seed).uniform(-1.0, 1.0, n) * 0.06
+    env = np.where(p < 0.06, p / 0.06, np.where(p > 0.65, (1.0 - p) / 0.35, 1.0))
+    val = (np.clip((tone + noise) * env * 0.85, -1.0, 1.0) * 32000).astype(np.int16)
+    return np.repeat(val, channels)
+
+
+def cache_path(cache_dir, render, params, mixer_format):
+    key = json.dumps([SYNTH_VERSION, render.__name__, list(params), list(mixer_format)])
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{render.__name__}_{digest}.npy")
+
+
+def cached(render, params, mixer_format, cache_dir):
+    """render(*params, sample_rate, channels), loaded from cache_dir when present.
+
+    mixer_format is pygame.mixer.get_init().  An unreadable cache entry is
+    rendered again; an unwritable cache_dir just means nothing is saved.
+    """
+    sample_rate, _, channels = mixer_format
+    path = cache_path(cache_dir, render, params, mixer_format)
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        pass
+    samples = render(*params, sample_rate, channels)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, samples)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return samples
@@ -0,0 +1,117 @@
+"""Per-tick spatial index for weapon targeting.
+
+A TargetIndex keeps candidate sprites sorted by ``rect.centerx``.  Queries
+sweep outward from the query x with bisect and stop as soon as the x gap
+alone exceeds the best distance found so far, so a nearest or k-nearest
+lookup reads only the handful of candidates around the shooter instead of
+every enemy and rock on screen.
+
+FrameTargets owns the indexes the weapons use and rebuilds each one at most
+once per simulation tick, on first use, so ticks without homing missiles or
+spread shots pay nothing.
+"""
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+
+
+class TargetIndex:
+    def __init__(self, sprites=()):
+        self.rebuild(sprites)
+
+    def rebuild(self, sprites):
+        items = sorted(sprites, key=lambda s: s.rect.centerx)
+        self._items = items
+        self._xs = [s.rect.centerx for s in items]
+        self._ys = [s.rect.centery for s in items]
+        self._members = set(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, sprite):
+        return sprite in self._members
+
+    def nearest(self, x, y, max_range=math.inf):
+        """Closest candidate to (x, y) within max_range, or None."""
+        found = self.k_nearest(x, y, 1, max_range)
+        return found[0] if found else None
+
+    def k_nearest(self, x, y, k, max_range=math.inf, right_of=-math.inf):
+        """Up to k candidates within max_range, closest first.
+
+        Only candidates whose centerx is greater than right_of are considered.
+        """
+        xs, ys, items = self._xs, self._ys, self._items
+        if k <= 0 or not items:
+            return []
+        limit = max_range * max_range
+        heap = []  # (-dist_sq, -index): the worst kept candidate on top
+        floor = bisect_right(xs, right_of)
+        start = max(bisect_left(xs, x), floor)
+        lo, hi = start - 1, start
+        while lo >= floor or hi < len(xs):
+            # Visit whichever side is closer in x next.
+            right = hi < len(xs) and (lo < floor or xs[hi] - x <= x - xs[lo])
+            if right:
+                i = hi
+                hi += 1
+            else:
+                i = lo
+                lo -= 1
+            gap = xs[i] - x
+            bound = -heap[0][0] if len(heap) == k else limit
+            if gap * gap > bound:
+                # Every remaining candidate on this side is farther still.
+                if right:
+                    hi = len(xs)
+                else:
+                    lo = floor - 1
+                continue
+            dy = ys[i] - y
+            d = gap * gap + dy * dy
+            if d > bound or (d == bound and len(heap) == k):
+                continue
+            if len(heap) == k:
+                heapq.heapreplace(heap, (-d, -i))
+            else:
+                heapq.heappush(heap, (-d, -i))
+        return [items[-i] for _, i in sorted(heap, reverse=True)]
+
+
+class FrameTargets:
+    """The targeting indexes of one game, rebuilt lazily once per tick."""
+
+    def __init__(self, game):
+        self.game = game
+        self._ships = TargetIndex()
+        self._rocks = TargetIndex()
+        self._built = {"ships": None, "rocks": None}
+
+    def _boss(self):
+        gw = self.game.active_game_world
+        if gw and gw.boss and gw.boss.alive_flag:
+            return [gw.boss]
+        return []
+
+    def _fresh(self, name):
+        if self._built[name] == self.game.tick:
+            return False
+        self._built[name] = self.game.tick
+        return True
+
+    @property
+    def ships(self):
+        """Live enemy ships and the boss: what homing missiles lock onto."""
+        if self._fresh("ships"):
+            ships = [e for e in self.game.enemies if e.alive_flag]
+            self._ships.rebuild(ships + self._boss())
+        return self._ships
+
+    @property
+    def rocks(self):
+        """Rocks and the boss: what spread shots aim at."""
+        if self._fresh("rocks"):
+            self._rocks.rebuild(list(self.game.rocks) + self._boss())
+        return self._rocks
@@ -0,0 +1,135 @@
+"""Text drawn from cached per-size glyph atlases.
+
+The game font is pygame's bundled default (FreeSans Bold), so startup never
+scans system fonts; drop a TTF at assets/fonts/game.ttf to override it.
+
+For each (size, color) the printable ASCII glyphs are rendered once into a
+single atlas surface.  Drawing a string is then one ``blits`` call of atlas
+areas straight onto the target, so changing labels such as "Kills: 17" or
+a cooldown counter cost no new surfaces.  Strings with characters outside
+the atlas are rendered whole.  Atlases and whole strings share one
+byte-bounded LRU (engine.surface_cache), whose counters ``stats()``
+reports.
+"""
+
+import os
+from collections import OrderedDict
+
+import pygame
+
+from engine.surface_cache import SurfaceCache
+
+ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+TEXT_CACHE_BYTES = 8 * 1024 * 1024
+TEXT_CACHE_ENTRIES = 256
+LAYOUT_CACHE_ENTRIES = 512
+
+
+def _color_key(color):
+    return color if isinstance(color, tuple) else tuple(pygame.Color(color))
+
+
+class TextRenderer:
+    def __init__(self, font_path=None, max_bytes=TEXT_CACHE_BYTES):
+        self.font_path = font_path if font_path and os.path.exists(font_path) else None
+        self._fonts = {}
+        self._advances = {}
+        self._kerning = {}
+        self._layouts = OrderedDict()
+        self.cache = SurfaceCache(max_entries=TEXT_CACHE_ENTRIES, max_bytes=max_bytes)
+
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.font_path, size)
+            self._fonts[size] = font
+            self._advances[size] = {ch: m[4] for ch, m in zip(ATLAS_CHARS,
+                                                              font.metrics(ATLAS_CHARS))}
+            self._kerning[size] = {}
+        return font
+
+    def _build_atlas(self, size, color):
+        font = self.font(size)
+        glyphs = [font.render(ch, True, color) for ch in ATLAS_CHARS]
+        atlas = pygame.Surface((sum(g.get_width() for g in glyphs), font.get_height()),
+                               pygame.SRCALPHA)
+        areas = {}
+        x = 0
+        for ch, glyph in zip(ATLAS_CHARS, glyphs):
+            atlas.blit(glyph, (x, 0))
+            areas[ch] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+        return atlas, areas
+
+    def _kern(self, size, pair):
+        """Kerning between two characters, measured once per size."""
+        table = self._kerning[size]
+        k = table.get(pair)
+        if k is None:
+            font = self._fonts[size]
+            k = table[pair] = (font.size(pair)[0] - self._advances[size][pair[0]]
+                               - font.size(pair[1])[0])
+        return k
+
+    def _layout(self, text, size, areas):
+        """Glyph x offsets and total width; within a pixel of font.size(text)."""
+        key = (text, size)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+        layout = self._layouts[key] = self._measure(text, size, areas)
+        if len(self._layouts) > LAYOUT_CACHE_ENTRIES:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def _measure(self, text, size, areas):
+        advances = self._advances[size]
+        xs = []
+        x = 0
+        for i, ch in enumerate(text):
+            xs.append(x)
+            if i + 1 < len(text):
+                x += advances[ch] + self._kern(size, text[i:i + 2])
+        width = x + areas[text[-1]].width if text else 0
+        return xs, width
+
+    def _atlas(self, size, color):
+        return self.cache.get(("atlas", size, color),
+                              lambda: self._build_atlas(size, color))
+
+    def render(self, text, color, size):
+        """Whole-string surface, cached; for callers that need a Surface."""
+        color = _color_key(color)
+        return self.cache.get(("text", text, size, color),
+                              lambda: self.font(size).render(text, True, color))
+
+    def draw(self, surface, text, color, pos, size, anchor="center", shadow=None):
+        """Blit text with its rect's ``anchor`` point at pos; returns that rect.
+
+        shadow, if given, is a color drawn one pixel down-right underneath.
+        """
+        color = _color_key(color)
+        if not (text.isascii() and text.isprintable()):
+            surf = self.render(text, color, size)
+            rect = surf.get_rect(**{anchor: pos})
+            if shadow is not None:
+                surface.blit(self.render(text, shadow, size), rect.move(1, 1))
+            surface.blit(surf, rect)
+            return rect
+
+        atlas, areas = self._atlas(size, color)
+        xs, width = self._layout(text, size, areas)
+        rect = pygame.Rect(0, 0, width, atlas.get_height())
+        setattr(rect, anchor, pos)
+        rects = [areas[ch] for ch in text]
+        if shadow is not None:
+            shadow_atlas = self._atlas(size, _color_key(shadow))[0]
+            surface.blits([(shadow_atlas, (rect.x + 1 + x, rect.y + 1), area)
+                           for x, area in zip(xs, rects)], doreturn=False)
+        surface.blits([(atlas, (rect.x + x, rect.y), area)
+                       for x, area in zip(xs, rects)], doreturn=False)
+        return rect
+
+    def stats(self):
+        return dict(self.cache.stats(), fonts=len(self._fonts))
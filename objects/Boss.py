@@ -1,9 +1,20 @@
-import pygame, os, math, random
+import pygame, math
+
+import numpy as np
 
 from objects.Player import PLAYER_CENTER_OFFSET_X, PLAYER_CENTER_OFFSET_Y
+from objects.bullet_patterns import BulletField, PatternRunner, PATTERNS
+from engine.registry import IndexedGroup
+from engine.spatial_hash import player_rect
+from engine.rng import stream
+from engine.batch import collect_group, health_bar, solid
+from engine.surface_cache import SurfaceCache
+
+_rng = stream("boss")
 
 BOSS_WIDTH, BOSS_HEIGHT = 150, 150
 BOSS_BASE_HP = 20
+MAX_ATTACK_LEVEL = 5
 HIT_COOLDOWN = 0.3
 INVULN_PHASE_DURATION = 3.0
 INVULN_THRESHOLDS = [0.75, 0.50, 0.25]
@@ -28,6 +39,20 @@ LASER_BEAM_SPEED = 300
 LASER_BEAM_RADIUS = 7
 LASER_EMIT_INTERVAL = 0.016
 LASER_MAX_CONCURRENT = 2
+# Enough for a full-width stream: the screen takes ~4 s at LASER_BEAM_SPEED.
+LASER_RING_SIZE = 512
+
+
+def _segment_dist_sq(px, py, a, b):
+    """Squared distance from (px, py) to the segment a-b."""
+    ax, ay = a
+    dx, dy = b[0] - ax, b[1] - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0
+    if length_sq:
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    ex, ey = ax + t * dx - px, ay + t * dy - py
+    return ex * ex + ey * ey
 
 
 class BossLaser:
@@ -39,8 +64,18 @@ class BossLaser:
     Because the boss bobs vertically while emitting, the stream naturally
     forms a wavy pattern.  Players dodge by reading the wave and positioning
     between streams.
+
+    Emitted points live in a fixed ring buffer and never move: each stores
+    its x plus the distance the stream had scrolled when it was emitted, so
+    its screen x is ``key - scroll``.  Scrolling is a single add, expiry
+    advances the ring head, and because the boss patrols slower than the
+    beam flies the keys are sorted, so collision only looks at the segments
+    under the player.  Each segment is drawn once into a strip surface in
+    key space, which is blitted at ``-scroll`` every frame.
     """
 
+    _glow = None
+
     def __init__(self, boss, offset_y, game):
         self.boss = boss
         self.game = game
@@ -48,7 +83,16 @@ class BossLaser:
         self.timer = 0.0
         self.emit_timer = 0.0
         self.phase = "charging"
-        self.segments = []
+        self.scroll = 0.0
+        self.prev_scroll = 0.0
+        # Draw-time blend toward prev_scroll, set by engine.interpolation.
+        self.render_alpha = 1.0
+        self._keys = np.zeros(LASER_RING_SIZE)
+        self._ys = np.zeros(LASER_RING_SIZE)
+        self._head = 0
+        self._count = 0
+        self._strip = None
+        self._strip_origin = (0, 0)
 
     @property
     def done(self):
@@ -58,6 +102,31 @@ class BossLaser:
     def active(self):
         return self.phase in ("active", "fading")
 
+    @property
+    def segments(self):
+        """Live stream points as screen (x, y), oldest first."""
+        return self._points(0, self._count)
+
+    def _ring(self, lo, hi):
+        return [(self._head + i) % LASER_RING_SIZE for i in range(lo, hi)]
+
+    def _points(self, lo, hi, scroll=None):
+        idx = self._ring(lo, hi)
+        scroll = self.scroll if scroll is None else scroll
+        return [(float(self._keys[i]) - scroll, float(self._ys[i])) for i in idx]
+
+    def _search(self, key, side="left"):
+        """Logical index where key would go in the sorted live keys."""
+        end = self._head + self._count
+        first = self._keys[self._head:min(end, LASER_RING_SIZE)]
+        if end > LASER_RING_SIZE and key > first[-1]:
+            rest = self._keys[:end - LASER_RING_SIZE]
+            return len(first) + int(np.searchsorted(rest, key, side))
+        return int(np.searchsorted(first, key, side))
+
+    def snapshot(self):
+        self.prev_scroll = self.scroll
+
     def update(self, dt):
         if self.game.paused:
             return
@@ -67,14 +136,16 @@ class BossLaser:
             self.phase = "active"
             self.timer = 0.0
             self.emit_timer = 0.0
+            self._new_strip()
         elif self.phase == "active" and self.timer >= LASER_ACTIVE_DURATION:
             self.phase = "fading"
-        elif self.phase == "fading" and not self.segments:
+        elif self.phase == "fading" and not self._count:
             self.phase = "done"
 
-        speed = LASER_BEAM_SPEED * dt
-        self.segments = [(x - speed, y) for x, y in self.segments
-                         if x - speed > -20]
+        self.scroll += LASER_BEAM_SPEED * dt
+        while self._count and self._keys[self._head] - self.scroll <= -20:
+            self._head = (self._head + 1) % LASER_RING_SIZE
+            self._count -= 1
 
         if self.phase == "active":
             self.emit_timer += dt
@@ -82,65 +153,144 @@ class BossLaser:
                 self.emit_timer -= LASER_EMIT_INTERVAL
                 bx = float(self.boss.rect.left)
                 by = float(self.boss.rect.centery + self.offset_y)
-                self.segments.append((bx, by))
+                self._emit(bx + self.scroll, by)
+
+    def _emit(self, key, y):
+        if self._count == LASER_RING_SIZE:
+            self._head = (self._head + 1) % LASER_RING_SIZE
+            self._count -= 1
+        i = (self._head + self._count) % LASER_RING_SIZE
+        self._keys[i] = key
+        self._ys[i] = y
+        self._count += 1
+        self._paint_tail()
 
-    def draw(self, surface):
+    # ---- drawing ----
+
+    def _new_strip(self):
+        """Allocate the key-space strip covering everything this laser can emit."""
+        boss = self.boss
+        span = boss.patrol_right - boss.patrol_left
+        pad = LASER_BEAM_RADIUS + 4
+        # Keys are emit positions plus scroll, which already ran on while charging.
+        left = boss.rect.left + int(self.scroll) - span - pad
+        top = int(boss.base_y + self.offset_y) - BOB_AMP - pad
+        width = 2 * span + int(LASER_ACTIVE_DURATION * LASER_BEAM_SPEED) + 40 + 2 * pad
+        self._strip = pygame.Surface((width, 2 * (BOB_AMP + pad)))
+        self._strip.set_colorkey((0, 0, 0))
+        self._strip_origin = (left, top)
+
+    def _paint_tail(self):
+        """Draw the newest segment into the strip, keeping the layers in order."""
+        if self._strip is None or self._count < 2:
+            return
+        ox, oy = self._strip_origin
+        pts = [(int(self._keys[i]) - ox, int(self._ys[i]) - oy)
+               for i in self._ring(max(0, self._count - 3), self._count)]
+        r = LASER_BEAM_RADIUS
+        strip = self._strip
+        pygame.draw.line(strip, (100, 0, 100), pts[-2], pts[-1], r * 2 + 4)
+        # Re-ink the previous segment's inner layers over the new outer edge.
+        pygame.draw.lines(strip, (220, 60, 220), False, pts, r + 2)
+        pygame.draw.lines(strip, (255, 180, 255), False, pts, max(2, r // 2))
+
+    def collect(self, sink):
         if self.phase == "charging":
-            self._draw_charge(surface)
-        elif self.segments:
-            self._draw_stream(surface)
+            self._collect_charge(sink)
+        elif self._count:
+            self._collect_stream(sink)
 
-    def _draw_charge(self, surface):
+    def draw(self, surface):
+        entries = []
+        self.collect(entries)
+        if entries:
+            surface.blits(entries, False)
+
+    def _collect_charge(self, sink):
         progress = min(1.0, self.timer / LASER_CHARGE_DURATION)
         boss_left = self.boss.rect.left
         y = int(self.boss.rect.centery + self.offset_y)
-        t = pygame.time.get_ticks() / 1000.0
-        pulse = 0.5 + 0.5 * math.sin(t * 12)
         line_len = int(80 * progress)
         end_x = max(0, boss_left - line_len)
-        la = max(60, int(200 * progress * pulse))
-        pygame.draw.line(surface, (200, 0, 200), (boss_left, y), (end_x, y), 1)
+        line = solid((200, 0, 200), (81, 1))
+        sink.append((line, (end_x, y), (0, 0, boss_left - end_x + 1, 1)))
         gr = int(10 * progress)
         if gr > 0:
             glow = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
             pygame.draw.circle(glow, (255, 100, 255, int(180 * progress)),
                                (gr, gr), gr)
-            surface.blit(glow, (boss_left - gr, y - gr))
+            sink.append((glow, (boss_left - gr, y - gr)))
 
-    def _draw_stream(self, surface):
-        if len(self.segments) < 2:
+    def _collect_stream(self, sink):
+        if self._count < 2 or self._strip is None:
             return
-        pts = [(int(x), int(y)) for x, y in self.segments]
-        r = LASER_BEAM_RADIUS
-        pygame.draw.lines(surface, (100, 0, 100), False, pts, r * 2 + 4)
-        pygame.draw.lines(surface, (220, 60, 220), False, pts, r + 2)
-        pygame.draw.lines(surface, (255, 180, 255), False, pts, max(2, r // 2))
-        if self.phase == "active" and self.segments:
-            lx, ly = self.segments[-1]
+        ox, oy = self._strip_origin
+        pad = LASER_BEAM_RADIUS + 4
+        first = int(self._keys[self._head]) - ox - pad
+        last = int(self._keys[(self._head + self._count - 1) % LASER_RING_SIZE]) - ox + pad
+        area = pygame.Rect(first, 0, last - first, self._strip.get_height())
+        scroll = self.prev_scroll + (self.scroll - self.prev_scroll) * self.render_alpha
+        sink.append((self._strip, (ox + first - int(scroll), oy), area))
+        if self.phase == "active":
+            lx, ly = self._points(self._count - 1, self._count, scroll)[0]
+            glow = self._head_glow()
+            gr = glow.get_width() // 2
+            sink.append((glow, (int(lx) - gr, int(ly) - gr)))
+
+    @classmethod
+    def _head_glow(cls):
+        if cls._glow is None:
             gr = 10
-            glow = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (255, 200, 255, 220), (gr, gr), gr)
-            surface.blit(glow, (int(lx) - gr, int(ly) - gr))
+            cls._glow = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
+            pygame.draw.circle(cls._glow, (255, 200, 255, 220), (gr, gr), gr)
+        return cls._glow
 
     def hits_player(self, player):
-        if not self.active or not self.segments:
+        """True if the stream passes within LASER_BEAM_RADIUS of the player's rect.
+
+        The beam is the polyline through the stream points, thickened by the
+        radius.  Segments that miss the rect inflated by the radius are
+        rejected with one clipline; the rest hit if they cross the rect, or
+        if one of their ends or one of the rect's corners is within the
+        radius of the other.
+        """
+        if not self.active or not self._count:
             return False
-        px, py = int(player.position_x), int(player.position_y)
-        img = player.curr_image
-        pr = pygame.Rect(px, py, img.get_width(), img.get_height())
         r = LASER_BEAM_RADIUS
-        step = max(1, len(self.segments) // 50)
-        for i in range(0, len(self.segments), step):
-            sx, sy = self.segments[i]
-            seg_rect = pygame.Rect(int(sx) - r, int(sy) - r, r * 2, r * 2)
-            if pr.colliderect(seg_rect):
+        pr = player_rect(player)
+        # One pixel extra on each side: Rect edges exclude right and bottom.
+        reach = pr.inflate(r * 2 + 2, r * 2 + 2)
+        lo = max(0, self._search(reach.left + self.scroll) - 1)
+        hi = min(self._count, self._search(reach.right + self.scroll, "right") + 1)
+        pts = self._points(lo, hi)
+        if len(pts) == 1:
+            pts.append(pts[0])
+        r_sq = r * r
+        left, top, right, bottom = pr.left, pr.top, pr.right, pr.bottom
+        corners = ((left, top), (right, top), (left, bottom), (right, bottom))
+        for a, b in zip(pts, pts[1:]):
+            if not reach.clipline(a, b):
+                continue
+            if pr.clipline(a, b):
                 return True
+            for x, y in (a, b):
+                ex = x - min(max(x, left), right)
+                ey = y - min(max(y, top), bottom)
+                if ex * ex + ey * ey <= r_sq:
+                    return True
+            for cx, cy in corners:
+                if _segment_dist_sq(cx, cy, a, b) <= r_sq:
+                    return True
         return False
 
 
 class BossProjectile(pygame.sprite.Sprite):
     """Projectile fired by the boss, moving toward the player."""
 
+    # Shared (image, mask) per (w, h, color, kind); attacks fire dozens of
+    # identical shots in one frame.
+    templates = SurfaceCache(max_entries=64)
+
     def __init__(self, x, y, dx, dy, game, destroyable=True, size=12,
                  color=(255, 50, 50), width=None, height=None):
         super().__init__()
@@ -150,30 +300,42 @@ class BossProjectile(pygame.sprite.Sprite):
         self.destroyable = destroyable
         w = width or size
         h = height or size
-        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
         if width and height and width > height * 2:
-            self._draw_laser(w, h, color)
-        elif destroyable:
-            r = min(w, h) // 2
-            pygame.draw.circle(self.image, color, (w // 2, h // 2), r)
-            bright = tuple(min(255, c + 80) for c in color[:3])
-            pygame.draw.circle(self.image, bright, (w // 2, h // 2), max(1, r - 3))
+            kind = "laser"
         else:
-            r = min(w, h) // 2
-            pygame.draw.circle(self.image, (200, 0, 200), (w // 2, h // 2), r)
-            pygame.draw.circle(self.image, (255, 100, 255), (w // 2, h // 2), max(1, r - 2))
-        self.mask = pygame.mask.from_surface(self.image)
+            kind = "destroyable" if destroyable else "solid"
+        key = (w, h, tuple(color[:3]), kind)
+        self.image, self.mask = BossProjectile.templates.get(
+            key, lambda: self._build_template(*key)
+        )
         self.rect = self.image.get_rect(center=(x, y))
 
-    def _draw_laser(self, w, h, color):
-        glow = (*color[:3], 40)
-        pygame.draw.rect(self.image, glow, (0, 0, w, h), border_radius=4)
+    @classmethod
+    def _build_template(cls, w, h, color, kind):
+        image = pygame.Surface((w, h), pygame.SRCALPHA)
+        if kind == "laser":
+            cls._draw_laser(image, w, h, color)
+        elif kind == "destroyable":
+            r = min(w, h) // 2
+            pygame.draw.circle(image, color, (w // 2, h // 2), r)
+            bright = tuple(min(255, c + 80) for c in color)
+            pygame.draw.circle(image, bright, (w // 2, h // 2), max(1, r - 3))
+        else:
+            r = min(w, h) // 2
+            pygame.draw.circle(image, (200, 0, 200), (w // 2, h // 2), r)
+            pygame.draw.circle(image, (255, 100, 255), (w // 2, h // 2), max(1, r - 2))
+        return image, pygame.mask.from_surface(image)
+
+    @staticmethod
+    def _draw_laser(image, w, h, color):
+        glow = (*color, 40)
+        pygame.draw.rect(image, glow, (0, 0, w, h), border_radius=4)
         core_h = max(2, h // 2)
         core_y = (h - core_h) // 2
-        bright = tuple(min(255, c + 100) for c in color[:3])
-        pygame.draw.rect(self.image, bright, (0, core_y, w, core_h))
+        bright = tuple(min(255, c + 100) for c in color)
+        pygame.draw.rect(image, bright, (0, core_y, w, core_h))
         center_y = h // 2
-        pygame.draw.line(self.image, (255, 255, 255), (0, center_y), (w - 1, center_y), 1)
+        pygame.draw.line(image, (255, 255, 255), (0, center_y), (w - 1, center_y), 1)
 
     def update(self):
         if self.game.paused:
@@ -189,16 +351,13 @@ class Boss(pygame.sprite.Sprite):
     def __init__(self, game, attack_level=1, hp_override=None):
         super().__init__()
         self.game = game
-        self.attack_level = min(attack_level, 4)
+        self.attack_level = min(attack_level, MAX_ATTACK_LEVEL)
 
         self.max_hp = hp_override if hp_override else BOSS_BASE_HP
         self.hp = self.max_hp
 
-        sprite_path = os.path.join(game.assets_dir, "enemies", "enemy_1.png")
-        self._base_image = pygame.transform.scale(
-            pygame.image.load(sprite_path).convert_alpha(),
-            (BOSS_WIDTH, BOSS_HEIGHT),
-        )
+        game.require_assets("boss")
+        self._base_image = game.assets.get("boss")
         self.image = self._base_image.copy()
         self.mask = pygame.mask.from_surface(self.image)
         self.rect = self.image.get_rect()
@@ -224,8 +383,10 @@ class Boss(pygame.sprite.Sprite):
         self.attack_cycle = 0
 
         self.alive_flag = True
-        self.boss_projectiles = pygame.sprite.Group()
+        self.boss_projectiles = IndexedGroup({"destroyable": lambda bp: bp.destroyable})
         self.boss_lasers = []
+        self.bullets = BulletField(game.GAME_WIDTH, game.GAME_HEIGHT)
+        self.patterns = []
 
     @property
     def is_invulnerable(self):
@@ -296,6 +457,14 @@ class Boss(pygame.sprite.Sprite):
 
         self.boss_projectiles.update()
 
+        if self.patterns:
+            origin = (self.rect.left, self.rect.centery)
+            target = self._player_center()
+            for runner in self.patterns:
+                runner.update(dt, self.bullets, origin, target)
+            self.patterns = [r for r in self.patterns if not r.done]
+        self.bullets.update()
+
         for laser in self.boss_lasers:
             laser.update(dt)
         self.boss_lasers = [l for l in self.boss_lasers if not l.done]
@@ -307,6 +476,7 @@ class Boss(pygame.sprite.Sprite):
         2: ["laser_sweep", "laser_cross"],
         3: ["rock_barrage"],
         4: ["spiral_storm", "ring_pulse"],
+        5: ["galaxy", "bloom"],
     }
 
     def _do_attack(self):
@@ -314,7 +484,7 @@ class Boss(pygame.sprite.Sprite):
         tier = available_tiers[self.attack_cycle % len(available_tiers)]
         self.attack_cycle += 1
         pool = self._ATTACK_POOLS[tier]
-        name = random.choice(pool)
+        name = _rng.choice(pool)
         getattr(self, f"_attack_{name}")()
 
     def _player_center(self):
@@ -370,7 +540,7 @@ class Boss(pygame.sprite.Sprite):
         """Vertical wall of projectiles with a gap at the player's Y."""
         cx = self.rect.left
         _, py = self._player_center()
-        gap_y = py + random.randint(-40, 40)
+        gap_y = py + _rng.randint(-40, 40)
         gap_half = 45
         for y in range(20, self.game.GAME_HEIGHT - 20, 30):
             if abs(y - gap_y) < gap_half:
@@ -390,20 +560,20 @@ class Boss(pygame.sprite.Sprite):
     def _attack_laser_sweep(self):
         """One or two streams — player dodges through the middle."""
         slots = self._laser_slots_free()
-        if slots >= 2 and random.random() < 0.5:
+        if slots >= 2 and _rng.random() < 0.5:
             offsets = [-70, 70]
         else:
-            offsets = [random.choice([-70, 0, 70])]
+            offsets = [_rng.choice([-70, 0, 70])]
         for off in offsets[:slots]:
             self.boss_lasers.append(BossLaser(self, off, self.game))
 
     def _attack_laser_cross(self):
         """One or two wide-spread streams — dodge through the middle."""
         slots = self._laser_slots_free()
-        if slots >= 2 and random.random() < 0.5:
+        if slots >= 2 and _rng.random() < 0.5:
             offsets = [-90, 90]
         else:
-            offsets = [random.choice([-90, 0, 90])]
+            offsets = [_rng.choice([-90, 0, 90])]
         for off in offsets[:slots]:
             self.boss_lasers.append(BossLaser(self, off, self.game))
 
@@ -413,11 +583,11 @@ class Boss(pygame.sprite.Sprite):
         """Throw a burst of rocks at the player."""
         cx, cy = self.rect.left, self.rect.centery
         from objects.Rocks import Rock, BASIC
-        for _ in range(random.randint(3, 5)):
-            dy = random.uniform(-4, 4)
-            dx = random.uniform(-6, -3)
-            sz = random.randint(20, 40)
-            rock = Rock(cx, cy + random.randint(-50, 50), sz, sz, self.game,
+        for _ in range(_rng.randint(3, 5)):
+            dy = _rng.uniform(-4, 4)
+            dx = _rng.uniform(-6, -3)
+            sz = _rng.randint(20, 40)
+            rock = Rock(cx, cy + _rng.randint(-50, 50), sz, sz, self.game,
                         rock_type=BASIC, dx=dx, dy=dy)
             self.game.rocks.add(rock)
 
@@ -458,23 +628,43 @@ class Boss(pygame.sprite.Sprite):
                     )
                 )
 
+    # -- Tier 5: declarative bullet-field patterns --
+
+    def _start_pattern(self, name):
+        self.patterns.append(PatternRunner(PATTERNS[name]))
+
+    def _attack_galaxy(self):
+        """Counter-rotating spirals that fill the screen."""
+        self._start_pattern("galaxy")
+
+    def _attack_bloom(self):
+        """Accelerating rings pierced by aimed fans."""
+        self._start_pattern("bloom")
+
     # ---- drawing ----
 
-    def draw(self, surface):
+    def collect(self, sprites, overlays):
         if not self.alive_flag:
             return
 
         if self.invuln_timer > 0:
-            self._draw_shield_bubble(surface)
+            sprites.append(self._shield_bubble())
 
         for laser in self.boss_lasers:
-            laser.draw(surface)
+            laser.collect(sprites)
 
-        surface.blit(self.image, self.rect)
-        self.boss_projectiles.draw(surface)
-        self._draw_health_bar(surface)
+        sprites.append((self.image, self.rect))
+        collect_group(self.boss_projectiles, sprites)
+        self.bullets.collect(sprites)
+        overlays.extend(self._health_bar())
+
+    def draw(self, surface):
+        entries = []
+        self.collect(entries, entries)
+        if entries:
+            surface.blits(entries, False)
 
-    def _draw_shield_bubble(self, surface):
+    def _shield_bubble(self):
         cx, cy = self.rect.centerx, self.rect.centery
         t = pygame.time.get_ticks() / 1000
         pulse = 0.85 + 0.15 * math.sin(t * 4)
@@ -487,18 +677,16 @@ class Boss(pygame.sprite.Sprite):
                            int(radius * 0.85), 3)
         pygame.draw.circle(shield_surf, (200, 230, 255, 120), (radius, radius),
                            radius, 2)
-        surface.blit(shield_surf, (cx - radius, cy - radius))
+        return shield_surf, (cx - radius, cy - radius)
 
-    def _draw_health_bar(self, surface):
+    def _health_bar(self):
         bar_w = BOSS_WIDTH + 20
         bar_h = 10
         x = self.rect.centerx - bar_w // 2
         y = self.rect.top - 20
-        pygame.draw.rect(surface, (60, 60, 60), (x - 1, y - 1, bar_w + 2, bar_h + 2))
-        pygame.draw.rect(surface, (80, 0, 0), (x, y, bar_w, bar_h))
         fill_w = max(0, int(bar_w * self.hp / self.max_hp))
         if self.invuln_timer > 0:
             color = (80, 180, 255)
         else:
             color = (220, 30, 30) if self.hp / self.max_hp < 0.3 else (30, 200, 30)
-        pygame.draw.rect(surface, color, (x, y, fill_w, bar_h))
+        return health_bar(x, y, bar_w, bar_h, fill_w, color, (60, 60, 60), back=(80, 0, 0))
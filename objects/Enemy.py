@@ -1,4 +1,8 @@
-import pygame, math, random
+import pygame, math
+from engine.rng import stream
+from engine.batch import health_bar
+
+_rng = stream("enemies")
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +60,7 @@ class Enemy(pygame.sprite.Sprite):
         super().__init__()
         self.game = game
         self.max_hp = self.hp
-        self.shoot_timer = random.uniform(0.5, self.shoot_interval)
+        self.shoot_timer = _rng.uniform(0.5, self.shoot_interval)
         self.alive_flag = True
 
         self.image = self._build_image()
@@ -66,7 +70,7 @@ class Enemy(pygame.sprite.Sprite):
         self._target_x = self._pick_patrol_x()
         self.entering = True
         self.base_y = float(y)
-        self.bob_timer = random.uniform(0, math.pi * 2)
+        self.bob_timer = _rng.uniform(0, math.pi * 2)
 
     def _build_image(self):
         """Override for custom sprites. Default draws a chevron ship."""
@@ -86,7 +90,7 @@ class Enemy(pygame.sprite.Sprite):
         return surf
 
     def _pick_patrol_x(self):
-        return random.randint(
+        return _rng.randint(
             int(self.game.GAME_WIDTH * 0.55),
             int(self.game.GAME_WIDTH * 0.85),
         )
@@ -144,22 +148,27 @@ class Enemy(pygame.sprite.Sprite):
         """Override for different shooting patterns."""
         pass
 
-    def draw(self, surface):
+    def collect(self, sprites, overlays):
         if not self.alive_flag:
             return
-        surface.blit(self.image, self.rect)
+        sprites.append((self.image, self.rect))
         if self.max_hp > 1:
-            self._draw_health_bar(surface)
+            overlays.extend(self._health_bar())
+
+    def draw(self, surface):
+        entries = []
+        self.collect(entries, entries)
+        if entries:
+            surface.blits(entries, False)
 
-    def _draw_health_bar(self, surface):
+    def _health_bar(self):
         bar_w = self.width + 4
         bar_h = 4
         x = self.rect.centerx - bar_w // 2
         y = self.rect.top - 8
-        pygame.draw.rect(surface, (40, 40, 40), (x - 1, y - 1, bar_w + 2, bar_h + 2))
         fill_w = max(0, int(bar_w * self.hp / self.max_hp))
         color = (220, 40, 40) if self.hp / self.max_hp < 0.35 else (40, 220, 40)
-        pygame.draw.rect(surface, color, (x, y, fill_w, bar_h))
+        return health_bar(x, y, bar_w, bar_h, fill_w, color, (40, 40, 40))
 
 
 # ---------------------------------------------------------------------------
@@ -181,7 +190,7 @@ class Fighter(Enemy):
     score_value = 2
 
     def _pick_patrol_x(self):
-        return random.randint(
+        return _rng.randint(
             int(self.game.GAME_WIDTH * 0.75),
             int(self.game.GAME_WIDTH * 0.92),
         )
@@ -226,7 +235,7 @@ class Striker(Enemy):
         self._burst_timer = 0.0
 
     def _pick_patrol_x(self):
-        return random.randint(
+        return _rng.randint(
             int(self.game.GAME_WIDTH * 0.45),
             int(self.game.GAME_WIDTH * 0.65),
         )
@@ -269,7 +278,7 @@ class Striker(Enemy):
         cx, cy = self.rect.left, self.rect.centery
         px, py = self._player_center()
         angle = math.atan2(py - cy, px - cx)
-        spread = random.uniform(-0.12, 0.12)
+        spread = _rng.uniform(-0.12, 0.12)
         dx = self.projectile_speed * math.cos(angle + spread)
         dy = self.projectile_speed * math.sin(angle + spread)
         self.game.enemy_projectiles.add(
@@ -304,9 +313,9 @@ class Drone(Enemy):
         self._dy = dy
         self._delay = delay
         cross_time = (game.GAME_WIDTH + 80) / self.speed
-        n_shots = random.choice([1, 2])
+        n_shots = _rng.choice([1, 2])
         self._shot_schedule = sorted(
-            random.uniform(cross_time * 0.15, cross_time * 0.70)
+            _rng.uniform(cross_time * 0.15, cross_time * 0.70)
             for _ in range(n_shots)
         )
         self._flight_time = 0.0
@@ -1,6 +1,9 @@
-import pygame, math, random
+import pygame, math
 
 from objects.Player import PLAYER_CENTER_OFFSET_X, PLAYER_CENTER_OFFSET_Y
+from engine.rng import stream
+
+_rng = stream("pickups")
 
 PRIMARY_UPGRADE_COLOR = (255, 210, 60)
 SHIELD_COLOR = (80, 180, 255)
@@ -20,7 +23,7 @@ class _BasePickup(pygame.sprite.Sprite):
         self.game = game
         self._fx, self._fy = float(x), float(y)
         self._base_fy = self._fy
-        self.age = random.uniform(0, math.pi * 2)
+        self.age = _rng.uniform(0, math.pi * 2)
         self.magnet_range = 80
         self.image = image
         self.mask = pygame.mask.from_surface(self.image)
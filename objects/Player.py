@@ -5,6 +5,7 @@ import pygame, os
 from objects.Projectile import Projectile
 from objects.Weapon import StraightCannon
 from objects.ships import SHIP_DESIGNS
+from engine.audio import PRIORITY_BACKGROUND
 
 PLAYER_WIDTH, PLAYER_HEIGHT = 80, 35
 PLAYER_CENTER_OFFSET_X = PLAYER_WIDTH // 2
@@ -260,7 +261,7 @@ class Player:
                     tmp = cls()
                     tmp.level = self.secondary_levels.get(cls, 1)
                     self._spawn_projectiles(tmp, muzzle_x, sec_y)
-                    self.game.play_sound(tmp.sound_name)
+                    self.game.play_sound(tmp.sound_name, priority=PRIORITY_BACKGROUND)
                     ws["shot_cooldown"] = tmp.fire_rate
 
         if not self.secondary:
@@ -303,13 +304,14 @@ class Player:
                            owner=self, **kwargs)
             )
 
-    def render(self, display):
+    def collect(self, sprites, overlays):
+        pos = (self.position_x, self.position_y)
         if self.hit_invuln > 0:
             ghost = self.curr_image.copy()
             ghost.set_alpha(70)
-            display.blit(ghost, (self.position_x, self.position_y))
+            sprites.append((ghost, pos))
         else:
-            display.blit(self.curr_image, (self.position_x, self.position_y))
+            sprites.append((self.curr_image, pos))
         if self.has_shield:
             cx = int(self.position_x) + self.curr_image.get_width() // 2
             cy = int(self.position_y) + self.curr_image.get_height() // 2
@@ -319,13 +321,19 @@ class Player:
             sc = r + 2
             pygame.draw.circle(shield_surf, (80, 180, 255, pulse), (sc, sc), r, 3)
             pygame.draw.circle(shield_surf, (180, 220, 255, pulse // 2), (sc, sc), r - 2, 1)
-            display.blit(shield_surf, (cx - sc, cy - sc))
+            sprites.append((shield_surf, (cx - sc, cy - sc)))
         if self.shield_flash > 0:
             self.shield_flash -= 1
         if self.damage_indicator > 0:
-            self._draw_damage_hearts(display)
+            self._collect_damage_hearts(overlays)
+
+    def render(self, display):
+        entries = []
+        self.collect(entries, entries)
+        if entries:
+            display.blits(entries, False)
 
-    def _draw_damage_hearts(self, display):
+    def _collect_damage_hearts(self, overlays):
         hs = 10
         gap = 2
         total_w = MAX_LIVES * (hs + gap) - gap
@@ -340,11 +348,11 @@ class Player:
 
         for i in range(MAX_LIVES):
             hx = start_x + i * (hs + gap)
-            self._draw_tiny_heart(display, hx, y, hs, filled=(i < self.lives),
-                                  alpha=alpha)
+            overlays.append((self._tiny_heart(hs, filled=(i < self.lives), alpha=alpha),
+                             (hx, y)))
 
     @staticmethod
-    def _draw_tiny_heart(display, x, y, size, filled=True, alpha=255):
+    def _tiny_heart(size, filled=True, alpha=255):
         s = size
         r = s // 4
         heart = pygame.Surface((s, s), pygame.SRCALPHA)
@@ -364,8 +372,7 @@ class Player:
         ])
         if highlight:
             pygame.draw.circle(heart, highlight, (hcx - r, r), max(1, r // 2))
-
-        display.blit(heart, (x, y))
+        return heart
 
     def animate(self, delta_time, direction_x, direction_y):
         self.last_frame_update += delta_time
@@ -1,4 +1,6 @@
-import pygame, os, math
+import pygame, math
+
+from engine.surface_cache import SurfaceCache
 
 GLOW_PAD = 6
 
@@ -9,12 +11,17 @@ HOMING_ACQUIRE_RANGE = 400
 
 
 class Projectile(pygame.sprite.Sprite):
-    _base_image = None
+    # Shared (image, mask) per (kind, color, width, height, shiny). Laser
+    # widths depend on the muzzle x, so the cache must stay bounded.
+    templates = SurfaceCache(max_entries=256)
+    # Set by engine.projectile_store when an array store owns this shot's motion.
+    _store = None
+    _slot = None
 
     def __init__(self, color, x, y, game, dx=8, dy=0, wave=None,
                  width=15, height=15, piercing=False, shiny=False,
                  pulse=False, homing=False, fullbeam=False,
-                 lifetime=0, damage=1, owner=None):
+                 lifetime=0, damage=1, owner=None, target=None):
         super().__init__()
         self.game = game
         self.owner = owner
@@ -29,31 +36,44 @@ class Projectile(pygame.sprite.Sprite):
         self.fullbeam = fullbeam
         self.lifetime = lifetime
         self.damage = damage
+        # Optional lock assigned at launch (see HomingMissile); dropped once
+        # the target dies or leaves range.
+        self.target = target
 
         if homing:
-            self.image = self._make_missile(color, width, height, shiny)
+            kind = "missile"
         elif fullbeam:
-            self.image = self._make_fullbeam(color, width, height, shiny)
+            kind = "fullbeam"
         elif pulse:
-            self.image = self._make_pulse(color, width, height, shiny)
+            kind = "pulse"
         elif piercing:
-            self.image = self._make_beam(color, width, height, shiny)
+            kind = "beam"
         else:
-            if Projectile._base_image is None:
-                Projectile._base_image = pygame.image.load(
-                    os.path.join(game.assets_dir, "ammo", "ammo_1.png")
-                ).convert_alpha()
-            self.image = pygame.transform.scale(
-                Projectile._base_image.copy(), (width, height)
-            )
-            self.image.fill(pygame.Color(color), special_flags=pygame.BLEND_RGB_MULT)
-            if shiny:
-                self.image = self._add_glow(self.image, color)
-
-        self.mask = pygame.mask.from_surface(self.image)
+            kind = "bullet"
+        key = (kind, color, width, height, shiny)
+        self.image, self.mask = Projectile.templates.get(
+            key, lambda: self._build_template(game, *key)
+        )
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
 
+    @classmethod
+    def _build_template(cls, game, kind, color, width, height, shiny):
+        if kind == "missile":
+            image = cls._make_missile(color, width, height, shiny)
+        elif kind == "fullbeam":
+            image = cls._make_fullbeam(color, width, height, shiny)
+        elif kind == "pulse":
+            image = cls._make_pulse(color, width, height, shiny)
+        elif kind == "beam":
+            image = cls._make_beam(color, width, height, shiny)
+        else:
+            image = pygame.transform.scale(game.assets.get("ammo"), (width, height))
+            image.fill(pygame.Color(color), special_flags=pygame.BLEND_RGB_MULT)
+            if shiny:
+                image = cls._add_glow(image, color)
+        return image, pygame.mask.from_surface(image)
+
     @staticmethod
     def _add_glow(base, color):
         c = pygame.Color(color)
@@ -183,29 +203,15 @@ class Projectile(pygame.sprite.Sprite):
 
     def _find_homing_target(self, cx, cy):
         """Only lock onto enemy ships or boss within HOMING_ACQUIRE_RANGE."""
-        range_sq = HOMING_ACQUIRE_RANGE ** 2
-        best_dist = float("inf")
-        target = None
-
-        for e in self.game.enemies:
-            if not e.alive_flag:
-                continue
-            dx = e.rect.centerx - cx
-            dy = e.rect.centery - cy
-            d = dx * dx + dy * dy
-            if d < best_dist and d <= range_sq:
-                best_dist = d
-                target = e
-
-        gw = self.game.active_game_world
-        if gw and gw.boss and gw.boss.alive_flag:
-            dx = gw.boss.rect.centerx - cx
-            dy = gw.boss.rect.centery - cy
-            d = dx * dx + dy * dy
-            if d < best_dist and d <= range_sq:
-                target = gw.boss
-
-        return target
+        ships = self.game.targets.ships
+        target = self.target
+        if target is not None:
+            dx = target.rect.centerx - cx
+            dy = target.rect.centery - cy
+            if target in ships and dx * dx + dy * dy <= HOMING_ACQUIRE_RANGE ** 2:
+                return target
+            self.target = None
+        return ships.nearest(cx, cy, HOMING_ACQUIRE_RANGE)
 
     def _steer_homing(self):
         cx, cy = self.rect.centerx, self.rect.centery
@@ -226,6 +232,13 @@ class Projectile(pygame.sprite.Sprite):
         self.dx = speed * math.cos(current)
         self.dy = speed * math.sin(current)
 
+    def nudge(self, dx, dy):
+        """Shift by whole pixels from outside update() (e.g. black-hole pull)."""
+        self.rect.x += dx
+        self.rect.y += dy
+        if self._store is not None:
+            self._store.nudge(self, dx, dy)
+
     def update(self):
         if self.game.paused:
             return
@@ -1,4 +1,9 @@
-import pygame, os, random, math
+import pygame, math
+
+from engine.lensing import LensingRenderer
+from engine.rng import stream
+
+_rng = stream("rocks")
 
 BASIC = "basic"
 CLUSTER = "cluster"
@@ -15,23 +20,41 @@ BH_CONSUME_RADIUS_START = 14
 BH_CONSUME_RADIUS_MAX = 32
 BH_GROWTH_RATE = 0.12
 
+IRON_HP = 3
+
+# Spawn-size ranges ((w_min, w_max), (h_min, h_max)) per regular rock type.
+SPAWN_SIZES = {
+    BASIC: ((12, 55), (12, 50)),
+    CLUSTER: ((50, 80), (45, 75)),
+    IRON: ((40, 70), (38, 65)),
+}
+
+# Rock visuals are baked once per (type, size bucket) and shared: sizes snap
+# to the nearest SIZE_BUCKET pixels and each bucket keeps VARIANTS_PER_BUCKET
+# looks to choose from.
+SIZE_BUCKET = 4
+VARIANTS_PER_BUCKET = 3
+
 
 class Rock(pygame.sprite.Sprite):
     sprites = None
+    # (type, w, h) -> list of (image, mask, {hp: damaged image}); the surfaces
+    # are shared between rocks and must not be drawn onto.
+    variants = {}
+    # Shared by every black hole; set Rock.lensing.quality below 1.0 to
+    # compute the distortion at reduced resolution.
+    lensing = LensingRenderer()
 
     @classmethod
-    def load_sprites(cls, sprite_dir):
-        cls.sprites = []
-        asteroid_dir = os.path.join(sprite_dir, "asteroids")
-        for i in range(1, 5):
-            path = os.path.join(asteroid_dir, f"asteroid_{i}.png")
-            cls.sprites.append(pygame.image.load(path).convert_alpha())
+    def load_sprites(cls, game):
+        cls.sprites = [game.assets.get(f"asteroid_{i}") for i in range(1, 5)]
+        cls.variants = {}
 
     def __init__(self, x, y, width, height, game,
                  rock_type=BASIC, dx=-3, dy=0):
         super().__init__()
         if Rock.sprites is None:
-            Rock.load_sprites(game.sprite_dir)
+            Rock.load_sprites(game)
         self.game = game
         self.rock_type = rock_type
         self.dx = dx
@@ -42,29 +65,20 @@ class Rock(pygame.sprite.Sprite):
         if rock_type == BLACKHOLE:
             self.hp = 999
             self._bh_mass = 0.0
-            self._spin = random.uniform(0, math.pi * 2)
+            self._spin = _rng.uniform(0, math.pi * 2)
             self._rebuild_bh_sprite()
         elif rock_type == IRON:
-            self.hp = 3
+            self.hp = IRON_HP
         else:
             self.hp = 1
         self.max_hp = self.hp
 
         if rock_type != BLACKHOLE:
-            w = max(10, width)
-            h = max(10, height)
-            base_sprite = random.choice(Rock.sprites)
-            self._base_image = pygame.transform.scale(base_sprite, (w, h))
-
-            if rock_type == IRON:
-                self._apply_iron_visual()
-            elif rock_type == CLUSTER:
-                self._apply_cluster_visual()
-
-            self.image = self._base_image.copy()
-
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
+            self._base_image, self.mask, self._damage_stages = (
+                Rock._pick_variant(rock_type, width, height)
+            )
+            self.image = self._base_image
+            self.rect = self.image.get_rect()
         self.rect.center = (x, y)
 
     # ---- black hole properties (scale with consumed mass) ----
@@ -113,68 +127,53 @@ class Rock(pygame.sprite.Sprite):
 
     def draw_blackhole_effects(self, surface):
         """Draw gravitational lensing distortion and dark vignette on canvas."""
-        cx, cy = self.rect.centerx, self.rect.centery
-        cr = self.core_radius
-        gr = int(self.gravity_radius)
-
-        # --- Gravitational lensing: warp the background toward the center ---
-        dist_r = max(30, int(gr * 0.55))
-        sw, sh = surface.get_size()
-        x1 = max(0, cx - dist_r)
-        y1 = max(0, cy - dist_r)
-        x2 = min(sw, cx + dist_r)
-        y2 = min(sh, cy + dist_r)
-        cap_w, cap_h = x2 - x1, y2 - y1
-
-        if cap_w > 8 and cap_h > 8:
-            captured = surface.subsurface((x1, y1, cap_w, cap_h)).copy()
-            lcx, lcy = cx - x1, cy - y1
-
-            layers = [
-                (dist_r,           0.96, 20),
-                (dist_r * 2 // 3,  0.91, 45),
-                (dist_r // 3,      0.84, 75),
-            ]
-            for radius, shrink, alpha in layers:
-                if radius < 4:
-                    continue
-                small_w = max(4, int(cap_w * shrink))
-                small_h = max(4, int(cap_h * shrink))
-                distorted = pygame.transform.smoothscale(
-                    pygame.transform.smoothscale(captured, (small_w, small_h)),
-                    (cap_w, cap_h),
-                )
-                result = pygame.Surface((cap_w, cap_h), pygame.SRCALPHA)
-                result.blit(distorted, (0, 0))
-                mask = pygame.Surface((cap_w, cap_h), pygame.SRCALPHA)
-                pygame.draw.circle(mask, (255, 255, 255, alpha),
-                                   (lcx, lcy), radius)
-                result.blit(mask, (0, 0),
-                            special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(result, (x1, y1))
-
-        # --- Dark vignette (light being swallowed) ---
-        vig_r = cr + 22 + int(12 * self.bh_growth)
-        vig_surf = pygame.Surface((vig_r * 2, vig_r * 2), pygame.SRCALPHA)
-        vc = vig_r
-        step = max(2, vig_r // 9)
-        for i in range(9, 0, -1):
-            r = cr + i * step
-            a = min(220, 12 + (9 - i) * 22)
-            pygame.draw.circle(vig_surf, (3, 0, 8, a), (vc, vc), r)
-        surface.blit(vig_surf, (cx - vc, cy - vc))
-
-        # --- Faint event-horizon ring ---
-        glow_r = cr + 3
-        glow_size = glow_r * 2 + 6
-        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-        gc = glow_r + 3
-        pygame.draw.circle(glow_surf, (50, 12, 100, 35), (gc, gc), glow_r + 2)
-        pygame.draw.circle(glow_surf, (90, 25, 160, 60), (gc, gc), glow_r, 1)
-        surface.blit(glow_surf, (cx - gc, cy - gc))
+        Rock.lensing.draw(surface, self.rect.centerx, self.rect.centery,
+                          self.core_radius, self.gravity_radius, self.bh_growth)
 
     # ---- regular asteroid visuals ----
 
+    @staticmethod
+    def _size_bucket(size):
+        return max(10, (size + SIZE_BUCKET // 2) // SIZE_BUCKET * SIZE_BUCKET)
+
+    @classmethod
+    def _pick_variant(cls, rock_type, width, height):
+        """Shared (image, mask, damage stages) for a rock of this type/size.
+
+        A bucket's pool is filled lazily up to VARIANTS_PER_BUCKET entries;
+        after that spawns only pick one of the baked looks.
+        """
+        key = (rock_type, cls._size_bucket(width), cls._size_bucket(height))
+        pool = cls.variants.get(key)
+        if pool is None:
+            pool = cls.variants[key] = []
+        if len(pool) < VARIANTS_PER_BUCKET:
+            variant = cls._build_variant(*key)
+            pool.append(variant)
+            return variant
+        return _rng.choice(pool)
+
+    @classmethod
+    def _build_variant(cls, rock_type, w, h):
+        image = pygame.transform.scale(_rng.choice(cls.sprites), (w, h))
+        if rock_type == IRON:
+            cls._apply_iron_visual(image)
+        elif rock_type == CLUSTER:
+            cls._apply_cluster_visual(image)
+        mask = pygame.mask.from_surface(image)
+        stages = {}
+        if rock_type == IRON:
+            for hp in range(1, IRON_HP):
+                stages[hp] = cls._damaged_image(image, mask, 1 - hp / IRON_HP)
+        return image, mask, stages
+
+    @classmethod
+    def _damaged_image(cls, base, mask, ratio):
+        image = base.copy()
+        color = (int(220 * ratio), 30, 0, int(120 * ratio))
+        image.blit(cls._shape_tint(mask, color), (0, 0))
+        return image
+
     @staticmethod
     def _shape_tint(mask, color):
         """Create a tint surface that only covers the asteroid's pixels."""
@@ -182,22 +181,23 @@ class Rock(pygame.sprite.Sprite):
             setcolor=color, unsetcolor=(0, 0, 0, 0),
         )
 
-    def _apply_cluster_visual(self):
-        w, h = self._base_image.get_size()
-        mask = pygame.mask.from_surface(self._base_image)
+    @classmethod
+    def _apply_cluster_visual(cls, image):
+        w, h = image.get_size()
+        mask = pygame.mask.from_surface(image)
 
-        self._base_image.blit(self._shape_tint(mask, (180, 70, 10, 90)), (0, 0))
+        image.blit(cls._shape_tint(mask, (180, 70, 10, 90)), (0, 0))
 
         cx, cy = w // 2, h // 2
         cracks = pygame.Surface((w, h), pygame.SRCALPHA)
-        for _ in range(random.randint(3, 5)):
-            x1 = cx + random.randint(-w // 3, w // 3)
-            y1 = cy + random.randint(-h // 3, h // 3)
-            angle = random.uniform(0, 2 * math.pi)
-            length = random.randint(w // 4, w // 2)
+        for _ in range(_rng.randint(3, 5)):
+            x1 = cx + _rng.randint(-w // 3, w // 3)
+            y1 = cy + _rng.randint(-h // 3, h // 3)
+            angle = _rng.uniform(0, 2 * math.pi)
+            length = _rng.randint(w // 4, w // 2)
             x2 = x1 + int(math.cos(angle) * length)
             y2 = y1 + int(math.sin(angle) * length)
-            color = random.choice([
+            color = _rng.choice([
                 (255, 140, 20), (255, 100, 10), (255, 180, 40),
             ])
             pygame.draw.line(cracks, color, (x1, y1), (x2, y2), 2)
@@ -205,42 +205,43 @@ class Rock(pygame.sprite.Sprite):
             setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0),
         )
         cracks.blit(crack_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        self._base_image.blit(cracks, (0, 0))
+        image.blit(cracks, (0, 0))
 
         outline = mask.outline()
         if len(outline) > 2:
             glow = pygame.Surface((w, h), pygame.SRCALPHA)
             pygame.draw.lines(glow, (255, 120, 20, 100), True, outline, 1)
-            self._base_image.blit(glow, (0, 0))
+            image.blit(glow, (0, 0))
 
-        px_arr = pygame.PixelArray(self._base_image)
+        px_arr = pygame.PixelArray(image)
         for _ in range(max(2, w * h // 200)):
-            gx = random.randint(0, w - 1)
-            gy = random.randint(0, h - 1)
+            gx = _rng.randint(0, w - 1)
+            gy = _rng.randint(0, h - 1)
             if mask.get_at((gx, gy)):
-                px_arr[gx, gy] = random.choice([
+                px_arr[gx, gy] = _rng.choice([
                     (255, 200, 50, 255), (255, 160, 30, 255),
                 ])
         del px_arr
 
-    def _apply_iron_visual(self):
-        w, h = self._base_image.get_size()
-        mask = pygame.mask.from_surface(self._base_image)
+    @classmethod
+    def _apply_iron_visual(cls, image):
+        w, h = image.get_size()
+        mask = pygame.mask.from_surface(image)
 
-        self._base_image.blit(self._shape_tint(mask, (140, 160, 190, 130)), (0, 0))
+        image.blit(cls._shape_tint(mask, (140, 160, 190, 130)), (0, 0))
 
         outline = mask.outline()
         if len(outline) > 2:
             border = pygame.Surface((w, h), pygame.SRCALPHA)
             pygame.draw.lines(border, (200, 220, 245, 180), True, outline, 1)
-            self._base_image.blit(border, (0, 0))
+            image.blit(border, (0, 0))
 
-        px_arr = pygame.PixelArray(self._base_image)
+        px_arr = pygame.PixelArray(image)
         for _ in range(max(3, w * h // 120)):
-            sx = random.randint(0, w - 1)
-            sy = random.randint(0, h - 1)
+            sx = _rng.randint(0, w - 1)
+            sy = _rng.randint(0, h - 1)
             if mask.get_at((sx, sy)):
-                px_arr[sx, sy] = random.choice([
+                px_arr[sx, sy] = _rng.choice([
                     (230, 240, 255, 255), (210, 225, 245, 255),
                     (255, 255, 255, 255),
                 ])
@@ -256,12 +257,11 @@ class Rock(pygame.sprite.Sprite):
             self._update_damage_visual()
 
     def _update_damage_visual(self):
-        ratio = 1 - self.hp / self.max_hp
-        self.image = self._base_image.copy()
-        mask = pygame.mask.from_surface(self.image)
-        color = (int(220 * ratio), 30, 0, int(120 * ratio))
-        self.image.blit(self._shape_tint(mask, color), (0, 0))
-        self.mask = mask
+        image = self._damage_stages.get(self.hp)
+        if image is None:
+            image = self._damaged_image(self._base_image, self.mask,
+                                        1 - self.hp / self.max_hp)
+        self.image = image
 
     def update(self):
         self._fx += self.dx
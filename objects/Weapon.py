@@ -1,5 +1,7 @@
 import math
 
+from objects.Projectile import HOMING_ACQUIRE_RANGE
+
 
 class Weapon:
     """Base class for all weapons. Subclass and override get_projectiles().
@@ -100,41 +102,19 @@ class SpreadShot(Weapon):
         return self._FAN[:n]
 
     def _smart_angles(self, x, y, n, game):
-        targets = self._find_targets(x, y, game)
-        if not targets:
-            return self._fan_angles(n)
-
-        targets.sort(key=lambda t: (t.rect.centerx - x) ** 2
-                                   + (t.rect.centery - y) ** 2)
-
+        """Aim at the n nearest rocks (or boss) ahead; fill the rest from the fan."""
+        targets = game.targets.rocks.k_nearest(x, y, n, right_of=x - 50)
         assigned = []
-        used = set()
-        for _ in range(n):
-            for t in targets:
-                tid = id(t)
-                if tid not in used:
-                    a = math.atan2(t.rect.centery - y, t.rect.centerx - x)
-                    a = max(-self._MAX_AIM_ANGLE, min(self._MAX_AIM_ANGLE, a))
-                    assigned.append(a)
-                    used.add(tid)
-                    break
-            else:
-                break
+        for t in targets:
+            a = math.atan2(t.rect.centery - y, t.rect.centerx - x)
+            assigned.append(max(-self._MAX_AIM_ANGLE, min(self._MAX_AIM_ANGLE, a)))
 
+        fan = self._fan_angles(n)
         while len(assigned) < n:
-            fan = self._fan_angles(n)
             assigned.append(fan[len(assigned)])
 
         return assigned
 
-    @staticmethod
-    def _find_targets(x, y, game):
-        targets = [r for r in game.rocks if r.rect.centerx > x - 50]
-        gw = game.active_game_world
-        if gw and gw.boss and gw.boss.alive_flag:
-            targets.append(gw.boss)
-        return targets
-
 
 class LaserCannon(Weapon):
     """Secondary: a single screen-spanning beam. Each level makes it beefier."""
@@ -172,6 +152,9 @@ class HomingMissile(Weapon):
     color = "orange"
     fire_rate = 2.0
     sound_name = "missile"
+    # When True, each salvo is spread over the nearest targets instead of
+    # every missile locking onto its own nearest one (the default).
+    assign_targets = False
 
     def get_projectiles(self, x, y, game=None):
         shiny = self.level >= self.max_level
@@ -190,7 +173,20 @@ class HomingMissile(Weapon):
         if shiny:
             for p in projs:
                 p["shiny"] = True
+        if game is not None and self.assign_targets:
+            self._assign_targets(projs, x, y, game)
         return projs
 
+    @staticmethod
+    def _assign_targets(projs, x, y, game):
+        """Pair missiles and targets top to bottom so their paths don't cross."""
+        targets = game.targets.ships.k_nearest(x, y, len(projs), HOMING_ACQUIRE_RANGE)
+        if not targets:
+            return
+        targets.sort(key=lambda t: t.rect.centery)
+        ordered = sorted(projs, key=lambda p: (p["y"], p["dy"]))
+        for i, p in enumerate(ordered):
+            p["target"] = targets[i * len(targets) // len(ordered)]
+
 
 SECONDARY_WEAPONS = [SpreadShot, LaserCannon, HomingMissile]
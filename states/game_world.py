@@ -1,11 +1,19 @@
-import pygame, random, math
+import pygame, math
+import numpy as np
 from states.state import State
-from objects.Rocks import Rock, BASIC, CLUSTER, IRON, BLACKHOLE
+from objects.Rocks import Rock, BASIC, CLUSTER, IRON, BLACKHOLE, SPAWN_SIZES
 from objects.Pickup import UpgradePickup, ShieldPickup
 from objects.Weapon import StraightCannon, SECONDARY_WEAPONS
-from objects.Boss import Boss, BossProjectile, BOSS_BASE_HP
+from objects.Boss import Boss, BossProjectile, BOSS_BASE_HP, MAX_ATTACK_LEVEL
+from objects.bullet_patterns import PLAYER_HIT_RADIUS
 from objects.Enemy import Drone, Fighter, Striker, ENEMY_TYPES
 from objects.Player import PLAYER_CENTER_OFFSET_X, PLAYER_CENTER_OFFSET_Y, MAX_LIVES
+from engine.particles import ParticleSystem
+from engine.spatial_hash import SpatialHash, groupcollide, player_rect
+from engine.rng import stream
+from engine.dirty import mark
+
+_rng = stream("spawns")
 
 BASE_UPGRADE_CHANCE = 0.07
 UPGRADE_CHANCE_DECAY = 0.35
@@ -41,35 +49,13 @@ FORMATION_TIERS = [
 ]
 
 
-class Particle:
-    def __init__(self, x, y):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(60, 220)
-        self.x, self.y = float(x), float(y)
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
-        self.lifetime = random.uniform(0.25, 0.5)
-        self.age = 0
-        self.color = random.choice([
-            (255, 200, 50), (255, 150, 30), (255, 100, 20),
-            (200, 180, 160), (180, 160, 140),
-        ])
-        self.size = random.uniform(2, 5)
-
-    def update(self, dt):
-        self.x += self.dx * dt
-        self.y += self.dy * dt
-        self.age += dt
-        return self.age < self.lifetime
-
-    def draw(self, surface):
-        remaining = 1 - self.age / self.lifetime
-        size = max(1, int(self.size * remaining))
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), size)
-
-
 SUCKIN_DURATION = 0.8
 
+# Loader jobs the first gameplay frame needs; the boss sprite waits for the
+# boss countdown.
+WORLD_ASSETS = ("sounds", "ammo", "asteroid_1", "asteroid_2", "asteroid_3",
+                "asteroid_4")
+
 
 class SuckInEffect:
     """Animated effect: a ship sprite spirals and shrinks into a black hole."""
@@ -87,7 +73,7 @@ class SuckInEffect:
         self.age += dt
         return self.age < SUCKIN_DURATION
 
-    def draw(self, surface):
+    def collect(self, sink):
         t = min(1.0, self.age / SUCKIN_DURATION)
         ease = t * t * (3 - 2 * t)
 
@@ -105,13 +91,19 @@ class SuckInEffect:
         alpha = max(0, int(255 * (1.0 - ease * ease)))
         rotated.set_alpha(alpha)
 
-        rect = rotated.get_rect(center=(int(x), int(y)))
-        surface.blit(rotated, rect)
+        sink.append((rotated, rotated.get_rect(center=(int(x), int(y)))))
+
+    def draw(self, surface):
+        entries = []
+        self.collect(entries)
+        if entries:
+            surface.blits(entries, False)
 
 
 class Game_World(State):
     def __init__(self, game, game_mode="endless", level_num=0):
         State.__init__(self, game)
+        self.game.require_assets(*WORLD_ASSETS)
         self.game.active_game_world = self
         self.game_mode = game_mode
         self.level_num = level_num
@@ -123,7 +115,10 @@ class Game_World(State):
         self.level_won = False
         self.is_new_record = False
         self.asteroids_killed = 0
-        self.particles = []
+        self.particles = ParticleSystem(seed=stream("particles").getrandbits(64))
+        self.effects = []
+        self._hud_layers = {}
+        self.game.profiler.begin_session(game_mode)
 
         self.upgrade_count = 0
         self.upgrade_msg = ""
@@ -143,6 +138,14 @@ class Game_World(State):
         self.enemy_spawn_interval = ENEMY_SPAWN_INTERVAL
         self._enemies_started = False
 
+        # Broadphase grids, each rebuilt once per frame by the pass that owns it
+        self.rock_grid = SpatialHash()
+        self.enemy_grid = SpatialHash()
+        self.enemy_projectile_grid = SpatialHash()
+        self.pickup_grid = SpatialHash()
+        self.boss_projectile_grid = SpatialHash()
+        self.destroyable_grid = SpatialHash()
+
         self.game.rocks.empty()
         self.game.projectiles.empty()
         self.game.pickups.empty()
@@ -164,6 +167,9 @@ class Game_World(State):
             self.game.rocks.add(
                 Rock(bh_x, bh_y, 16, 16, self.game, rock_type=BLACKHOLE, dx=-0.75)
             )
+        if self.game_mode == "boss_challenge":
+            # The boss enters on the first frame, with no countdown to load in.
+            self.game.music.preload("boss")
         self.game.play_music("game")
 
     # ---- asteroid type selection ----
@@ -178,7 +184,7 @@ class Game_World(State):
         cluster_w = min(0.35, max(0, (t - 20) * 0.006))
         iron_w = min(0.30, max(0, (t - 45) * 0.004))
         bh_w = min(0.04, max(0, (t - 70) * 0.0005))
-        r = random.random()
+        r = _rng.random()
         if r < bh_w:
             return BLACKHOLE
         r2 = (r - bh_w) / (1 - bh_w) if bh_w < 1 else 0
@@ -194,16 +200,16 @@ class Game_World(State):
             return BASIC
         elif self.level_num == 2:
             cluster_w = 0.15 + min(0.40, t * 0.005)
-            if random.random() < cluster_w:
+            if _rng.random() < cluster_w:
                 return CLUSTER
             return BASIC
         else:
             bh_w = min(0.03, max(0, (t - 50) * 0.0004))
-            if random.random() < bh_w:
+            if _rng.random() < bh_w:
                 return BLACKHOLE
             cluster_w = 0.20 + min(0.30, t * 0.004)
             iron_w = 0.10 + min(0.25, t * 0.003)
-            r = random.random()
+            r = _rng.random()
             if r < 1 - cluster_w - iron_w:
                 return BASIC
             if r < 1 - iron_w:
@@ -212,24 +218,21 @@ class Game_World(State):
 
     def _spawn_asteroid(self):
         rtype = self._pick_asteroid_type()
-        x = self.game.GAME_WIDTH + random.randint(0, 200)
-        y = random.randint(25, self.game.GAME_HEIGHT - 25)
+        x = self.game.GAME_WIDTH + _rng.randint(0, 200)
+        y = _rng.randint(25, self.game.GAME_HEIGHT - 25)
         if rtype == BLACKHOLE:
-            dx = random.uniform(-1.8, -0.9)
+            dx = _rng.uniform(-1.8, -0.9)
             self.game.rocks.add(Rock(x, y, 16, 16, self.game, rock_type=rtype, dx=dx))
             return
+        (w_min, w_max), (h_min, h_max) = SPAWN_SIZES[rtype]
+        w = _rng.randint(w_min, w_max)
+        h = _rng.randint(h_min, h_max)
         if rtype == CLUSTER:
-            w = random.randint(50, 80)
-            h = random.randint(45, 75)
-            dx = random.uniform(-3.0, -1.5)
+            dx = _rng.uniform(-3.0, -1.5)
         elif rtype == IRON:
-            w = random.randint(40, 70)
-            h = random.randint(38, 65)
-            dx = random.uniform(-2.0, -1.0)
+            dx = _rng.uniform(-2.0, -1.0)
         else:
-            w = random.randint(12, 55)
-            h = random.randint(12, 50)
-            dx = random.uniform(-4.0, -2.0)
+            dx = _rng.uniform(-4.0, -2.0)
         self.game.rocks.add(Rock(x, y, w, h, self.game, rock_type=rtype, dx=dx))
 
     def _max_rocks(self):
@@ -258,90 +261,155 @@ class Game_World(State):
         if len(self.game.rocks) >= self._max_rocks():
             return
         cx, cy = rock.rect.centerx, rock.rect.centery
-        for _ in range(random.randint(2, 3)):
-            dx = random.randint(-6, -2)
-            dy = random.randint(-4, 4)
-            sz = random.randint(10, 18)
+        for _ in range(_rng.randint(2, 3)):
+            dx = _rng.randint(-6, -2)
+            dy = _rng.randint(-4, 4)
+            sz = _rng.randint(10, 18)
             frag = Rock(cx, cy, sz, sz, self.game, rock_type=BASIC, dx=dx, dy=dy)
             self.game.rocks.add(frag)
+            self.rock_grid.insert(frag)
 
     # ---- black hole gravity ----
 
+    @staticmethod
+    def _bh_pull(bcx, bcy, xs, ys, live, radius, strength, power=1):
+        """Pull of one black hole on a batch of points.
+
+        Returns (move_x, move_y, dist); the move is zero for dead points and
+        points outside radius.  Same falloff and operation order as the old
+        per-entity loops: strength * (1 - dist / radius) ** power.
+        """
+        dx = bcx - xs
+        dy = bcy - ys
+        dist = np.maximum(1.0, np.hypot(dx, dy))
+        inside = live & (dist < radius)
+        pull = np.where(inside, strength * (1 - dist / radius) ** power, 0.0)
+        return pull * dx / dist, pull * dy / dist, dist
+
     def _update_black_hole_gravity(self, dt):
-        black_holes = [r for r in self.game.rocks if r.rock_type == BLACKHOLE]
+        black_holes = list(self.game.rocks.partition("blackholes"))
         if not black_holes:
             return
 
+        # Gather every attracted entity once.  Black holes are then applied in
+        # order over these arrays, each one seeing the pull of the previous
+        # ones as before, and positions are written back once at the end.
+        projs = list(self.game.projectiles)
+        pr_x = np.array([p.rect.centerx for p in projs], dtype=float)
+        pr_y = np.array([p.rect.centery for p in projs], dtype=float)
+        pr_x0, pr_y0 = pr_x.copy(), pr_y.copy()
+        pr_live = np.ones(len(projs), dtype=bool)
+
+        eprojs = list(self.game.enemy_projectiles)
+        ep_x = np.array([p.rect.centerx for p in eprojs], dtype=float)
+        ep_y = np.array([p.rect.centery for p in eprojs], dtype=float)
+        ep_live = np.ones(len(eprojs), dtype=bool)
+
+        pickups = list(self.game.pickups)
+        pk_x = np.array([p._fx for p in pickups], dtype=float)
+        pk_y = np.array([p._fy for p in pickups], dtype=float)
+        pk_base_y = np.array([p._base_fy for p in pickups], dtype=float)
+        pk_live = np.ones(len(pickups), dtype=bool)
+
+        rocks = list(self.game.rocks.partition("solid"))
+        rk_x = np.array([r._fx for r in rocks], dtype=float)
+        rk_y = np.array([r._fy for r in rocks], dtype=float)
+        rk_live = np.ones(len(rocks), dtype=bool)
+
         for bh in black_holes:
             bcx, bcy = bh._fx, bh._fy
             gr = bh.gravity_radius
             gs = bh.gravity_strength
             eat_r = bh.consume_radius
-
-            for player in self.game.players:
-                if not player.alive:
-                    continue
-                dx = bcx - player.position_x
-                dy = bcy - player.position_y
-                dist = max(1.0, math.hypot(dx, dy))
-                if dist < eat_r + 4:
-                    self._kill_player_blackhole(player, bh)
-                    continue
-                if dist < gr:
-                    pull = gs * dt * (1 - dist / gr) ** 2
-                    player.position_x += pull * dx / dist
-                    player.position_y += pull * dy / dist
-
-            for proj in list(self.game.projectiles):
-                dx = bcx - proj.rect.centerx
-                dy = bcy - proj.rect.centery
-                dist = max(1.0, math.hypot(dx, dy))
-                if dist < gr:
-                    pull = gs * 0.7 * dt * (1 - dist / gr)
-                    proj.rect.x += int(pull * dx / dist)
-                    proj.rect.y += int(pull * dy / dist)
-                if dist < eat_r:
-                    proj.kill()
-                    bh.feed(0.3)
-
-            for proj in list(self.game.enemy_projectiles):
-                dx = bcx - proj.rect.centerx
-                dy = bcy - proj.rect.centery
-                dist = max(1.0, math.hypot(dx, dy))
-                if dist < gr:
-                    pull = gs * 0.7 * dt * (1 - dist / gr)
-                    proj.rect.x += int(pull * dx / dist)
-                    proj.rect.y += int(pull * dy / dist)
-                if dist < eat_r:
-                    proj.kill()
-                    bh.feed(0.3)
-
-            for pickup in list(self.game.pickups):
-                dx = bcx - pickup._fx
-                dy = bcy - pickup._fy
-                dist = max(1.0, math.hypot(dx, dy))
-                if dist < gr:
-                    pull = gs * 0.8 * dt * (1 - dist / gr)
-                    pickup._fx += pull * dx / dist
-                    pickup._base_fy += pull * dy / dist
-                if dist < eat_r:
-                    pickup.kill()
-                    bh.feed(0.5)
-
-            for rock in list(self.game.rocks):
-                if rock is bh or rock.rock_type == BLACKHOLE:
-                    continue
-                dx = bcx - rock._fx
-                dy = bcy - rock._fy
-                dist = max(1.0, math.hypot(dx, dy))
-                if dist < gr * 0.8:
-                    pull = gs * 0.4 * dt * (1 - dist / (gr * 0.8))
-                    rock._fx += pull * dx / dist
-                    rock._fy += pull * dy / dist
-                if dist < eat_r + 10:
+            fed = 0.0
+
+            # Players are few and can be killed mid-pass, so they are read
+            # and written per black hole.
+            players = [p for p in self.game.players if p.alive]
+            if players:
+                xs = np.array([p.position_x for p in players], dtype=float)
+                ys = np.array([p.position_y for p in players], dtype=float)
+                mx, my, dist = self._bh_pull(bcx, bcy, xs, ys, True, gr, gs * dt, 2)
+                eaten = dist < eat_r + 4
+                for player, eat, px, py in zip(players, eaten.tolist(),
+                                               mx.tolist(), my.tolist()):
+                    if eat:
+                        self._kill_player_blackhole(player, bh)
+                    elif px or py:
+                        player.position_x += px
+                        player.position_y += py
+
+            if projs:
+                mx, my, dist = self._bh_pull(bcx, bcy, pr_x, pr_y, pr_live,
+                                             gr, gs * 0.7 * dt)
+                pr_x += np.trunc(mx)
+                pr_y += np.trunc(my)
+                eaten = pr_live & (dist < eat_r)
+                pr_live &= ~eaten
+                fed += 0.3 * np.count_nonzero(eaten)
+
+            if eprojs:
+                mx, my, dist = self._bh_pull(bcx, bcy, ep_x, ep_y, ep_live,
+                                             gr, gs * 0.7 * dt)
+                ep_x += np.trunc(mx)
+                ep_y += np.trunc(my)
+                eaten = ep_live & (dist < eat_r)
+                ep_live &= ~eaten
+                fed += 0.3 * np.count_nonzero(eaten)
+
+            if pickups:
+                # Pickups are measured at their bobbing _fy but pulled through
+                # _base_fy, so only the x position moves between black holes.
+                mx, my, dist = self._bh_pull(bcx, bcy, pk_x, pk_y, pk_live,
+                                             gr, gs * 0.8 * dt)
+                pk_x += mx
+                pk_base_y += my
+                eaten = pk_live & (dist < eat_r)
+                pk_live &= ~eaten
+                fed += 0.5 * np.count_nonzero(eaten)
+
+            if rocks:
+                mx, my, dist = self._bh_pull(bcx, bcy, rk_x, rk_y, rk_live,
+                                             gr * 0.8, gs * 0.4 * dt)
+                rk_x += mx
+                rk_y += my
+                eaten = rk_live & (dist < eat_r + 10)
+                rk_live &= ~eaten
+                for i in np.flatnonzero(eaten).tolist():
+                    rock = rocks[i]
                     self.spawn_particles(rock.rect.centerx, rock.rect.centery, count=5)
                     rock.kill()
-                    bh.feed(1.0)
+                fed += 1.0 * np.count_nonzero(eaten)
+
+            if fed:
+                bh.feed(fed)
+
+        pr_dx = (pr_x - pr_x0).astype(int).tolist()
+        pr_dy = (pr_y - pr_y0).astype(int).tolist()
+        for proj, mx, my, live in zip(projs, pr_dx, pr_dy, pr_live.tolist()):
+            if not live:
+                proj.kill()
+            elif mx or my:
+                proj.nudge(mx, my)
+        for proj, x, y, live in zip(eprojs, ep_x.tolist(), ep_y.tolist(),
+                                    ep_live.tolist()):
+            if not live:
+                proj.kill()
+            else:
+                proj.rect.move_ip(int(x) - proj.rect.centerx,
+                                  int(y) - proj.rect.centery)
+        for pickup, x, base_y, live in zip(pickups, pk_x.tolist(),
+                                           pk_base_y.tolist(), pk_live.tolist()):
+            if not live:
+                pickup.kill()
+            else:
+                pickup._fx = x
+                pickup._base_fy = base_y
+        for rock, x, y, live in zip(rocks, rk_x.tolist(), rk_y.tolist(),
+                                    rk_live.tolist()):
+            if live:
+                rock._fx = x
+                rock._fy = y
 
     # ---- upgrade helpers ----
 
@@ -349,17 +417,17 @@ class Game_World(State):
         return BASE_UPGRADE_CHANCE / (1 + self.upgrade_count * UPGRADE_CHANCE_DECAY)
 
     def _should_spawn_upgrade(self):
-        return random.random() < self._upgrade_chance()
+        return _rng.random() < self._upgrade_chance()
 
     def _should_spawn_enemy_upgrade(self):
-        return random.random() < ENEMY_UPGRADE_CHANCE
+        return _rng.random() < ENEMY_UPGRADE_CHANCE
 
     @staticmethod
     def _random_enemy_pickup_type():
         """Enemies can drop primary or secondary upgrades."""
-        if random.random() < (1 - ENEMY_SECONDARY_WEIGHT):
+        if _rng.random() < (1 - ENEMY_SECONDARY_WEIGHT):
             return None
-        return random.choice(SECONDARY_WEAPONS)
+        return _rng.choice(SECONDARY_WEAPONS)
 
     def _apply_upgrade(self, pickup, player):
         weapon_cls = pickup.weapon_cls
@@ -398,7 +466,7 @@ class Game_World(State):
             return False
         if self.total_kills_ever == 1:
             return True
-        return random.random() < self._shield_chance()
+        return _rng.random() < self._shield_chance()
 
     # ---- boss helpers ----
 
@@ -414,7 +482,7 @@ class Game_World(State):
             return 4
         if self.game_mode == "level":
             return self.level_num
-        return min(self.boss_encounter + 1, 4)
+        return min(self.boss_encounter + 1, MAX_ATTACK_LEVEL)
 
     def _boss_hp(self):
         if self.game_mode == "boss_challenge":
@@ -427,6 +495,8 @@ class Game_World(State):
         """Stop spawning and start the countdown before the boss enters."""
         self.boss_phase = True
         self._boss_challenge_started = True
+        self.game.require_assets("boss")
+        self.game.music.preload("boss")
         if self.game_mode == "boss_challenge":
             self.boss_countdown = 0
             self._start_boss()
@@ -439,6 +509,7 @@ class Game_World(State):
         self.boss = Boss(self.game,
                          attack_level=self._boss_attack_level(),
                          hp_override=self._boss_hp())
+        self.game.play_music("boss")
 
     def _on_boss_defeated(self):
         from objects.Player import HIT_INVULN_DURATION
@@ -446,6 +517,8 @@ class Game_World(State):
         self.game.play_boss_death_sound()
         self.boss.boss_projectiles.empty()
         self.boss.boss_lasers.clear()
+        self.boss.bullets.clear()
+        self.boss.patterns.clear()
         self.boss = None
         self.boss_phase = False
         self.boss_encounter += 1
@@ -468,10 +541,8 @@ class Game_World(State):
     # ---- enemies ----
 
     def _count_enemies_by_type(self):
-        drones = sum(1 for e in self.game.enemies if isinstance(e, Drone))
-        fighters = sum(1 for e in self.game.enemies if isinstance(e, Fighter))
-        strikers = sum(1 for e in self.game.enemies if isinstance(e, Striker))
-        return drones, fighters, strikers
+        enemies = self.game.enemies
+        return enemies.count("Drone"), enemies.count("Fighter"), enemies.count("Striker")
 
     def _spawn_enemy(self):
         drones, fighters, strikers = self._count_enemies_by_type()
@@ -482,7 +553,7 @@ class Game_World(State):
         can_striker = (self.elapsed_time >= STRIKER_UNLOCK_TIME
                        and strikers < STRIKER_MAX)
 
-        if can_drone and random.random() < DRONE_WAVE_CHANCE:
+        if can_drone and _rng.random() < DRONE_WAVE_CHANCE:
             self._spawn_drone_wave()
             return
 
@@ -496,9 +567,9 @@ class Game_World(State):
         if not candidates:
             return
 
-        enemy_cls = random.choices(candidates, weights=weights)[0]
+        enemy_cls = _rng.choices(candidates, weights=weights)[0]
         x = self.game.GAME_WIDTH + 40
-        y = random.randint(40, self.game.GAME_HEIGHT - 40)
+        y = _rng.randint(40, self.game.GAME_HEIGHT - 40)
         self.game.enemies.add(enemy_cls(x, y, self.game))
 
     def _formation_tier(self):
@@ -508,13 +579,13 @@ class Game_World(State):
         return TIER1_PATTERNS, 3, 5
 
     def _spawn_drone_wave(self):
-        drones_now = sum(1 for e in self.game.enemies if isinstance(e, Drone))
+        drones_now = self.game.enemies.count("Drone")
         slots = DRONE_MAX - drones_now
         patterns, wave_min, wave_max = self._formation_tier()
-        count = min(random.randint(wave_min, wave_max), slots)
+        count = min(_rng.randint(wave_min, wave_max), slots)
         if count <= 0:
             return
-        pattern = random.choice(patterns)
+        pattern = _rng.choice(patterns)
 
         W = self.game.GAME_WIDTH
         H = self.game.GAME_HEIGHT
@@ -522,19 +593,19 @@ class Game_World(State):
         sx, sy = 40, 30
 
         if pattern == "line":
-            base_y = random.randint(60, H - 60)
+            base_y = _rng.randint(60, H - 60)
             for i in range(count):
                 self._add_drone(base_x + i * sx, base_y)
 
         elif pattern == "v":
-            base_y = random.randint(80, H - 80)
+            base_y = _rng.randint(80, H - 80)
             for i in range(count):
                 row = abs(i - count // 2)
                 dy = (i - count // 2) * sy
                 self._add_drone(base_x + row * sx, base_y + dy)
 
         elif pattern == "diagonal":
-            base_y = random.randint(60, H - 60)
+            base_y = _rng.randint(60, H - 60)
             for i in range(count):
                 dy = i * sy - (count * sy) // 2
                 self._add_drone(base_x + i * sx, base_y + dy)
@@ -545,13 +616,13 @@ class Game_World(State):
                 self._add_drone(base_x, base_y + i * sy)
 
         elif pattern == "stagger":
-            base_y = random.randint(80, H - 80)
+            base_y = _rng.randint(80, H - 80)
             for i in range(count):
                 offset_y = ((-1) ** i) * ((i + 1) // 2) * sy
                 self._add_drone(base_x + i * sx, base_y + offset_y)
 
         elif pattern == "arrow":
-            base_y = random.randint(80, H - 80)
+            base_y = _rng.randint(80, H - 80)
             for i in range(count):
                 mid = count // 2
                 if i <= mid:
@@ -565,8 +636,8 @@ class Game_World(State):
         elif pattern == "pincer":
             half = count // 2
             remainder = count - half
-            top_y = random.randint(30, 80)
-            bot_y = random.randint(H - 80, H - 30)
+            top_y = _rng.randint(30, 80)
+            bot_y = _rng.randint(H - 80, H - 30)
             mid_y = H // 2
             fly_dy_top = (mid_y - top_y) / ((W + 80) / 150) * 0.5
             fly_dy_bot = (mid_y - bot_y) / ((W + 80) / 150) * 0.5
@@ -587,8 +658,8 @@ class Game_World(State):
         elif pattern == "cross":
             half = count // 2
             remainder = count - half
-            top_y = random.randint(30, 60)
-            bot_y = random.randint(H - 60, H - 30)
+            top_y = _rng.randint(30, 60)
+            bot_y = _rng.randint(H - 60, H - 30)
             cross_dy = (H // 2 - top_y) / ((W + 80) / 150) * 0.7
             for i in range(half):
                 self._add_drone(base_x + i * sx, top_y, dy=cross_dy)
@@ -602,20 +673,17 @@ class Game_World(State):
 
     def _update_enemy_combat(self):
         """Player projectiles vs enemies (HP-based, same pattern as rocks)."""
+        self.enemy_grid.rebuild(self.game.enemies)
         if not self.game.enemies:
             return
 
-        normal_group = pygame.sprite.Group()
-        piercing_group = pygame.sprite.Group()
-        for p in self.game.projectiles:
-            (piercing_group if p.piercing else normal_group).add(p)
-
-        hits_normal = pygame.sprite.groupcollide(
-            normal_group, self.game.enemies, True, False,
+        projectiles = self.game.projectiles
+        hits_normal = groupcollide(
+            projectiles.partition("normal"), self.enemy_grid, True, False,
             collided=pygame.sprite.collide_mask,
         )
-        hits_piercing = pygame.sprite.groupcollide(
-            piercing_group, self.game.enemies, False, False,
+        hits_piercing = groupcollide(
+            projectiles.partition("piercing"), self.enemy_grid, False, False,
             collided=pygame.sprite.collide_mask,
         )
 
@@ -661,10 +729,11 @@ class Game_World(State):
 
     def _update_projectile_vs_projectile(self):
         """Player projectiles destroy enemy projectiles on contact."""
+        self.enemy_projectile_grid.rebuild(self.game.enemy_projectiles)
         if not self.game.enemy_projectiles or not self.game.projectiles:
             return
-        hits = pygame.sprite.groupcollide(
-            self.game.projectiles, self.game.enemy_projectiles,
+        hits = groupcollide(
+            self.game.projectiles, self.enemy_projectile_grid,
             False, True,
             collided=pygame.sprite.collide_mask,
         )
@@ -679,20 +748,16 @@ class Game_World(State):
             return
 
         # Player projectiles vs boss (play hit sound at most once per frame)
-        normal_group = pygame.sprite.Group()
-        piercing_group = pygame.sprite.Group()
-        for p in self.game.projectiles:
-            (piercing_group if p.piercing else normal_group).add(p)
-
+        projectiles = self.game.projectiles
         boss_hit_this_frame = False
-        for proj in list(normal_group):
+        for proj in list(projectiles.partition("normal")):
             offset = (self.boss.rect.x - proj.rect.x, self.boss.rect.y - proj.rect.y)
             if proj.mask.overlap(self.boss.mask, offset):
                 if self.boss.take_damage(getattr(proj, "damage", 1)):
                     boss_hit_this_frame = True
                 proj.kill()
 
-        for proj in list(piercing_group):
+        for proj in list(projectiles.partition("piercing")):
             offset = (self.boss.rect.x - proj.rect.x, self.boss.rect.y - proj.rect.y)
             if proj.mask.overlap(self.boss.mask, offset):
                 if self.boss.take_damage(getattr(proj, "damage", 1)):
@@ -703,8 +768,8 @@ class Game_World(State):
 
         for _drop_t in self.boss.pop_pending_drops():
             drop_x = self.boss.rect.left - 20
-            drop_y = self.boss.rect.centery + random.randint(-40, 40)
-            wtype = random.choice(SECONDARY_WEAPONS)
+            drop_y = self.boss.rect.centery + _rng.randint(-40, 40)
+            wtype = _rng.choice(SECONDARY_WEAPONS)
             self.game.pickups.add(
                 UpgradePickup(drop_x, drop_y, wtype, self.game)
             )
@@ -713,20 +778,21 @@ class Game_World(State):
             self.game.play_sound("powerup")
 
         # Player projectiles vs destroyable boss projectiles
-        destroyable = pygame.sprite.Group(
-            [bp for bp in self.boss.boss_projectiles if bp.destroyable]
-        )
-        pygame.sprite.groupcollide(
-            self.game.projectiles, destroyable, True, True,
+        self.destroyable_grid.rebuild(self.boss.boss_projectiles.partition("destroyable"))
+        groupcollide(
+            self.game.projectiles, self.destroyable_grid, True, True,
             collided=pygame.sprite.collide_mask,
         )
 
         # Boss projectiles vs players
+        self.boss_projectile_grid.rebuild(self.boss.boss_projectiles)
         for player in self.game.players:
             if not player.alive:
                 continue
             px, py = int(player.position_x), int(player.position_y)
-            for bp in list(self.boss.boss_projectiles):
+            for bp in self.boss_projectile_grid.query(player_rect(player)):
+                if not bp.alive():
+                    continue
                 if player.hit_invuln > 0:
                     break
                 offset = (bp.rect.x - px, bp.rect.y - py)
@@ -735,6 +801,13 @@ class Game_World(State):
                     if not self._damage_player(player) and self.game_over:
                         return
 
+            # Bullet-field bullets vs player hitbox
+            if player.alive and player.hit_invuln <= 0 and self.boss.bullets.collide_circle(
+                    px + PLAYER_CENTER_OFFSET_X, py + PLAYER_CENTER_OFFSET_Y,
+                    PLAYER_HIT_RADIUS):
+                if not self._damage_player(player) and self.game_over:
+                    return
+
             # Boss lasers vs player
             if not player.alive or player.hit_invuln > 0:
                 continue
@@ -794,7 +867,7 @@ class Game_World(State):
         """Insta-kill: black hole swallows the player regardless of shield/lives."""
         px = int(player.position_x) + PLAYER_CENTER_OFFSET_X
         py = int(player.position_y) + PLAYER_CENTER_OFFSET_Y
-        self.particles.append(
+        self.effects.append(
             SuckInEffect(player.curr_image, px, py, bh._fx, bh._fy)
         )
         player.has_shield = False
@@ -820,13 +893,15 @@ class Game_World(State):
     # ---- particles ----
 
     def spawn_particles(self, x, y, count=8):
-        for _ in range(count):
-            self.particles.append(Particle(x, y))
+        self.particles.spawn(x, y, count)
 
     # ---- main loop ----
 
     def update(self, delta_time, actions):
-        self.particles = [p for p in self.particles if p.update(delta_time)]
+        profiler = self.game.profiler
+        self.particles.update(delta_time)
+        self.effects = [e for e in self.effects if e.update(delta_time)]
+        profiler.lap("update.particles")
 
         if self.upgrade_msg_timer > 0:
             self.upgrade_msg_timer -= delta_time
@@ -868,6 +943,7 @@ class Game_World(State):
             if not self.boss.alive_flag:
                 self._on_boss_defeated()
                 return
+        profiler.lap("update.boss")
 
         # Rock spawning (paused during boss and boss_challenge)
         if not self.boss_phase and self.game_mode != "boss_challenge":
@@ -896,31 +972,34 @@ class Game_World(State):
                         ENEMY_MIN_INTERVAL,
                         self.enemy_spawn_interval - ENEMY_INTERVAL_DECAY,
                     )
+        profiler.lap("update.spawn")
 
         for enemy in self.game.enemies:
             enemy.update(delta_time)
+        profiler.lap("update.enemies")
 
         self.game.rocks.update()
+        profiler.lap("update.rocks")
         self._update_black_hole_gravity(delta_time)
+        profiler.lap("update.gravity")
 
         # --- Player projectiles vs enemy projectiles ---
         self._update_projectile_vs_projectile()
+        profiler.lap("collide.proj_vs_proj")
 
         # --- Projectile-enemy collisions ---
         self._update_enemy_combat()
+        profiler.lap("collide.enemies")
 
         # --- Projectile-rock collisions (HP-based) ---
-        normal_group = pygame.sprite.Group()
-        piercing_group = pygame.sprite.Group()
-        for p in self.game.projectiles:
-            (piercing_group if p.piercing else normal_group).add(p)
-
-        hits_normal = pygame.sprite.groupcollide(
-            normal_group, self.game.rocks, True, False,
+        self.rock_grid.rebuild(self.game.rocks)
+        projectiles = self.game.projectiles
+        hits_normal = groupcollide(
+            projectiles.partition("normal"), self.rock_grid, True, False,
             collided=pygame.sprite.collide_mask,
         )
-        hits_piercing = pygame.sprite.groupcollide(
-            piercing_group, self.game.rocks, False, False,
+        hits_piercing = groupcollide(
+            projectiles.partition("piercing"), self.rock_grid, False, False,
             collided=pygame.sprite.collide_mask,
         )
 
@@ -968,13 +1047,17 @@ class Game_World(State):
                 )
         if destroyed:
             self.game.play_sound("explosion")
+        profiler.lap("collide.rocks")
 
         # Pickup collection (mask-based)
+        self.pickup_grid.rebuild(self.game.pickups)
         for player in self.game.players:
             if not player.alive:
                 continue
             px, py = int(player.position_x), int(player.position_y)
-            for pickup in list(self.game.pickups):
+            for pickup in self.pickup_grid.query(player_rect(player)):
+                if not pickup.alive():
+                    continue
                 offset = (pickup.rect.x - px, pickup.rect.y - py)
                 if player.mask.overlap(pickup.mask, offset):
                     if pickup.pickup_type == "shield":
@@ -986,13 +1069,16 @@ class Game_World(State):
                         self._apply_upgrade(pickup, player)
                     self.game.play_sound("powerup")
                     pickup.kill()
+        profiler.lap("collide.pickups")
 
         # Player-rock collision
         for player in self.game.players:
             if not player.alive or player.hit_invuln > 0:
                 continue
             px, py = int(player.position_x), int(player.position_y)
-            for rock in list(self.game.rocks):
+            for rock in self.rock_grid.query(player_rect(player)):
+                if not rock.alive():
+                    continue
                 offset = (rock.rect.x - px, rock.rect.y - py)
                 if player.mask.overlap(rock.mask, offset):
                     if rock.rock_type == BLACKHOLE:
@@ -1008,13 +1094,16 @@ class Game_World(State):
                         continue
                     self._damage_player(player)
                     break
+        profiler.lap("collide.player_rocks")
 
         # Enemy projectile vs player / Enemy body vs player
         for player in self.game.players:
             if not player.alive:
                 continue
             px, py = int(player.position_x), int(player.position_y)
-            for ep in list(self.game.enemy_projectiles):
+            for ep in self.enemy_projectile_grid.query(player_rect(player)):
+                if not ep.alive():
+                    continue
                 if player.hit_invuln > 0:
                     break
                 offset = (ep.rect.x - px, ep.rect.y - py)
@@ -1023,13 +1112,14 @@ class Game_World(State):
                     if not self._damage_player(player) and self.game_over:
                         return
 
-            for enemy in list(self.game.enemies):
+            for enemy in self.enemy_grid.query(player_rect(player)):
                 if not enemy.alive_flag or player.hit_invuln > 0:
                     continue
                 offset = (enemy.rect.x - px, enemy.rect.y - py)
                 if player.mask.overlap(enemy.mask, offset):
                     self._damage_player(player)
                     break
+        profiler.lap("collide.player_enemies")
 
     # ---- rendering ----
 
@@ -1118,13 +1208,10 @@ class Game_World(State):
 
     def _draw_state_label(self, display, x, y, label, color):
         """Draw a small state label centered below an icon."""
-        font = self.game.get_font(max(8, int(11 * self.ICON_SIZE / 44)))
-        shadow = font.render(label, True, (0, 0, 0))
-        txt = font.render(label, True, color)
-        tx = x + self.ICON_SIZE // 2 - txt.get_width() // 2
-        ty = y + self.ICON_SIZE + 1
-        display.blit(shadow, (tx + 1, ty + 1))
-        display.blit(txt, (tx, ty))
+        self.game.text.draw(display, label, color,
+                            (x + self.ICON_SIZE // 2, y + self.ICON_SIZE + 1),
+                            max(8, int(11 * self.ICON_SIZE / 44)),
+                            anchor="midtop", shadow=(0, 0, 0))
 
     _symbol_cache = {}
 
@@ -1241,14 +1328,18 @@ class Game_World(State):
     def _draw_heart(surface, x, y, size, filled=True):
         surface.blit(Game_World._get_heart(size, filled), (x, y))
 
-    def _draw_lives_and_shield(self, display, x, y, player):
+    def _draw_lives_and_shield(self, display, x, y, player, animated=False):
+        """Hearts are static; the shield icon is animated while it is up."""
         row_h = self.ICON_SIZE
         hs = self.HEART_SIZE
         gap = 3
         heart_y = y + (row_h - hs) // 2
-        for i in range(MAX_LIVES):
-            hx = x + i * (hs + gap)
-            self._draw_heart(display, hx, heart_y, hs, filled=(i < player.lives))
+        if not animated:
+            for i in range(MAX_LIVES):
+                hx = x + i * (hs + gap)
+                self._draw_heart(display, hx, heart_y, hs, filled=(i < player.lives))
+        if player.has_shield != animated:
+            return
 
         sz = hs + 2
         shield_x = x + MAX_LIVES * (hs + gap) + 2
@@ -1291,13 +1382,10 @@ class Game_World(State):
 
     def _draw_cooldown_text(self, display, x, y, seconds_left):
         """Draw remaining seconds centered on the icon."""
-        font = self.game.get_font(max(10, int(16 * self.ICON_SIZE / 44)))
-        txt = font.render(f"{seconds_left:.1f}", True, (255, 255, 255))
-        tx = x + self.ICON_SIZE // 2 - txt.get_width() // 2
-        ty = y + self.ICON_SIZE // 2 - txt.get_height() // 2
-        shadow = font.render(f"{seconds_left:.1f}", True, (0, 0, 0))
-        display.blit(shadow, (tx + 1, ty + 1))
-        display.blit(txt, (tx, ty))
+        half = self.ICON_SIZE // 2
+        self.game.text.draw(display, f"{seconds_left:.1f}", (255, 255, 255),
+                            (x + half, y + half), max(10, int(16 * self.ICON_SIZE / 44)),
+                            shadow=(0, 0, 0))
 
     def _draw_empty_icon(self, display, x, y):
         sz = self.ICON_SIZE
@@ -1306,37 +1394,102 @@ class Game_World(State):
         pygame.draw.rect(icon, (25, 25, 30, 150), (0, 0, sz, sz), border_radius=rd)
         pygame.draw.rect(icon, (60, 60, 65, 120), (0, 0, sz, sz), 2, border_radius=rd)
         cx, cy = sz // 2, sz // 2
-        font = self.game.get_font(max(10, int(18 * sz / 44)))
-        txt = font.render("?", True, (80, 80, 80))
-        icon.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2))
+        self.game.text.draw(icon, "?", (80, 80, 80), (cx, cy), max(10, int(18 * sz / 44)))
         display.blit(icon, (x, y))
 
+    # The static part of each player's HUD is drawn once into a cached
+    # surface and reused until _hud_key changes; glowing icons, cooldowns and
+    # the shield pulse are drawn on top every frame.
+    HUD_PAD = 12
+    _weapon_protos = {}
+
+    def _hud_text(self, size, text, color):
+        return self.game.text.render(text, color, size)
+
+    @classmethod
+    def _weapon_proto(cls, weapon_cls, level):
+        """Shared display-only weapon instance for inactive inventory slots."""
+        key = (weapon_cls, level)
+        weapon = cls._weapon_protos.get(key)
+        if weapon is None:
+            weapon = weapon_cls()
+            weapon.level = level
+            cls._weapon_protos[key] = weapon
+        return weapon
+
+    def _player_binding_labels(self, player):
+        labels = self.game.get_binding_labels()
+        return labels[player.index] if player.index < len(labels) else labels[0]
+
+    def _hud_key(self, player):
+        """Everything the static HUD layer depends on."""
+        bl = self._player_binding_labels(player)
+        sec = player.secondary
+        return (
+            player.alive, player.lives, player.has_shield, player.auto_fire,
+            player.primary.level,
+            type(sec) if sec else None, player.sec_state,
+            tuple(player.secondary_inventory),
+            tuple(player.secondary_levels.get(w, 1) for w in player.secondary_inventory),
+            tuple(player.sec_weapon_states.get(w, {}).get("state")
+                  for w in player.secondary_inventory),
+            bl["fire"], bl["secondary"], bl["cycle"],
+        )
+
+    def _hud_cache_size(self):
+        """Scratch size for one player's static HUD layer.
+
+        render places a player's HUD at the left edge or the middle of the
+        screen, so it never runs wider than half the screen; it is three icon
+        rows high at most (icon, cooldown bar, labels).
+        """
+        pad = self.HUD_PAD
+        return (self.game.GAME_WIDTH // 2 + 2 * pad, self.ICON_SIZE * 3 + 2 * pad)
+
     def _draw_player_hud(self, display, player, hud_x, hud_y):
+        key = self._hud_key(player)
+        cached = self._hud_layers.get(player.index)
+        if cached is None or cached[0] != key:
+            pad = self.HUD_PAD
+            layer = pygame.Surface(self._hud_cache_size(), pygame.SRCALPHA)
+            self._hud_pass(layer, player, pad, pad, animated=False)
+            bounds = layer.get_bounding_rect()
+            cached = (key, layer.subsurface(bounds).copy(),
+                      (bounds.x - pad, bounds.y - pad))
+            self._hud_layers[player.index] = cached
+        _, layer, (ox, oy) = cached
+        display.blit(layer, (hud_x + ox, hud_y + oy))
+        self._hud_pass(display, player, hud_x, hud_y, animated=True)
+
+    def _hud_pass(self, display, player, hud_x, hud_y, animated):
+        """Walk the HUD layout, drawing only the static or only the animated parts."""
         from objects.Player import Player
+        static = not animated
         step = self.ICON_SIZE + self.ICON_PAD
         hint_y = hud_y + self.ICON_SIZE + 12
-        hint_font = self.game.get_font(max(8, int(11 * self.ICON_SIZE / 44)))
-        labels = self.game.get_binding_labels()
-        bl = labels[player.index] if player.index < len(labels) else labels[0]
+        hint_size = max(8, int(11 * self.ICON_SIZE / 44))
+        bl = self._player_binding_labels(player)
 
         pc = Player.PLAYER_COLORS[player.index] if player.index < len(Player.PLAYER_COLORS) else (255, 255, 255)
         label = f"P{player.index + 1}"
         if not player.alive:
             label += " \u2620"
             pc = (120, 120, 120)
-        lbl_font = self.game.get_font(max(10, int(14 * self.ICON_SIZE / 44)))
-        lbl_surf = lbl_font.render(label, True, pc)
-        display.blit(lbl_surf, (hud_x, hud_y))
+        lbl_surf = self._hud_text(max(10, int(14 * self.ICON_SIZE / 44)), label, pc)
+        if static:
+            display.blit(lbl_surf, (hud_x, hud_y))
         hud_x += lbl_surf.get_width() + 4
 
-        self._draw_weapon_icon(display, hud_x, hud_y, player.primary,
-                               fill_ratio=1.0, glowing=player.auto_fire)
+        if player.auto_fire == animated:
+            self._draw_weapon_icon(display, hud_x, hud_y, player.primary,
+                                   fill_ratio=1.0, glowing=player.auto_fire)
 
-        fire_label = "AUTO" if player.auto_fire else bl["fire"]
-        fire_color = (80, 255, 80) if player.auto_fire else (140, 140, 150)
-        htxt = hint_font.render(fire_label, True, fire_color)
-        display.blit(htxt, (hud_x + self.ICON_SIZE // 2 - htxt.get_width() // 2,
-                            hint_y))
+        if static:
+            fire_label = "AUTO" if player.auto_fire else bl["fire"]
+            fire_color = (80, 255, 80) if player.auto_fire else (140, 140, 150)
+            htxt = self._hud_text(hint_size, fire_label, fire_color)
+            display.blit(htxt, (hud_x + self.ICON_SIZE // 2 - htxt.get_width() // 2,
+                                hint_y))
 
         ix = hud_x + step
         if player.secondary_inventory:
@@ -1348,7 +1501,8 @@ class Game_World(State):
                 if is_selected:
                     sec = player.secondary
                     sec_color = pygame.Color(sec.color)
-                    if player.sec_state == SEC_ACTIVE:
+                    moving = player.sec_state in (SEC_ACTIVE, SEC_COOLDOWN)
+                    if animated and player.sec_state == SEC_ACTIVE:
                         self._draw_weapon_icon(display, ix, hud_y, sec,
                                                fill_ratio=1.0, glowing=True)
                         self._draw_state_label(display, ix, hud_y,
@@ -1356,7 +1510,7 @@ class Game_World(State):
                                                (min(255, sec_color.r + 100),
                                                 min(255, sec_color.g + 100),
                                                 min(255, sec_color.b + 100)))
-                    elif player.sec_state == SEC_COOLDOWN:
+                    elif animated and player.sec_state == SEC_COOLDOWN:
                         total_cd = player._sec_cooldown_duration()
                         elapsed_cd = total_cd - player.sec_state_timer
                         ratio = min(1.0, elapsed_cd / total_cd) if total_cd > 0 else 1.0
@@ -1370,23 +1524,24 @@ class Game_World(State):
                         self._draw_state_label(display, ix, bar_y + 6,
                                                f"{player.sec_state_timer:.1f}s",
                                                (255, 160, 60))
-                    else:
+                    elif static and not moving:
                         self._draw_weapon_icon(display, ix, hud_y, sec, fill_ratio=1.0)
                         self._draw_state_label(display, ix, hud_y,
                                                "READY", (80, 255, 80))
-                    if len(player.secondary_inventory) > 1:
+                    # Drawn in the icon's pass so the glow stays underneath.
+                    if moving == animated and len(player.secondary_inventory) > 1:
                         acx = ix + self.ICON_SIZE // 2
-                        pygame.draw.polygon(display, (255, 255, 100),
-                                            [(acx - 4, hud_y - 2),
-                                             (acx + 4, hud_y - 2),
-                                             (acx, hud_y - 7)])
+                        mark(display, pygame.draw.polygon(display, (255, 255, 100),
+                                                          [(acx - 4, hud_y - 2),
+                                                           (acx + 4, hud_y - 2),
+                                                           (acx, hud_y - 7)]))
                 else:
-                    tmp = weapon_cls()
-                    tmp.level = player.secondary_levels.get(weapon_cls, 1)
                     ws = player.sec_weapon_states.get(weapon_cls,
                                                       {"state": SEC_READY, "timer": 0})
-                    if ws["state"] == SEC_COOLDOWN:
+                    cooling = ws["state"] == SEC_COOLDOWN
+                    if animated and cooling:
                         wlevel = player.secondary_levels.get(weapon_cls, 1)
+                        tmp = self._weapon_proto(weapon_cls, wlevel)
                         total_cd = max(1.0, SECONDARY_CYCLE
                                        - wlevel * SECONDARY_ACTIVE_PER_LEVEL)
                         elapsed_cd = total_cd - ws["timer"]
@@ -1398,36 +1553,45 @@ class Game_World(State):
                         self._draw_state_label(display, ix, bar_y + 6,
                                                f"{ws['timer']:.1f}s",
                                                (180, 120, 50))
-                    elif ws["state"] == SEC_ACTIVE:
-                        self._draw_weapon_icon(display, ix, hud_y, tmp,
-                                               fill_ratio=1.0, greyed=False)
-                        self._draw_state_label(display, ix, hud_y,
-                                               "ACTIVE",
-                                               (255, 200, 60))
-                    else:
-                        self._draw_weapon_icon(display, ix, hud_y, tmp,
-                                               fill_ratio=1.0, greyed=True)
-                        self._draw_state_label(display, ix, hud_y,
-                                               "READY", (60, 160, 60))
+                    elif static and not cooling:
+                        tmp = self._weapon_proto(
+                            weapon_cls, player.secondary_levels.get(weapon_cls, 1))
+                        if ws["state"] == SEC_ACTIVE:
+                            self._draw_weapon_icon(display, ix, hud_y, tmp,
+                                                   fill_ratio=1.0, greyed=False)
+                            self._draw_state_label(display, ix, hud_y,
+                                                   "ACTIVE",
+                                                   (255, 200, 60))
+                        else:
+                            self._draw_weapon_icon(display, ix, hud_y, tmp,
+                                                   fill_ratio=1.0, greyed=True)
+                            self._draw_state_label(display, ix, hud_y,
+                                                   "READY", (60, 160, 60))
                 ix += step
 
             sec_count = len(player.secondary_inventory)
-            sec_mid = first_sec_x + (sec_count * step - self.ICON_PAD) // 2
-            parts = [bl["secondary"]]
-            if sec_count > 1:
-                parts.append(bl["cycle"])
-            hint_str = " \u00b7 ".join(parts)
-            htxt = hint_font.render(hint_str, True, (140, 140, 150))
-            display.blit(htxt, (sec_mid - htxt.get_width() // 2, hint_y))
+            if static:
+                sec_mid = first_sec_x + (sec_count * step - self.ICON_PAD) // 2
+                parts = [bl["secondary"]]
+                if sec_count > 1:
+                    parts.append(bl["cycle"])
+                hint_str = " \u00b7 ".join(parts)
+                htxt = self._hud_text(hint_size, hint_str, (140, 140, 150))
+                display.blit(htxt, (sec_mid - htxt.get_width() // 2, hint_y))
             ix_after = first_sec_x + sec_count * step
         else:
-            self._draw_empty_icon(display, ix, hud_y)
+            if static:
+                self._draw_empty_icon(display, ix, hud_y)
             ix_after = ix + step
 
-        self._draw_lives_and_shield(display, ix_after, hud_y, player)
+        self._draw_lives_and_shield(display, ix_after, hud_y, player, animated)
 
     def render(self, display):
-        display.blit(self.background, (0, 0))
+        if self.game.dirty is not None:
+            self.game.dirty.restore(self.background)
+        else:
+            display.blit(self.background, (0, 0))
+        self.game.profiler.lap("render.background")
 
         if self.boss_phase and self.boss_countdown > 0:
             secs = max(1, int(math.ceil(self.boss_countdown)))
@@ -1488,6 +1652,7 @@ class Game_World(State):
             else:
                 hx, hy = self.game.GAME_WIDTH // 2, self.game.GAME_HEIGHT - hud_h - 4
             self._draw_player_hud(display, player, hx, hy)
+        self.game.profiler.lap("render.hud")
 
         if self.upgrade_msg_timer > 0:
             alpha = min(1.0, self.upgrade_msg_timer / 0.3)
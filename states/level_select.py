@@ -51,6 +51,9 @@ class LevelSelect(State):
                                level_num=item.get("level_num", 0))
         new_state.enter_state()
 
+    def dirty_key(self):
+        return self.selected
+
     def render(self, display):
         display.blit(self.background, (0, 0))
         cx = self.game.GAME_WIDTH / 2
@@ -9,7 +9,7 @@ class PauseMenu(State):
         self.game = game
         self.game.reset_keys()
         State.__init__(self, game)
-        pygame.mixer.music.pause()
+        self.game.music.pause()
         self.game.paused = True
         self.selected = 0
 
@@ -35,10 +35,13 @@ class PauseMenu(State):
 
     def _resume(self):
         self.game.get_events()
-        pygame.mixer.music.unpause()
+        self.game.music.unpause()
         self.game.paused = False
         self.game.state_stack.pop()
 
+    def dirty_key(self):
+        return self.selected
+
     def render(self, display):
         self.prev_state.render(display)
 
@@ -34,6 +34,9 @@ class PlayerSelect(State):
         from states.level_select import LevelSelect
         LevelSelect(self.game).enter_state()
 
+    def dirty_key(self):
+        return self.selected
+
     def render(self, display):
         display.blit(self.background, (0, 0))
         cx = self.game.GAME_WIDTH / 2
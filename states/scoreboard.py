@@ -12,6 +12,9 @@ class Scoreboard(State):
             self.exit_state()
         self.game.reset_keys()
 
+    def dirty_key(self):
+        return len(self.game.high_scores)
+
     def render(self, display):
         display.fill((15, 15, 30))
         cx = self.game.GAME_WIDTH / 2
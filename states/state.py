@@ -9,6 +9,10 @@ class State:
     def render(self, surface):
         pass
 
+    def dirty_key(self):
+        """Everything render depends on, or None to redraw every frame."""
+        return None
+
     def enter_state(self):
         if len(self.game.state_stack) > 1:
             self.prev_state = self.game.state_stack[-1]
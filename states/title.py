@@ -3,6 +3,7 @@ from states.state import State
 
 
 MENU_ITEMS = ["New Game", "Controls", "Scoreboard", "Exit"]
+LOADING_BAR_SIZE = (240, 6)
 
 
 class Title(State):
@@ -45,6 +46,10 @@ class Title(State):
             self.game.playing = False
             self.game.running = False
 
+    def dirty_key(self):
+        loader = self.game.loader
+        return self.selected, None if loader.done else round(loader.progress(), 2)
+
     def render(self, display):
         display.blit(self.background, (0, 0))
         cx = self.game.GAME_WIDTH / 2
@@ -63,3 +68,16 @@ class Title(State):
                 color = (160, 160, 160)
                 prefix = "  "
             self.game.draw_text_sized(display, prefix + item, color, cx, y, 36)
+
+        loader = self.game.loader
+        if not loader.done:
+            self._draw_loading_bar(display, loader.progress())
+
+    def _draw_loading_bar(self, display, progress):
+        w, h = LOADING_BAR_SIZE
+        x = (self.game.GAME_WIDTH - w) // 2
+        y = self.game.GAME_HEIGHT - 40
+        pygame.draw.rect(display, (60, 60, 60), (x, y, w, h))
+        pygame.draw.rect(display, (255, 220, 60), (x, y, int(w * progress), h))
+        self.game.draw_text_sized(display, "Loading...", (160, 160, 160),
+                                  self.game.GAME_WIDTH / 2, y - 14, 18)
@@ -0,0 +1,49 @@
+import pytest
+
+from engine.assets import AssetHitchWarning, AssetRegistry
+from objects.Boss import Boss, BOSS_WIDTH, BOSS_HEIGHT
+from objects.Projectile import Projectile
+from objects.Rocks import Rock, BASIC
+from states.game_world import Game_World, WORLD_ASSETS
+
+
+def test_game_world_readies_gameplay_assets(game):
+    assert game.assets.is_loaded("background")
+    Game_World(game, "endless").enter_state()
+    for name in WORLD_ASSETS:
+        if name in game.assets.names() and game.assets.exists(name):
+            assert game.assets.is_loaded(name)
+    assert not game.assets.is_loaded("music_boss")
+    assert game.shoot_sounds and game.weapon_sounds["spread"]
+    game.active_game_world._begin_boss_countdown()
+    assert game.assets.get("boss").get_size() == (BOSS_WIDTH, BOSS_HEIGHT)
+
+
+def test_lazy_load_in_gameplay_is_reported(game):
+    registry = AssetRegistry(game.assets_dir, in_gameplay=lambda: True)
+    registry.image("ammo", "ammo/ammo_1.png")
+    with pytest.warns(AssetHitchWarning, match="ammo"):
+        registry.get("ammo")
+    assert [name for name, _ in registry.hitches] == ["ammo"]
+    registry.get("ammo")
+    assert len(registry.hitches) == 1
+
+
+def test_prewarm_skips_missing_files(game):
+    registry = AssetRegistry(game.assets_dir, in_gameplay=lambda: True)
+    registry.music("missing", "sounds/nope.ogg")
+    registry.image("ammo", "ammo/ammo_1.png")
+    registry.prewarm()
+    assert registry.is_loaded("ammo") and not registry.is_loaded("missing")
+    assert registry.hitches == []
+
+
+def test_gameplay_first_uses_do_not_hitch(game):
+    Game_World(game, "endless").enter_state()
+    Projectile("white", 100, 100, game, width=14, height=8)
+    game.rocks.add(Rock(500, 200, 30, 30, game, rock_type=BASIC))
+    gw = game.active_game_world
+    gw._begin_boss_countdown()
+    gw._start_boss()
+    assert isinstance(gw.boss, Boss)
+    assert game.assets.hitches == []
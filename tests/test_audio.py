@@ -0,0 +1,80 @@
+import numpy as np
+import pygame
+
+from engine.audio import VoiceManager, PRIORITY_BACKGROUND, PRIORITY_NORMAL, PRIORITY_HIGH
+
+
+class _Clock:
+    def __init__(self):
+        self.tick = 0
+
+
+def _long_sound(seconds=2.0):
+    rate, _, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=np.zeros(int(rate * seconds) * channels, np.int16).tobytes())
+
+
+def _voices(budgets=None):
+    clock = _Clock()
+    kwargs = {"budgets": budgets} if budgets else {}
+    return clock, VoiceManager(frame=lambda: clock.tick, **kwargs)
+
+
+def test_same_key_coalesces_within_a_frame(game):
+    clock, voices = _voices()
+    sound = _long_sound()
+    assert voices.play("shoot", [sound], "shoot") is not None
+    assert voices.play("shoot", [sound], "shoot") is None
+    assert voices.counts == {"requested": 2, "played": 1, "coalesced": 1,
+                             "stolen": 0, "dropped": 0}
+    clock.tick += 1
+    assert voices.play("shoot", [sound], "shoot") is not None
+    assert voices.last_frame["coalesced"] == 1
+    assert voices.totals["played"] == 2
+    voices.stop()
+
+
+def _playing(n):
+    return [pygame.mixer.Channel(i).get_sound() for i in range(n)]
+
+
+def test_full_category_steals_by_priority(game):
+    clock, voices = _voices({"explosion": 2, "shoot": 1})
+    a, b, c, d, e = (_long_sound() for _ in range(5))
+    voices.play("a", [a], "explosion", PRIORITY_BACKGROUND)
+    voices.play("b", [b], "explosion", PRIORITY_HIGH)
+    voices.play("c", [c], "shoot")
+    # Full: a normal voice replaces the background one, then has nothing to steal.
+    assert voices.play("d", [d], "explosion", PRIORITY_NORMAL) is not None
+    assert voices.play("e", [e], "explosion", PRIORITY_BACKGROUND) is None
+    assert voices.counts["stolen"] == 1 and voices.counts["dropped"] == 1
+    # The shoot channel was never touched.
+    assert _playing(3) == [d, b, c]
+    voices.stop()
+
+
+def test_equal_priority_steals_oldest(game):
+    clock, voices = _voices({"shoot": 2})
+    a, b, c = (_long_sound() for _ in range(3))
+    voices.play("a", [a], "shoot")
+    voices.play("b", [b], "shoot")
+    voices.play("c", [c], "shoot")
+    assert _playing(2) == [c, b]
+    voices.stop()
+
+
+def test_three_players_firing_together_play_one_shot(game):
+    game.require_assets("sounds")
+    game.tick += 1
+    for _ in range(3):
+        game.play_sound("shoot")
+    assert game.voices.frame_counts()["requested"] == 3
+    assert game.voices.counts["played"] == 1
+    game.stop_all_sounds()
+
+
+def test_missing_sound_is_requested_but_not_played(game):
+    game.tick += 1
+    game.play_sound("no_such_sound")
+    counts = game.voices.frame_counts()
+    assert counts["requested"] == 1 and counts["played"] == counts["dropped"] == 0
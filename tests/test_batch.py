@@ -0,0 +1,107 @@
+import pygame
+
+from engine.batch import LAYERS, BlitLayer, RenderBatch, health_bar
+from objects.Boss import Boss, BossLaser
+from objects.Enemy import Fighter
+
+
+class CountingSurface(pygame.Surface):
+    def __init__(self, size):
+        super().__init__(size)
+        self.calls = []
+
+    def blit(self, *args, **kwargs):
+        self.calls.append("blit")
+        return super().blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        self.calls.append("blits")
+        return super().blits(*args, **kwargs)
+
+
+def test_layer_reuses_its_slots_between_frames():
+    layer = BlitLayer(capacity=2)
+    sprite = pygame.Surface((4, 4))
+    sprite.fill((255, 0, 0))
+    layer.extend([(sprite, (0, 0)), (sprite, (4, 0))])
+    layer.append((sprite, (8, 0)))
+    surface = CountingSurface((16, 4))
+    assert layer.flush(surface)
+    assert surface.calls == ["blits"]
+    assert surface.get_at((9, 1)) == (255, 0, 0)
+    assert len(layer) == 0 and len(layer._items) == 3
+
+    layer.append((sprite, (12, 0)))
+    surface.fill((0, 0, 0))
+    layer.flush(surface)
+    assert surface.get_at((13, 1)) == (255, 0, 0)
+    assert surface.get_at((1, 1)) == (0, 0, 0)
+    assert len(layer._items) == 3
+    assert not layer.flush(surface)
+
+
+def test_health_bar_matches_drawn_rects():
+    drawn = pygame.Surface((60, 20))
+    pygame.draw.rect(drawn, (60, 60, 60), (4, 4, 42, 8))
+    pygame.draw.rect(drawn, (80, 0, 0), (5, 5, 40, 6))
+    pygame.draw.rect(drawn, (30, 200, 30), (5, 5, 17, 6))
+    blitted = pygame.Surface((60, 20))
+    blitted.blits(health_bar(5, 5, 40, 6, 17, (30, 200, 30), (60, 60, 60),
+                             back=(80, 0, 0)), False)
+    assert pygame.image.tobytes(blitted, "RGB") == pygame.image.tobytes(drawn, "RGB")
+
+
+def test_empty_health_bar_is_only_the_frame():
+    assert len(health_bar(0, 0, 10, 2, 0, (255, 0, 0), (40, 40, 40))) == 1
+
+
+def test_enemy_bar_goes_to_the_overlay_layer(game):
+    enemy = Fighter(600, 300, game)
+    sprites, overlays = [], []
+    enemy.collect(sprites, overlays)
+    assert sprites == [(enemy.image, enemy.rect)]
+    assert len(overlays) == 2
+
+
+def test_boss_laser_charge_line_matches_draw_line(game):
+    boss = Boss(game, attack_level=2, hp_override=100)
+    boss.rect.x = 900
+    laser = BossLaser(boss, 0, game)
+    laser.timer = 0.5
+    entries = []
+    laser.collect(entries)
+    line, (x, y), area = entries[0]
+    expected = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    pygame.draw.line(expected, (200, 0, 200), (boss.rect.left, y), (x, y), 1)
+    got = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    got.blit(line, (x, y), area)
+    assert pygame.image.tobytes(got, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_render_submits_one_blits_per_layer(game):
+    world = game.start_game("endless", num_players=3)
+    for i in range(6):
+        game.enemies.add(Fighter(700 + i * 60, 100 + i * 60, game))
+    world.boss = Boss(game, attack_level=4, hp_override=10**6)
+    world.boss._attack_spiral_storm()
+    for player in game.players:
+        player.has_shield = True
+        player.damage_indicator = 1.0
+    game.update()
+    game.render()
+    batch = game.batch
+    # Six enemies and their bars, three shielded players and their hearts,
+    # the boss and its bullets: all in at most one call per layer.
+    assert batch.calls <= len(LAYERS)
+    assert batch.entries > 6 * 3 + 3 * (2 + 3) + 1
+    assert all(len(batch[name]) == 0 for name in LAYERS)
+
+
+def test_batch_counts_only_non_empty_layers():
+    batch = RenderBatch(("a", "b"))
+    batch.begin()
+    batch["a"].append((pygame.Surface((1, 1)), (0, 0)))
+    surface = pygame.Surface((2, 2))
+    batch.flush(surface, "a")
+    batch.flush(surface, "b")
+    assert (batch.calls, batch.entries) == (1, 1)
@@ -0,0 +1,36 @@
+import json
+
+from benchmarks import suite
+
+
+def _results(update_ms, us):
+    return {"scenes": {"s": {"update_ms": update_ms, "render_ms": 1.0}},
+            "micro": {"Rock[basic]": {"us": us}}}
+
+
+def test_compare_flags_only_real_regressions():
+    rows = suite.compare(_results(1.5, 3.0), _results(1.0, 3.0), threshold=0.15)
+    flagged = {key for key, *_, regressed in rows if regressed}
+    assert flagged == {"scenes.s.update_ms"}
+
+
+def test_compare_ignores_tiny_absolute_deltas():
+    rows = suite.compare(_results(0.010, 3.0), _results(0.005, 3.0), threshold=0.15)
+    assert not any(row[4] for row in rows)
+
+
+def test_compare_skips_metrics_missing_from_baseline():
+    baseline = {"scenes": {}, "micro": {}}
+    assert suite.compare(_results(1.0, 1.0), baseline) == []
+
+
+def test_scene_smoke_run():
+    result = suite.run_scene(suite.SCENES["boss_tier4_spiral_ring"], frames=3, rounds=1)
+    assert set(result) == {"update_ms", "render_ms"}
+    assert result["update_ms"] > 0
+
+
+def test_baseline_covers_every_scene():
+    with open(suite.BASELINE_PATH) as f:
+        baseline = json.load(f)
+    assert set(baseline["scenes"]) == set(suite.SCENES)
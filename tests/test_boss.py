@@ -1,10 +1,11 @@
+import pygame
 import pytest
 from objects.Boss import (
     Boss, BossProjectile, BossLaser, BOSS_BASE_HP,
     HIT_COOLDOWN, INVULN_PHASE_DURATION,
     PATROL_LEFT_RATIO, PATROL_RIGHT_RATIO, PATROL_SPEED,
     LASER_CHARGE_DURATION, LASER_ACTIVE_DURATION,
-    LASER_MAX_CONCURRENT,
+    LASER_MAX_CONCURRENT, LASER_RING_SIZE, LASER_BEAM_RADIUS,
 )
 from states.game_world import Game_World, LEVEL_DURATION, BOSS_COUNTDOWN
 
@@ -167,6 +168,105 @@ def test_boss_laser_done_when_segments_gone(game):
     assert laser.done
 
 
+def _active_laser(game, offset_y=0):
+    boss = Boss(game, attack_level=2, hp_override=20)
+    boss.entering = False
+    boss.rect.x = 600
+    laser = BossLaser(boss, offset_y, game)
+    laser.update(LASER_CHARGE_DURATION + 0.01)
+    return boss, laser
+
+
+def test_boss_laser_ring_wraps_and_stays_sorted(game):
+    boss, laser = _active_laser(game)
+    for _ in range(LASER_RING_SIZE + 100):
+        laser.update(1 / 60)
+        laser.timer = 0.0  # keep emitting
+    xs = [x for x, _ in laser.segments]
+    assert 0 < len(xs) <= LASER_RING_SIZE
+    assert xs == sorted(xs)
+    assert xs[0] > -20
+
+
+def test_boss_laser_hits_player_between_emitted_points(game):
+    boss, laser = _active_laser(game)
+    for _ in range(90):
+        laser.update(1 / 60)
+    player = game.players[0]
+    x, y = laser.segments[len(laser.segments) // 2]
+    player.position_x = x - 1
+    player.position_y = y + LASER_BEAM_RADIUS - 1
+    assert laser.hits_player(player)
+    player.position_y = y + LASER_BEAM_RADIUS + 1
+    assert not laser.hits_player(player)
+
+
+def test_boss_laser_misses_player_diagonally_past_the_beam_end(game):
+    boss = Boss(game, attack_level=2, hp_override=20)
+    laser = BossLaser(boss, 0, game)
+    laser.phase = "active"
+    laser._emit(100.0, 300.0)
+    laser._emit(200.0, 300.0)
+    player = game.players[0]
+    w, h = player.curr_image.get_size()
+    # Rect corner 5 px left of and 5 px above the beam's end: 7.07 px away.
+    player.position_x, player.position_y = 95 - w, 295 - h
+    assert not laser.hits_player(player)
+    player.position_x, player.position_y = 96 - w, 296 - h
+    assert laser.hits_player(player)
+    # Straight above the beam, 7 px off the centre line.
+    player.position_x, player.position_y = 150, 293 - h
+    assert laser.hits_player(player)
+    player.position_y = 292 - h
+    assert not laser.hits_player(player)
+
+
+def test_boss_laser_draws_stream_from_strip(game):
+    boss, laser = _active_laser(game)
+    for _ in range(30):
+        laser.update(1 / 60)
+    surface = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    laser.draw(surface)
+    x, y = laser.segments[0]
+    assert surface.get_at((int(x) + 2, int(y)))[:3] != (0, 0, 0)
+    assert surface.get_at((int(x) + 2, int(y) + 40))[:3] == (0, 0, 0)
+
+
+def test_boss_laser_keys_stay_inside_strip_over_a_patrol_sweep(game):
+    for start, end in (("patrol_left", "patrol_right"), ("patrol_right", "patrol_left")):
+        boss = Boss(game, attack_level=2, hp_override=20)
+        boss.entering = False
+        boss.rect.x = getattr(boss, start)
+        laser = BossLaser(boss, 0, game)
+        for _ in range(int(LASER_CHARGE_DURATION * 60) + 1):
+            laser.update(1 / 60)
+        assert laser.phase == "active"
+        a, b = getattr(boss, start), getattr(boss, end)
+        steps = int(LASER_ACTIVE_DURATION * 60) + 1
+        ox, _ = laser._strip_origin
+        width = laser._strip.get_width()
+        for i in range(steps):
+            boss.rect.x = a + (b - a) * i // (steps - 1)
+            laser.update(1 / 60)
+            for x, _ in laser.segments:
+                key = x + laser.scroll - ox
+                assert LASER_BEAM_RADIUS <= key <= width - LASER_BEAM_RADIUS
+
+
+def test_boss_laser_stream_blends_scroll_from_snapshot(game):
+    boss, laser = _active_laser(game)
+    for _ in range(20):
+        laser.update(1 / 60)
+    drawn = []
+    laser.collect(drawn)
+    laser.snapshot()
+    laser.update(1 / 60)
+    laser.render_alpha = 0.0
+    blended = []
+    laser.collect(blended)
+    assert blended[0][1] == drawn[0][1]
+
+
 def test_boss_laser_sweep_creates_one_or_two(game):
     boss = Boss(game, attack_level=2, hp_override=20)
     boss.entering = False
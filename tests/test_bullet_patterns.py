@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+from objects.Boss import Boss, BossProjectile, MAX_ATTACK_LEVEL
+from objects.bullet_patterns import (
+    BulletField, Emitter, PatternRunner, PATTERNS, PLAYER_HIT_RADIUS, TAU,
+)
+from states.game_world import Game_World, PLAYER_CENTER_OFFSET_X, PLAYER_CENTER_OFFSET_Y
+
+
+def _no_actions():
+    return {
+        "left": False, "right": False, "up": False, "down": False,
+        "action1": False, "action2": False, "start": False, "space": False,
+        "escape": False, "secondary": False,
+    }
+
+
+def _field(capacity=64):
+    return BulletField(800, 600, capacity)
+
+
+# ---- Emitter / PatternRunner ----
+
+def test_full_ring_angles_are_evenly_spaced():
+    angles = Emitter(8).angles(0.0)
+    assert len(angles) == 8
+    assert np.allclose(np.diff(angles), TAU / 8)
+
+
+def test_fan_spans_spread_around_base():
+    angles = Emitter(5, spread=1.0).angles(math.pi)
+    assert angles[0] == pytest.approx(math.pi - 0.5)
+    assert angles[-1] == pytest.approx(math.pi + 0.5)
+
+
+def test_runner_fires_bursts_on_schedule():
+    field = _field(1000)
+    runner = PatternRunner((Emitter(4, interval=0.1, bursts=3, delay=0.05),))
+    runner.update(0.04, field, (400, 300), (0, 300))
+    assert len(field) == 0
+    runner.update(0.02, field, (400, 300), (0, 300))
+    assert len(field) == 4
+    runner.update(0.25, field, (400, 300), (0, 300))
+    assert len(field) == 12
+    assert runner.done
+
+
+def test_runner_rotates_each_burst():
+    field = _field()
+    runner = PatternRunner((Emitter(1, rotation=0.5, interval=0.1, bursts=2, angle=0.0),))
+    runner.update(0.15, field, (400, 300), (0, 300))
+    assert field.uy[0] == pytest.approx(0.0)
+    assert field.uy[1] == pytest.approx(math.sin(0.5))
+
+
+def test_aimed_emitter_points_at_target():
+    field = _field()
+    PatternRunner((Emitter(1, aim=True),)).update(0.01, field, (400, 300), (400, 500))
+    assert field.ux[0] == pytest.approx(0.0, abs=1e-9)
+    assert field.uy[0] == pytest.approx(1.0)
+
+
+# ---- BulletField ----
+
+def test_update_moves_and_ramps_speed():
+    field = _field()
+    field.emit(400, 300, [0.0], speed=2.0, accel=0.5)
+    field.update()
+    field.update()
+    assert field.x[0] == pytest.approx(400 + 2.5 + 3.0)
+
+
+def test_update_culls_offscreen_bullets():
+    field = _field()
+    field.emit(5, 300, [math.pi, 0.0], speed=30.0)
+    field.update()
+    assert len(field) == 1
+    assert field.ux[0] == pytest.approx(1.0)
+
+
+def test_collide_circle_removes_only_hits():
+    field = _field()
+    field.emit(100, 100, [0.0], speed=0.0, radius=4)
+    field.emit(300, 300, [0.0], speed=0.0, radius=4)
+    assert field.collide_circle(110, 100, 8) == 1
+    assert len(field) == 1
+    assert field.x[0] == 300
+
+
+def test_emit_drops_overflow():
+    field = _field(capacity=10)
+    field.emit(400, 300, Emitter(16).angles(0.0), speed=1.0)
+    assert len(field) == 10
+    assert field.dropped == 6
+
+
+def test_draw_paints_bullets():
+    field = _field()
+    field.emit(50, 50, [0.0], speed=0.0, radius=4)
+    surface = pygame.Surface((100, 100))
+    field.draw(surface)
+    assert surface.get_at((50, 50))[:3] != (0, 0, 0)
+
+
+def test_collect_blends_from_snapshot_and_survives_compaction():
+    field = _field()
+    field.emit(5, 300, [math.pi], speed=30.0)
+    field.emit(400, 300, [0.0], speed=10.0, radius=0)
+    field.snapshot()
+    field.update()
+    field.emit(200, 200, [0.0], speed=10.0, radius=0)
+    assert len(field) == 2
+    field.render_alpha = 0.5
+    entries = []
+    field.collect(entries)
+    assert [dest for _, dest in entries] == [(405, 300), (200, 200)]
+
+
+# ---- Boss integration ----
+
+def test_tier5_pool_runs_patterns(game):
+    boss = Boss(game, attack_level=MAX_ATTACK_LEVEL)
+    assert set(boss._ATTACK_POOLS[5]) == set(PATTERNS)
+    boss.entering = False
+    boss.attack_timer = 9999
+    boss._attack_galaxy()
+    for _ in range(30):
+        boss.update(1 / 60)
+    assert len(boss.bullets) > 100
+
+
+def test_endless_fifth_boss_is_tier5(game):
+    gw = Game_World(game, game_mode="endless")
+    gw.boss_encounter = 4
+    assert gw._boss_attack_level() == 5
+    gw.boss_encounter = 9
+    assert gw._boss_attack_level() == MAX_ATTACK_LEVEL
+
+
+def test_field_bullet_damages_player(game):
+    gw = Game_World(game, game_mode="boss_challenge")
+    gw.enter_state()
+    gw.update(0.01, _no_actions())
+    player = game.players[0]
+    player.hit_invuln = 0
+    lives = player.lives
+    cx = player.position_x + PLAYER_CENTER_OFFSET_X
+    cy = player.position_y + PLAYER_CENTER_OFFSET_Y
+    gw.boss.bullets.emit(cx + PLAYER_HIT_RADIUS, cy, [0.0], speed=0.0)
+    gw._update_boss_combat()
+    assert player.lives == lives - 1
+    assert len(gw.boss.bullets) == 0
+
+
+def test_boss_projectiles_share_cached_images(game):
+    a = BossProjectile(500, 300, -3, 0, game)
+    b = BossProjectile(600, 200, -3, 1, game)
+    assert a.image is b.image
+    assert a.mask is b.mask
+    assert BossProjectile(500, 300, -3, 0, game, destroyable=False).image is not a.image
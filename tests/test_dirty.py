@@ -0,0 +1,122 @@
+import random
+
+import pygame
+import pytest
+
+from benchmarks.suite import SCENES
+from engine import rng
+from engine.dirty import DirtyRenderer, TrackingSurface, mark
+from objects.Rocks import Rock
+
+
+@pytest.fixture
+def dirty_game(monkeypatch):
+    Rock.sprites = None
+    from Game import Game
+
+    g = Game(dirty_rects=True)
+    # Pulsing HUD and shield effects read the clock; pin it to the tick so
+    # the reference render of a frame matches the dirty one.
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: g.tick * 16)
+    yield g
+
+
+def _reference(game):
+    """The current frame drawn the normal way, onto a separate surface."""
+    dirty, canvas = game.dirty, game.game_canvas
+    ref = pygame.Surface(game.screen.get_size(), 0, game.screen)
+    game.dirty, game.game_canvas = None, ref
+    try:
+        game.render()
+    finally:
+        game.dirty, game.game_canvas = dirty, canvas
+    return pygame.image.tobytes(ref, "RGB")
+
+
+def test_tracking_surface_records_blits_and_fills():
+    canvas = TrackingSurface((100, 100))
+    sprite = pygame.Surface((10, 10))
+    canvas.blit(sprite, (5, 5))
+    assert canvas.blits([(sprite, (20, 20)), (sprite, (95, 95))], False) is None
+    canvas.fill((1, 2, 3), (50, 50, 4, 4))
+    assert canvas.take() == [pygame.Rect(5, 5, 10, 10), pygame.Rect(20, 20, 10, 10),
+                             pygame.Rect(95, 95, 5, 5), pygame.Rect(50, 50, 4, 4)]
+    assert canvas.rects == []
+
+
+def test_mark_clips_and_ignores_plain_surfaces():
+    canvas = TrackingSurface((100, 100))
+    mark(canvas, pygame.draw.line(canvas, (255, 0, 0), (-20, 10), (30, 10)))
+    assert canvas.rects == [pygame.Rect(0, 10, 31, 1)]
+    canvas.tracking = False
+    mark(canvas, pygame.Rect(0, 0, 5, 5))
+    assert len(canvas.rects) == 1
+    mark(pygame.Surface((10, 10)), pygame.Rect(0, 0, 5, 5))
+
+
+def test_small_changes_update_only_their_tiles():
+    screen = pygame.Surface((320, 160))
+    dirty = DirtyRenderer(screen, tile=32)
+    background = pygame.Surface((320, 160))
+    sprite = pygame.Surface((8, 8))
+    sprite.fill((255, 255, 255))
+    for x in (10, 50):
+        dirty.restore(background)
+        dirty.canvas.blit(sprite, (x, 10))
+        dirty.present(flip=False)
+    # First frame is always full; the second covers the old and new tiles.
+    assert dirty.full_frames == 1
+    assert dirty.last_fraction == pytest.approx(2 * 32 * 32 / (320 * 160))
+    assert screen.get_at((10, 10)) == (0, 0, 0)
+    assert screen.get_at((50, 10)) == (255, 255, 255)
+
+
+def test_large_changes_fall_back_to_a_full_flip():
+    screen = pygame.Surface((320, 160))
+    dirty = DirtyRenderer(screen, threshold=0.25, tile=32)
+    background = pygame.Surface((320, 160))
+    big = pygame.Surface((200, 100))
+    for _ in range(2):
+        dirty.restore(background)
+        dirty.canvas.blit(big, (0, 0))
+        dirty.present(flip=False)
+    assert dirty.full_frames == 2
+    assert dirty.last_fraction == 1.0
+
+
+def test_unchanged_dirty_key_skips_the_frame():
+    dirty = DirtyRenderer(pygame.Surface((64, 64)))
+    state, other = object(), object()
+    assert dirty.begin(state, 1)
+    dirty.present(flip=False)
+    assert not dirty.begin(state, 1)
+    assert dirty.begin(state, 2)
+    assert dirty.begin(other, 2)
+    assert dirty.begin(other, None) and dirty.begin(other, None)
+    assert dirty.skipped_frames == 1
+
+
+def test_menu_frames_are_skipped_until_the_selection_moves(dirty_game, actions):
+    dirty_game.loader.wait_all()
+    title = dirty_game.state_stack[-1]
+    for _ in range(3):
+        dirty_game.render()
+    assert dirty_game.dirty.skipped_frames == 2
+    title.update(0, dict(actions, down=True))
+    dirty_game.render()
+    assert dirty_game.dirty.full_frames == 2
+    assert pygame.image.tobytes(dirty_game.screen, "RGB") == _reference(dirty_game)
+
+
+@pytest.mark.parametrize("scene", ["projectiles_200", "rocks_30_mixed", "black_holes_2",
+                                   "boss_tier4_spiral_ring", "players_3_all_secondaries",
+                                   "pickups_40"])
+def test_dirty_frames_match_full_redraws(dirty_game, scene):
+    rng.seed_all(1)
+    refill = SCENES[scene](dirty_game, random.Random(1))
+    for _ in range(40):
+        refill()
+        dirty_game.update()
+        dirty_game.render()
+        assert pygame.image.tobytes(dirty_game.screen, "RGB") == _reference(dirty_game)
+    assert dirty_game.dirty.frames == 40
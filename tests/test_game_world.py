@@ -197,8 +197,8 @@ def test_cluster_fragments_are_basic(game):
 def test_early_game_all_basic(game):
     gw = _enter_game_world(game)
     gw.elapsed_time = 5
-    import random
-    random.seed(42)
+    from engine.rng import seed_all
+    seed_all(42)
     types = [gw._pick_asteroid_type() for _ in range(100)]
     assert all(t == BASIC for t in types)
 
@@ -206,8 +206,8 @@ def test_early_game_all_basic(game):
 def test_late_game_has_variety(game):
     gw = _enter_game_world(game)
     gw.elapsed_time = 120
-    import random
-    random.seed(42)
+    from engine.rng import seed_all
+    seed_all(42)
     types = [gw._pick_asteroid_type() for _ in range(200)]
     assert CLUSTER in types
     assert IRON in types
@@ -344,3 +344,61 @@ def test_shield_no_drop_when_already_shielded(game):
     game.players[0].has_shield = True
     gw.total_kills_ever = 1
     assert gw._should_spawn_shield() is False
+
+
+# ---- black hole gravity ----
+
+def _add_black_hole(game, x, y):
+    from objects.Rocks import BLACKHOLE
+    bh = Rock(x, y, 16, 16, game, rock_type=BLACKHOLE, dx=0)
+    game.rocks.add(bh)
+    return bh
+
+
+def test_black_hole_pulls_projectiles_by_whole_pixels(game):
+    from objects.Projectile import Projectile
+    gw = _enter_game_world(game)
+    bh = _add_black_hole(game, 600, 300)
+    proj = Projectile("crimson", 500, 300, game, dx=0)
+    game.projectiles.add(proj)
+    gr, gs = bh.gravity_radius, bh.gravity_strength
+    gw._update_black_hole_gravity(0.5)
+    expected = int(gs * 0.7 * 0.5 * (1 - 100 / gr))
+    assert proj.rect.center == (500 + expected, 300)
+
+
+def test_black_hole_consumes_and_feeds_once_per_pass(game):
+    from objects.Projectile import Projectile
+    from objects.Pickup import ShieldPickup
+    gw = _enter_game_world(game)
+    bh = _add_black_hole(game, 600, 300)
+    shots = [Projectile("crimson", 600 + i, 300, game, dx=0) for i in range(3)]
+    game.projectiles.add(*shots)
+    game.pickups.add(ShieldPickup(601, 300, game))
+    rock = Rock(602, 300, 20, 20, game)
+    game.rocks.add(rock)
+    gw._update_black_hole_gravity(1 / 60)
+    assert not game.projectiles and not game.pickups and not rock.alive()
+    assert bh._bh_mass == pytest.approx(3 * 0.3 + 0.5 + 1.0)
+
+
+def test_black_holes_apply_in_sequence(game):
+    gw = _enter_game_world(game)
+    left = _add_black_hole(game, 300, 300)
+    right = _add_black_hole(game, 700, 300)
+    rock = Rock(500, 300, 20, 20, game)
+    game.rocks.add(rock)
+    gw._update_black_hole_gravity(1.0)
+    # Opposite pulls from equal distances do not cancel: the right-hand hole
+    # measures from the position the left-hand one already moved.
+    assert rock._fx < 500
+    assert rock._fy == 300
+    assert left._bh_mass == right._bh_mass == 0
+
+
+def test_black_hole_swallows_player(game):
+    gw = _enter_game_world(game)
+    player = game.players[0]
+    _add_black_hole(game, player.position_x, player.position_y)
+    gw._update_black_hole_gravity(1 / 60)
+    assert not player.alive
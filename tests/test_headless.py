@@ -0,0 +1,132 @@
+import pytest
+from Game import Game
+from objects.Rocks import Rock
+from states.game_world import Game_World
+
+
+@pytest.fixture
+def headless_game():
+    Rock.sprites = None
+    yield Game(headless=True)
+
+
+def test_headless_flag_set(headless_game):
+    assert headless_game.headless is True
+
+
+def test_start_game_pushes_world(headless_game):
+    gw = headless_game.start_game("endless", num_players=2)
+    assert isinstance(gw, Game_World)
+    assert headless_game.state_stack[-1] is gw
+    assert len(headless_game.players) == 2
+
+
+def test_run_frames_advances_time(headless_game):
+    gw = headless_game.start_game("endless")
+    headless_game.run_frames(120, dt=1 / 60)
+    assert gw.elapsed_time == pytest.approx(2.0, abs=1e-6)
+    assert len(headless_game.rocks) > 0
+
+
+def test_run_frames_with_render(headless_game):
+    gw = headless_game.start_game("testing")
+    headless_game.run_frames(30, render=True)
+    assert gw.elapsed_time > 0
+
+
+def test_get_delta_time_is_fixed_when_headless(headless_game):
+    from Game import HEADLESS_DT
+    headless_game.get_delta_time()
+    assert headless_game.frame_time == HEADLESS_DT
+
+
+def test_advance_runs_fixed_ticks_and_carries_remainder(headless_game):
+    from Game import TICK_DT
+    gw = headless_game.start_game("endless")
+    assert headless_game.advance(TICK_DT * 2.5) == 2
+    assert gw.elapsed_time == pytest.approx(TICK_DT * 2)
+    assert headless_game.render_alpha == pytest.approx(0.5)
+    assert headless_game.advance(TICK_DT * 0.25) == 0
+    assert headless_game.render_alpha == pytest.approx(0.75)
+    assert headless_game.advance(TICK_DT * 0.25) == 1
+    assert headless_game.delta_time == TICK_DT
+
+
+def test_advance_caps_ticks_under_load(headless_game):
+    from Game import MAX_TICKS_PER_FRAME, TICK_DT
+    gw = headless_game.start_game("endless")
+    assert headless_game.advance(1.0) == MAX_TICKS_PER_FRAME
+    assert gw.elapsed_time == pytest.approx(TICK_DT * MAX_TICKS_PER_FRAME)
+    assert headless_game.render_alpha == 0.0
+
+
+def test_tap_between_ticks_is_seen_by_the_next_tick(headless_game):
+    import pygame
+    from Game import TICK_DT
+    game = headless_game
+    key = next(k for k, acts in game._menu_key_down_map.items() if "start" in acts)
+    seen = []
+    game.update = lambda: seen.append(game.actions["start"])
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+    game.get_events()
+    assert game.advance(TICK_DT / 4) == 0
+    assert game.actions["start"]
+    game.advance(TICK_DT)
+    assert seen == [True]
+    assert not game.actions["start"]
+
+
+def test_render_interpolates_and_restores_positions(headless_game):
+    from Game import TICK_DT
+    headless_game.start_game("testing")
+    rock = Rock(600, 300, 40, 40, headless_game)
+    rock.dx, rock.dy = -4, 0
+    headless_game.rocks.add(rock)
+    player = headless_game.players[0]
+    headless_game.player_actions[0]["right"] = True
+    headless_game.advance(TICK_DT * 1.5)
+    simulated = rock.rect.topleft, player.position_x
+
+    drawn = []
+    original_collect = player.collect
+    player.collect = lambda *layers: (drawn.append((rock.rect.x, player.position_x)),
+                                      original_collect(*layers))
+    headless_game.render()
+    prev_x = simulated[0][0] + 4
+    assert drawn[0][0] == round(simulated[0][0] + (prev_x - simulated[0][0]) * 0.5)
+    assert drawn[0][1] < simulated[1]
+    assert (rock.rect.topleft, player.position_x) == simulated
+
+
+def test_render_interpolates_array_drawables(headless_game):
+    from Game import TICK_DT
+    world = headless_game.start_game("testing")
+    world.particles.spawn(600, 300, count=1)
+    world.particles.dx[0], world.particles.dy[0] = -120.0, 0.0
+    headless_game.advance(TICK_DT * 1.5)
+    particles = world.particles
+    blended = []
+    original_collect = particles.collect
+    particles.collect = lambda sink: (blended.append(
+        (particles.render_alpha, float(particles.px[0]), float(particles.x[0]))),
+        original_collect(sink))
+    headless_game.render()
+    alpha, px, x = blended[0]
+    assert alpha == pytest.approx(0.5)
+    assert px - x == pytest.approx(120.0 * TICK_DT)
+    assert particles.render_alpha == 1.0
+
+
+def test_late_game_boss_fight(headless_game):
+    """Endless at t=300s with a tier-4 boss can be stepped without a window."""
+    gw = headless_game.start_game("endless", num_players=3)
+    gw.elapsed_time = 300
+    gw.boss_encounter = 3
+    gw.next_boss_time = 300
+    for p in headless_game.players:
+        p.hit_invuln = 1e9
+    headless_game.run_frames(600)
+    assert gw.boss is not None
+    assert gw.boss.attack_level == 4
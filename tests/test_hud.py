@@ -0,0 +1,70 @@
+import pygame
+from states.game_world import Game_World
+from objects.Weapon import SpreadShot, LaserCannon
+from objects.Player import SEC_COOLDOWN
+
+
+def _world(game):
+    gw = Game_World(game)
+    gw.enter_state()
+    return gw, game.players[0]
+
+
+def _draw(gw, player):
+    surf = pygame.Surface((700, 140))
+    gw._draw_player_hud(surf, player, 20, 40)
+    return gw._hud_layers[player.index][1]
+
+
+def test_hud_layer_reused_while_state_unchanged(game):
+    gw, player = _world(game)
+    first = _draw(gw, player)
+    assert _draw(gw, player) is first
+
+
+def test_hud_layer_rebuilt_on_lives_change(game):
+    gw, player = _world(game)
+    first = _draw(gw, player)
+    player.lives -= 1
+    assert _draw(gw, player) is not first
+
+
+def test_hud_layer_rebuilt_on_weapon_change(game):
+    gw, player = _world(game)
+    first = _draw(gw, player)
+    player.set_secondary(SpreadShot)
+    second = _draw(gw, player)
+    assert second is not first
+    player.primary.level += 1
+    assert _draw(gw, player) is not second
+
+
+def test_cooldown_ticks_do_not_rebuild_layer(game):
+    gw, player = _world(game)
+    player.set_secondary(LaserCannon)
+    player.sec_state = SEC_COOLDOWN
+    player.sec_state_timer = 2.0
+    first = _draw(gw, player)
+    player.sec_state_timer = 1.2
+    assert _draw(gw, player) is first
+
+
+def test_binding_labels_cached_until_rebind(game):
+    labels = game.get_binding_labels()
+    assert game.get_binding_labels() is labels
+    game.all_bindings[0]["fire"] = [pygame.K_z]
+    game._build_key_maps()
+    assert game.get_binding_labels()[0]["fire"] == "Z"
+
+
+def test_hud_layer_rebuilt_on_rebind(game):
+    gw, player = _world(game)
+    first = _draw(gw, player)
+    game.all_bindings[0]["fire"] = [pygame.K_z]
+    game._build_key_maps()
+    assert _draw(gw, player) is not first
+
+
+def test_inactive_slots_share_weapon_prototypes(game):
+    assert Game_World._weapon_proto(SpreadShot, 2) is Game_World._weapon_proto(SpreadShot, 2)
+    assert Game_World._weapon_proto(SpreadShot, 3).level == 3
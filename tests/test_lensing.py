@@ -0,0 +1,59 @@
+import pygame
+from engine.lensing import LensingRenderer, LENS_RADIUS_STEP
+
+
+def _canvas():
+    canvas = pygame.Surface((640, 360))
+    for x in range(0, 640, 16):
+        pygame.draw.line(canvas, (200, 180, 60), (x, 0), (x, 359), 3)
+    return canvas
+
+
+def test_lens_radius_is_quantized():
+    r = LensingRenderer.lens_radius(361)
+    assert r % LENS_RADIUS_STEP == 0
+    assert r >= int(361 * 0.55)
+    assert LensingRenderer.lens_radius(365) == r
+
+
+def test_effect_changes_pixels_around_center():
+    canvas = _canvas()
+    before = pygame.image.tostring(canvas, "RGB")
+    LensingRenderer().draw(canvas, 320, 180, 8, 360, 0.0)
+    assert pygame.image.tostring(canvas, "RGB") != before
+
+
+def test_pieces_are_built_once_per_size():
+    renderer = LensingRenderer()
+    canvas = _canvas()
+    for x in (300, 310, 320):
+        renderer.draw(canvas, x, 180, 8, 360, 0.0)
+    assert len(renderer._masks) == 1
+    assert len(renderer._scratch) == 1
+    assert len(renderer._vignettes) == 1
+    assert len(renderer._glows) == 1
+
+
+def test_clipped_and_offscreen_lenses_draw_safely():
+    renderer = LensingRenderer(quality=0.5)
+    canvas = _canvas()
+    for cx, cy in ((0, 0), (630, 350), (-400, 180), (2000, 2000)):
+        renderer.draw(canvas, cx, cy, 20, 600, 1.0)
+
+
+def test_quality_is_clamped_to_the_buffer_size():
+    renderer = LensingRenderer(quality=2.0)
+    assert renderer.quality == 1.0
+    renderer.draw(_canvas(), 320, 180, 20, 600, 1.0)
+    renderer.quality = 0
+    assert 0 < renderer.quality < 1.0
+    renderer.draw(_canvas(), 320, 180, 20, 600, 1.0)
+
+
+def test_black_hole_uses_shared_renderer(game):
+    from objects.Rocks import Rock, BLACKHOLE
+    canvas = _canvas()
+    bh = Rock(320, 180, 16, 16, game, rock_type=BLACKHOLE)
+    Rock.lensing.clear()
+    bh.draw_blackhole_effects(canvas)
+    assert len(Rock.lensing._glows) == 1
@@ -0,0 +1,68 @@
+import threading
+
+import pygame
+import pytest
+
+from engine.assets import AssetRegistry
+from engine.loader import BackgroundLoader
+
+
+def test_jobs_run_in_order_on_worker():
+    ran = []
+    loader = BackgroundLoader()
+    for name in "abc":
+        loader.add(name, lambda name=name: ran.append((name, threading.current_thread().name)))
+    assert loader.progress() == 0.0
+    loader.start()
+    loader.wait_all()
+    assert [name for name, _ in ran] == ["a", "b", "c"]
+    assert loader.done and set(loader.timings) == {"a", "b", "c"}
+
+
+def test_wait_for_runs_unstarted_job_inline():
+    gate = threading.Event()
+    ran = []
+    loader = BackgroundLoader()
+    loader.add("slow", gate.wait)
+    loader.add("needed", lambda: ran.append(threading.current_thread()))
+    loader.start()
+    loader.wait_for("needed")
+    assert ran == [threading.current_thread()]
+    assert 0.0 < loader.progress() < 1.0
+    gate.set()
+    loader.wait_all()
+
+
+def test_job_error_is_raised_from_wait_for():
+    loader = BackgroundLoader()
+    loader.add("broken", lambda: 1 / 0)
+    loader.add("fine", lambda: None)
+    loader.start()
+    loader.wait_for("fine")
+    with pytest.raises(ZeroDivisionError):
+        loader.wait_for("broken")
+
+
+def test_decoded_asset_is_not_a_hitch(game):
+    registry = AssetRegistry(game.assets_dir, in_gameplay=lambda: True)
+    registry.image("ammo", "ammo/ammo_1.png")
+    loader = BackgroundLoader()
+    loader.add("ammo", lambda: registry.decode("ammo"))
+    loader.start()
+    loader.wait_for("ammo")
+    assert not registry.is_loaded("ammo")
+    assert registry.get("ammo").get_flags() & pygame.SRCALPHA
+    assert registry.hitches == []
+
+
+def test_job_added_after_start_runs_on_worker():
+    ran = threading.Event()
+    threads = []
+    loader = BackgroundLoader()
+    loader.start()
+    loader.add("late", lambda: (threads.append(threading.current_thread()), ran.set()))
+    assert ran.wait(2.0)
+    assert threads[0] is not threading.current_thread()
+    assert "late" in loader
+    loader.wait_for("late")
+    assert loader.is_done("late")
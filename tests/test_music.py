@@ -0,0 +1,70 @@
+import pygame
+
+from Game import TICK_DT
+from states.game_world import Game_World
+
+
+def _run_updates(game, seconds):
+    for _ in range(int(seconds / TICK_DT) + 1):
+        game.music.update(TICK_DT)
+
+
+def _channel(game, slot):
+    return pygame.mixer.Channel(game.music.first_channel + slot)
+
+
+def test_switch_waits_for_decode_without_blocking(game):
+    game.play_music("game")
+    assert game.music.current is None
+    game.loader.wait_for("track_game")
+    game.music.update(TICK_DT)
+    assert game.music.current == "game"
+    assert (None, "game") in game.music.stalls
+    game.music.stop()
+
+
+def test_crossfade_from_game_to_boss(game):
+    game.loader.wait_for("track_game")
+    game.play_music("game")
+    game.music.preload("boss")
+    game.loader.wait_for("track_boss")
+    game.play_music("boss")
+    assert game.music.current == "boss"
+    boss, old = _channel(game, game.music._active), _channel(game, 1 - game.music._active)
+    assert boss.get_busy() and old.get_busy()
+    assert boss.get_volume() == 0.0
+    _run_updates(game, game.music.crossfade)
+    assert not old.get_busy()
+    assert boss.get_volume() > 0.7
+    assert ("game", "boss") in game.music.stalls
+    game.music.stop()
+    _run_updates(game, game.music.crossfade)
+    assert not boss.get_busy()
+
+
+def test_missing_track_keeps_current(game):
+    game.loader.wait_for("track_game")
+    game.play_music("game")
+    game.play_music("menu")  # not shipped
+    game.music.update(TICK_DT)
+    assert game.music.current == "game"
+    game.music.stop()
+
+
+def test_pause_before_any_track_started(game):
+    pygame.mixer.set_num_channels(8)
+    game.music.pause()
+    game.music.unpause()
+    assert pygame.mixer.get_num_channels() >= game.music.first_channel + 2
+
+
+def test_boss_countdown_preloads_boss_track(game):
+    Game_World(game, "endless").enter_state()
+    assert "track_boss" not in game.loader
+    game.active_game_world._begin_boss_countdown()
+    assert "track_boss" in game.loader
+
+
+def test_boss_challenge_preloads_boss_track(game):
+    Game_World(game, "boss_challenge").enter_state()
+    assert "track_boss" in game.loader
@@ -1,34 +1,101 @@
-import random
-from states.game_world import Particle
+import numpy as np
+import pygame
+from engine.particles import ParticleSystem, PARTICLE_COLORS, MAX_RADIUS
 
 
-def test_particle_moves():
-    random.seed(42)
-    p = Particle(100, 100)
-    old_x, old_y = p.x, p.y
-    p.update(0.1)
-    assert (p.x, p.y) != (old_x, old_y)
+def test_particles_move():
+    ps = ParticleSystem(seed=42)
+    ps.spawn(100, 100, count=4)
+    ps.update(0.1)
+    moved = np.hypot(ps.x[:4] - 100, ps.y[:4] - 100)
+    assert (moved > 0).all()
 
 
-def test_particle_alive_during_lifetime():
-    random.seed(42)
-    p = Particle(100, 100)
-    assert p.update(0.01) is True
+def test_particles_alive_during_lifetime():
+    ps = ParticleSystem(seed=42)
+    ps.spawn(100, 100, count=8)
+    ps.update(0.01)
+    assert len(ps) == 8
 
 
-def test_particle_dies_after_lifetime():
-    random.seed(42)
-    p = Particle(100, 100)
-    assert p.update(10.0) is False
+def test_particles_die_after_lifetime():
+    ps = ParticleSystem(seed=42)
+    ps.spawn(100, 100, count=8)
+    ps.update(10.0)
+    assert len(ps) == 0
 
 
-def test_particle_shrinks_over_time():
-    import pygame
+def test_expired_rows_are_compacted_in_spawn_order():
+    ps = ParticleSystem(seed=42)
+    ps.spawn(100, 100, count=3)
+    ps.lifetime[1] = 0.05
+    survivors = ps.lifetime[[0, 2]].copy()
+    ps.update(0.1)
+    assert len(ps) == 2
+    assert np.array_equal(ps.lifetime[:2], survivors)
 
-    random.seed(42)
-    p = Particle(100, 100)
-    initial_size = p.size
-    p.update(p.lifetime * 0.9)
-    remaining = 1 - p.age / p.lifetime
-    effective = max(1, int(p.size * remaining))
-    assert effective < initial_size
+
+def test_capacity_evicts_oldest_first():
+    ps = ParticleSystem(capacity=10, seed=42)
+    ps.spawn(0, 0, count=6)
+    ps.spawn(500, 500, count=6)
+    assert len(ps) == 10
+    assert ps.evicted == 2
+    assert (ps.x[:4] == 0).all() and (ps.x[4:10] == 500).all()
+    ps.spawn(900, 900, count=25)
+    assert len(ps) == 10
+    assert (ps.x[:10] == 900).all()
+
+
+def test_spawn_is_seeded():
+    a, b = ParticleSystem(seed=7), ParticleSystem(seed=7)
+    a.spawn(50, 50, 5)
+    b.spawn(50, 50, 5)
+    assert np.array_equal(a.dx[:5], b.dx[:5])
+    assert np.array_equal(a.color[:5], b.color[:5])
+
+
+def test_sprite_matches_draw_circle():
+    table = ParticleSystem.sprite_table()
+    for ci, color in enumerate(PARTICLE_COLORS):
+        for radius in range(1, MAX_RADIUS + 1):
+            expected = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.circle(expected, color, (10, 10), radius)
+            got = pygame.Surface((20, 20), pygame.SRCALPHA)
+            got.blit(table[ci * (MAX_RADIUS + 1) + radius], (10 - radius - 1, 10 - radius - 1))
+            assert pygame.image.tostring(got, "RGBA") == pygame.image.tostring(expected, "RGBA")
+
+
+def test_particles_shrink_over_time_and_draw():
+    ps = ParticleSystem(seed=42)
+    ps.spawn(100, 100, count=1)
+    ps.size[0] = 4.5
+    surface = pygame.Surface((200, 200))
+    ps.update(ps.lifetime[0] * 0.9)
+    ps.draw(surface)
+    x, y = int(ps.x[0]), int(ps.y[0])
+    assert surface.get_at((x, y)) != pygame.Color(0, 0, 0)
+    assert surface.get_at((x + 3, y)) == pygame.Color(0, 0, 0)
+
+
+def test_collect_blends_from_snapshot():
+    ps = ParticleSystem(seed=1)
+    ps.spawn(100, 100, count=1)
+    ps.dx[0], ps.dy[0] = 100.0, 0.0
+    ps.snapshot()
+    ps.update(0.1)
+    ps.render_alpha = 0.25
+    entries = []
+    ps.collect(entries)
+    (sprite, (left, top)), = entries
+    radius = sprite.get_width() // 2 - 1
+    assert (left + radius + 1, top + radius + 1) == (102, 100)
+
+
+def test_game_world_spawns_into_particle_system(game):
+    from states.game_world import Game_World
+    gw = Game_World(game)
+    gw.spawn_particles(300, 300, count=30)
+    assert len(gw.particles) == 30
+    gw.update(0.6, {k: False for k in ("start", "space", "escape")})
+    assert len(gw.particles) == 0
@@ -0,0 +1,86 @@
+import csv
+import time
+
+import pygame
+from engine.profiler import FrameProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    profiler.lap("update")
+    profiler.end_frame({"rocks": 3})
+    assert profiler.stats() == []
+    assert profiler.counts == {}
+
+
+def test_laps_accumulate_within_a_frame():
+    profiler = FrameProfiler(enabled=True)
+    profiler.begin_frame()
+    time.sleep(0.002)
+    profiler.lap("a")
+    profiler.lap("b")
+    time.sleep(0.002)
+    profiler.lap("a")
+    profiler.end_frame()
+    stats = {name: avg for name, avg, _ in profiler.stats()}
+    assert list(stats) == ["a", "b", "total"]
+    assert stats["a"] >= 4.0
+    assert stats["a"] + stats["b"] <= stats["total"]
+
+
+def test_p95_of_rolling_window():
+    assert FrameProfiler._p95(list(range(1, 101))) == 96
+    assert FrameProfiler._p95([7.0]) == 7.0
+
+
+def test_rolling_window_drops_old_frames():
+    profiler = FrameProfiler(enabled=True, window=5)
+    for _ in range(20):
+        profiler.begin_frame()
+        profiler.lap("x")
+        profiler.end_frame()
+    assert len(profiler._history["x"]) == 5
+
+
+def test_session_writes_csv(tmp_path):
+    profiler = FrameProfiler(enabled=True, csv_dir=str(tmp_path))
+    profiler.begin_session("endless")
+    for i in range(3):
+        profiler.begin_frame()
+        profiler.lap("update")
+        profiler.lap("render")
+        profiler.end_frame({"rocks": i})
+    path = profiler.end_session()
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert {"frame", "total", "update", "render", "rocks"} <= set(rows[0])
+    assert [int(r["rocks"]) for r in rows] == [0, 1, 2]
+    assert profiler.end_session() is None
+
+
+def test_toggle_overlay_enables_and_draws(game):
+    profiler = game.profiler
+    assert not profiler.enabled
+    profiler.toggle_overlay()
+    assert profiler.enabled and profiler.overlay
+    world = game.start_game("endless")
+    world.elapsed_time = 60
+    game.run_frames(5, render=True)
+    phases = [name for name, _, _ in profiler.stats()]
+    assert "update.gravity" in phases and "render.hud" in phases
+    assert profiler.counts["rocks"] == len(game.rocks)
+    canvas = pygame.Surface((game.GAME_WIDTH, game.GAME_HEIGHT))
+    before = pygame.image.tostring(canvas, "RGB")
+    profiler.draw_overlay(canvas, game.text)
+    assert pygame.image.tostring(canvas, "RGB") != before
+    profiler.toggle_overlay()
+    assert not profiler.enabled and not profiler.overlay
+
+
+def test_hiding_overlay_keeps_profiling_that_was_on():
+    profiler = FrameProfiler(enabled=True)
+    profiler.toggle_overlay()
+    profiler.toggle_overlay()
+    assert profiler.enabled and not profiler.overlay
@@ -170,3 +170,39 @@ def test_projectile_damage_attribute(game):
     assert p_default.damage == 1
     p_custom = Projectile("orange", 100, 200, game, damage=2)
     assert p_custom.damage == 2
+
+
+# ---- template cache ----
+
+def test_same_spec_shares_image_and_mask(game):
+    a = Projectile("crimson", 100, 200, game)
+    b = Projectile("crimson", 300, 400, game)
+    assert a.image is b.image
+    assert a.mask is b.mask
+    assert a.rect is not b.rect
+
+
+def test_different_spec_gets_own_template(game):
+    a = Projectile("crimson", 100, 200, game)
+    b = Projectile("crimson", 100, 200, game, shiny=True)
+    c = Projectile("orchid", 100, 200, game, pulse=True, width=24, height=24)
+    assert a.image is not b.image
+    assert c.image is not a.image
+
+
+def test_template_cache_counts_hits(game):
+    cache = Projectile.templates
+    Projectile("gold", 100, 200, game, width=11, height=11)
+    hits, misses = cache.hits, cache.misses
+    Projectile("gold", 100, 200, game, width=11, height=11)
+    assert cache.hits == hits + 1
+    assert cache.misses == misses
+
+
+def test_template_cache_is_bounded(game):
+    cache = Projectile.templates
+    for x in range(cache.max_entries + 20):
+        Projectile("lime", x, 200, game, dx=0, width=50 + x, height=16,
+                   piercing=True, fullbeam=True)
+    assert len(cache) <= cache.max_entries
+    assert cache.stats()["bytes"] <= cache.max_bytes
@@ -0,0 +1,136 @@
+import math
+import pygame
+import pytest
+from objects.Projectile import Projectile
+from objects.Weapon import StraightCannon, SpreadShot, LaserCannon, HomingMissile
+
+
+@pytest.fixture
+def array_game():
+    from objects.Rocks import Rock
+    from Game import Game
+    Rock.sprites = None
+    return Game(projectile_engine="array")
+
+
+def _fire(game, weapon_cls, level, x=200, y=300):
+    weapon = weapon_cls()
+    weapon.level = level
+    shots = []
+    for spec in weapon.get_projectiles(x, y, game):
+        spec = dict(spec)
+        shots.append(Projectile(weapon.color, spec.pop("x"), spec.pop("y"), game, **spec))
+    game.projectiles.add(*shots)
+    return shots
+
+
+def _add_target(game, x, y):
+    from objects.Enemy import Fighter
+    enemy = Fighter(x, y, game)
+    enemy.entering = False
+    game.enemies.add(enemy)
+
+
+def _trace(game, shots, frames):
+    """Per-frame (center, alive) for every shot, advanced through the group."""
+    frames_out = []
+    for _ in range(frames):
+        game.projectiles.update()
+        frames_out.append([(p.rect.center, p.alive()) for p in shots])
+    return frames_out
+
+
+@pytest.mark.parametrize("weapon_cls,level", [
+    (StraightCannon, 1), (StraightCannon, 5),
+    (SpreadShot, 3), (LaserCannon, 3), (HomingMissile, 3),
+])
+def test_array_engine_matches_sprite_engine(game, array_game, weapon_cls, level):
+    for g in (game, array_game):
+        _add_target(g, 600, 420)
+    ref = _trace(game, _fire(game, weapon_cls, level), 200)
+    got = _trace(array_game, _fire(array_game, weapon_cls, level), 200)
+    assert got == ref
+
+
+def test_array_wave_matches_sprite(game, array_game):
+    for g in (game, array_game):
+        g.projectiles.add(
+            Projectile("lime", 100, 300, g, dx=7, wave=(20, 0.15, 0)),
+            Projectile("lime", 100, 300, g, dx=7, wave=(20, 0.15, math.pi)),
+        )
+    ref = _trace(game, list(game.projectiles), 60)
+    got = _trace(array_game, list(array_game.projectiles), 60)
+    assert got == ref
+
+
+def test_offscreen_shots_leave_group_and_store(array_game):
+    p = Projectile("crimson", array_game.GAME_WIDTH - 2, 200, array_game, dx=8)
+    keep = Projectile("crimson", 100, 200, array_game, dx=8)
+    array_game.projectiles.add(p, keep)
+    for _ in range(10):
+        array_game.projectiles.update()
+    assert not array_game.projectiles.has(p)
+    assert len(array_game.projectiles.store) == 1
+    assert array_game.projectiles.store.sprites == [keep]
+
+
+def test_lifetime_expiry(array_game):
+    p = Projectile("lime", 300, 200, array_game, dx=0, lifetime=10)
+    array_game.projectiles.add(p)
+    for _ in range(9):
+        array_game.projectiles.update()
+    assert p.alive()
+    array_game.projectiles.update()
+    assert not p.alive()
+
+
+def test_killed_shot_frees_its_row(array_game):
+    shots = [Projectile("crimson", 100 + i, 200, array_game) for i in range(5)]
+    array_game.projectiles.add(*shots)
+    shots[1].kill()
+    store = array_game.projectiles.store
+    assert len(store) == 4
+    for i, sprite in enumerate(store.sprites):
+        assert sprite._slot == i
+        assert store.cx[i] == sprite.rect.centerx
+    array_game.projectiles.empty()
+    assert len(store) == 0
+
+
+def test_nudge_keeps_store_in_sync(array_game):
+    p = Projectile("crimson", 100, 200, array_game, dx=8)
+    array_game.projectiles.add(p)
+    p.nudge(3, -4)
+    array_game.projectiles.update()
+    assert p.rect.center == (111, 196)
+
+
+def test_store_grows_past_capacity(array_game):
+    shots = [Projectile("crimson", 100, 10 + i % 500, array_game) for i in range(600)]
+    array_game.projectiles.add(*shots)
+    array_game.projectiles.update()
+    assert len(array_game.projectiles.store) == 600
+    assert all(p.rect.centerx == 108 for p in shots)
+
+
+def test_paused_freezes_array_projectiles(array_game):
+    p = Projectile("crimson", 100, 200, array_game, dx=8)
+    array_game.projectiles.add(p)
+    array_game.paused = True
+    array_game.projectiles.update()
+    assert p.rect.centerx == 100
+
+
+def test_draw_blits_every_shot(array_game):
+    canvas = pygame.Surface((array_game.GAME_WIDTH, array_game.GAME_HEIGHT))
+    array_game.projectiles.add(Projectile("crimson", 100, 200, array_game))
+    assert array_game.projectiles.draw(canvas) == []
+    assert canvas.get_at((100, 200)) != pygame.Color(0, 0, 0)
+
+
+def test_array_engine_runs_endless_game(array_game):
+    array_game.headless = True
+    world = array_game.start_game("endless")
+    world.elapsed_time = 120
+    array_game.run_frames(300, render=True)
+    assert len(array_game.projectiles.store) == len(array_game.projectiles)
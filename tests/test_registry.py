@@ -0,0 +1,69 @@
+import pygame
+from engine.registry import IndexedGroup
+from objects.Enemy import Drone, Fighter
+from objects.Projectile import Projectile
+from objects.Rocks import Rock, BASIC, BLACKHOLE
+
+
+class _Tagged(pygame.sprite.Sprite):
+    def __init__(self, tag):
+        super().__init__()
+        self.tag = tag
+
+
+def _group():
+    return IndexedGroup({"odd": lambda s: s.tag % 2, "big": lambda s: s.tag > 5})
+
+
+def test_partitions_follow_add_kill_and_empty():
+    group = _group()
+    sprites = [_Tagged(i) for i in range(10)]
+    group.add(*sprites)
+    assert list(group.partition("odd")) == [s for s in sprites if s.tag % 2]
+    assert group.count("big") == 4
+    sprites[7].kill()
+    assert sprites[7] not in group.partition("odd")
+    assert group.count("big") == 3
+    group.remove(sprites[1])
+    assert group.count("odd") == 3
+    group.empty()
+    assert group.count("odd") == 0 and group.count("big") == 0
+
+
+def test_partition_keeps_group_order():
+    group = _group()
+    sprites = [_Tagged(i) for i in (9, 3, 7, 1)]
+    group.add(*sprites)
+    sprites[1].kill()
+    group.add(sprites[1])
+    assert list(group.partition("odd")) == list(group)
+
+
+def test_game_groups_are_indexed(game):
+    shot = Projectile("crimson", 100, 100, game)
+    beam = Projectile("orchid", 100, 100, game, piercing=True)
+    game.projectiles.add(shot, beam)
+    assert list(game.projectiles.partition("normal")) == [shot]
+    assert list(game.projectiles.partition("piercing")) == [beam]
+
+    rock = Rock(500, 300, 30, 30, game, rock_type=BASIC)
+    bh = Rock(800, 300, 16, 16, game, rock_type=BLACKHOLE)
+    game.rocks.add(rock, bh)
+    assert list(game.rocks.partition("blackholes")) == [bh]
+    assert list(game.rocks.partition("solid")) == [rock]
+
+    game.enemies.add(Drone(900, 200, game), Drone(900, 300, game), Fighter(900, 400, game))
+    assert game.enemies.count("Drone") == 2
+    assert game.enemies.count("Fighter") == 1
+    assert game.enemies.count("Striker") == 0
+
+
+def test_array_projectile_group_is_indexed():
+    from Game import Game
+    game = Game(headless=True, projectile_engine="array")
+    beam = Projectile("orchid", 100, 100, game, piercing=True)
+    game.projectiles.add(Projectile("crimson", 100, 100, game), beam)
+    assert list(game.projectiles.partition("piercing")) == [beam]
+    beam.kill()
+    assert game.projectiles.count("piercing") == 0
+    assert len(game.projectiles.store) == 1
@@ -1,4 +1,5 @@
 import pygame
+from engine.rng import seed_all
 from objects.Rocks import Rock, BASIC, CLUSTER, IRON, BLACKHOLE
 
 
@@ -158,3 +159,32 @@ def test_blackhole_consume_radius_grows(game):
     er_before = rock.consume_radius
     rock.feed(5.0)
     assert rock.consume_radius > er_before
+
+
+# ---- variant cache ----
+
+def test_rocks_of_one_bucket_share_baked_variants(game):
+    from objects.Rocks import VARIANTS_PER_BUCKET
+    rocks = [Rock(500, 300, 60, 50, game, rock_type=CLUSTER) for _ in range(20)]
+    assert len({id(r.image) for r in rocks}) == VARIANTS_PER_BUCKET
+    assert len(Rock.variants[(CLUSTER, 60, 52)]) == VARIANTS_PER_BUCKET
+
+
+def test_sizes_snap_to_bucket(game):
+    from objects.Rocks import SIZE_BUCKET
+    rock = Rock(500, 300, 29, 31, game)
+    assert rock.rect.size == (28, 32)
+    assert rock.rect.width % SIZE_BUCKET == 0
+    assert Rock(500, 300, 5, 5, game).rect.size == (10, 10)
+
+
+def test_iron_damage_stages_are_prebaked(game):
+    seed_all(3)
+    rocks = [Rock(500, 300, 45, 45, game, rock_type=IRON) for _ in range(30)]
+    first = rocks[0]
+    stage = first._damage_stages[2]
+    first.take_damage(1)
+    assert first.image is stage
+    twin = next(r for r in rocks[1:] if r._base_image is first._base_image)
+    twin.take_damage(1)
+    assert twin.image is first.image
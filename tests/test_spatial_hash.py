@@ -0,0 +1,81 @@
+import random
+import pygame
+from engine.spatial_hash import SpatialHash, groupcollide
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, w, h):
+        super().__init__()
+        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.image, (255, 255, 255), self.image.get_rect())
+        self.mask = pygame.mask.from_surface(self.image)
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+def test_query_finds_overlapping_cells():
+    grid = SpatialHash(cell_size=32)
+    a = _Box(10, 10, 8, 8)
+    b = _Box(500, 500, 8, 8)
+    grid.rebuild([a, b])
+    assert grid.query(pygame.Rect(0, 0, 20, 20)) == [a]
+    assert grid.query(pygame.Rect(490, 490, 20, 20)) == [b]
+
+
+def test_query_dedupes_sprites_spanning_cells():
+    grid = SpatialHash(cell_size=16)
+    big = _Box(0, 0, 100, 100)
+    grid.insert(big)
+    assert grid.query(pygame.Rect(0, 0, 100, 100)) == [big]
+
+
+def test_query_keeps_insertion_order():
+    grid = SpatialHash(cell_size=16)
+    sprites = [_Box(i * 5, 0, 40, 40) for i in range(6)]
+    grid.rebuild(reversed(sprites))
+    assert grid.query(pygame.Rect(0, 0, 80, 40)) == list(reversed(sprites))
+
+
+def test_negative_coordinates():
+    grid = SpatialHash(cell_size=32)
+    s = _Box(-50, -40, 10, 10)
+    grid.insert(s)
+    assert grid.query(pygame.Rect(-60, -60, 30, 30)) == [s]
+
+
+def test_groupcollide_matches_pygame():
+    rng = random.Random(7)
+
+    def scene():
+        rng.seed(7)
+        a = pygame.sprite.Group(
+            _Box(rng.randint(0, 600), rng.randint(0, 400), 15, 15) for _ in range(80))
+        b = pygame.sprite.Group(
+            _Box(rng.randint(0, 600), rng.randint(0, 400),
+                 rng.randint(10, 60), rng.randint(10, 60)) for _ in range(40))
+        return a, b
+
+    a1, b1 = scene()
+    expected = pygame.sprite.groupcollide(a1, b1, True, False,
+                                          collided=pygame.sprite.collide_mask)
+    a2, b2 = scene()
+    grid = SpatialHash()
+    grid.rebuild(b2)
+    got = groupcollide(a2, grid, True, False, collided=pygame.sprite.collide_mask)
+
+    def key(hits):
+        return sorted((s.rect.topleft, tuple(o.rect.topleft for o in others))
+                      for s, others in hits.items())
+
+    assert key(got) == key(expected)
+    assert len(a2) == len(a1)
+
+
+def test_groupcollide_dokillb_skips_dead_targets():
+    target = _Box(100, 100, 20, 20)
+    shots = pygame.sprite.Group(_Box(105, 105, 10, 10), _Box(106, 106, 10, 10))
+    targets = pygame.sprite.Group(target)
+    grid = SpatialHash()
+    grid.rebuild(targets)
+    hits = groupcollide(shots, grid, False, True, collided=pygame.sprite.collide_mask)
+    assert len(hits) == 1
+    assert not target.alive()
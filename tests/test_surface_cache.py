@@ -0,0 +1,36 @@
+import pygame
+from engine.surface_cache import SurfaceCache
+
+
+def _surf(w=4, h=4):
+    return pygame.Surface((w, h), pygame.SRCALPHA)
+
+
+def test_miss_then_hit():
+    cache = SurfaceCache()
+    calls = []
+    build = lambda: calls.append(1) or _surf()
+    first = cache.get("a", build)
+    second = cache.get("a", build)
+    assert first is second
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_by_count():
+    cache = SurfaceCache(max_entries=2)
+    cache.get("a", _surf)
+    cache.get("b", _surf)
+    cache.get("a", _surf)
+    cache.get("c", _surf)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+
+
+def test_eviction_by_bytes():
+    cache = SurfaceCache(max_entries=100, max_bytes=4 * 10 * 10 * 2)
+    for key in range(5):
+        cache.get(key, lambda: (_surf(10, 10), None))
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] <= cache.max_bytes
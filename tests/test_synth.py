@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from engine import synth
+from Game import Game
+
+
+def test_swing_is_interleaved_int16():
+    samples = synth.swing(0.1, 190, 580, 150, 22050, 2)
+    assert samples.dtype == np.int16
+    assert len(samples) == int(22050 * 0.1) * 2
+    assert np.array_equal(samples[0::2], samples[1::2])
+    assert np.abs(samples).max() <= 32000
+
+
+def test_swing_is_deterministic():
+    a = synth.swing(0.1, 190, 580, 150, 22050, 1)
+    b = synth.swing(0.1, 190, 580, 150, 22050, 1)
+    assert np.array_equal(a, b)
+
+
+def test_cached_writes_then_loads(tmp_path):
+    calls = []
+
+    def render(*args):
+        calls.append(args)
+        return synth.swing(*args)
+
+    fmt = (22050, -16, 1)
+    first = synth.cached(render, (0.05, 190, 580, 150), fmt, str(tmp_path))
+    second = synth.cached(render, (0.05, 190, 580, 150), fmt, str(tmp_path))
+    assert len(calls) == 1
+    assert len(os.listdir(tmp_path)) == 1
+    assert np.array_equal(first, second)
+
+
+def test_cache_key_includes_mixer_format(tmp_path):
+    params = (0.05, 190, 580, 150)
+    mono = synth.cache_path(str(tmp_path), synth.swing, params, (22050, -16, 1))
+    stereo = synth.cache_path(str(tmp_path), synth.swing, params, (22050, -16, 2))
+    assert mono != stereo
+
+
+def test_corrupt_cache_entry_is_rendered_again(tmp_path):
+    fmt = (22050, -16, 1)
+    params = (0.05, 190, 580, 150)
+    path = synth.cache_path(str(tmp_path), synth.swing, params, fmt)
+    with open(path, "wb") as f:
+        f.write(b"not a numpy file")
+    samples = synth.cached(synth.swing, params, fmt, str(tmp_path))
+    assert np.array_equal(samples, synth.swing(*params, 22050, 1))
+    assert np.array_equal(np.load(path), samples)
+
+
+def test_game_builds_swing_sounds(game, tmp_path):
+    snd = Game._synth_swing(0.1, 190, 580, 150, cache_dir=str(tmp_path))
+    assert snd is not None
+    assert abs(snd.get_length() - 0.1) < 0.01
+    game.require_assets("sounds")
+    assert len(game.weapon_sounds["spread"]) == 3
@@ -0,0 +1,97 @@
+import math
+import random
+
+import pygame
+
+from engine.target_index import TargetIndex
+from objects.Enemy import Fighter
+from objects.Projectile import Projectile, HOMING_ACQUIRE_RANGE
+from objects.Rocks import Rock, BASIC
+from objects.Weapon import HomingMissile, SpreadShot
+
+
+class _Point(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 4, 4)
+        self.rect.center = (x, y)
+
+
+def _dist(s, x, y):
+    return (s.rect.centerx - x) ** 2 + (s.rect.centery - y) ** 2
+
+
+def test_k_nearest_matches_brute_force():
+    r = random.Random(3)
+    for _ in range(300):
+        points = [_Point(r.randint(0, 400), r.randint(0, 400)) for _ in range(r.randint(0, 25))]
+        index = TargetIndex(points)
+        x, y, k = r.randint(0, 400), r.randint(0, 400), r.randint(1, 5)
+        max_range = r.choice([math.inf, 80, 200])
+        right_of = r.choice([-math.inf, x - 50])
+        expected = sorted(_dist(p, x, y) for p in points
+                          if p.rect.centerx > right_of and _dist(p, x, y) <= max_range ** 2)
+        got = index.k_nearest(x, y, k, max_range, right_of)
+        assert [_dist(p, x, y) for p in got] == expected[:k]
+
+
+def test_nearest_respects_range():
+    index = TargetIndex([_Point(100, 100), _Point(300, 100)])
+    assert index.nearest(290, 100).rect.centerx == 300
+    assert index.nearest(200, 400, max_range=50) is None
+    assert TargetIndex().nearest(0, 0) is None
+
+
+def test_ship_index_rebuilds_once_per_tick(game):
+    enemy = Fighter(400, 300, game)
+    game.enemies.add(enemy)
+    assert enemy in game.targets.ships
+    enemy.alive_flag = False
+    assert enemy in game.targets.ships
+    game.tick += 1
+    assert enemy not in game.targets.ships
+
+
+def test_spread_shot_aims_at_nearest_rocks_ahead(game):
+    for x, y in ((500, 150), (500, 250), (60, 200)):
+        game.rocks.add(Rock(x, y, 30, 30, game, rock_type=BASIC, dx=0, dy=0))
+    w = SpreadShot()
+    w.level = 2
+    angles = w._smart_angles(200, 200, 3, game)
+    assert angles[0] < 0 < angles[1]
+    assert angles[2] == w._fan_angles(3)[2]
+
+
+def test_homing_salvo_spreads_over_targets(game):
+    top = Fighter(500, 100, game)
+    bottom = Fighter(500, 350, game)
+    game.enemies.add(top, bottom)
+    w = HomingMissile()
+    w.level = 3
+    assert not w.get_projectiles(200, 240, game=game)[0].get("target")
+    w.assign_targets = True
+    projs = w.get_projectiles(200, 240, game=game)
+    targets = [p["target"] for p in sorted(projs, key=lambda p: p["y"])]
+    assert set(targets) == {top, bottom}
+    assert targets.index(bottom) > targets.index(top)
+
+
+def test_homing_drops_dead_assigned_target(game):
+    near = Fighter(300, 200, game)
+    far = Fighter(400, 100, game)
+    game.enemies.add(near, far)
+    p = Projectile("orange", 100, 200, game, dx=5, dy=0, homing=True,
+                   width=14, height=8, target=far)
+    assert p._find_homing_target(100, 200) is far
+    far.kill()
+    game.tick += 1
+    assert p._find_homing_target(100, 200) is near
+    assert p.target is None
+
+
+def test_homing_salvo_without_targets_is_unassigned(game):
+    w = HomingMissile()
+    w.level = 3
+    enemy = Fighter(200 + HOMING_ACQUIRE_RANGE + 100, 240, game)
+    game.enemies.add(enemy)
+    assert all("target" not in p for p in w.get_projectiles(200, 240, game=game))
@@ -0,0 +1,68 @@
+import pygame
+
+from engine.text import TextRenderer
+
+
+def _lit(surface):
+    w, h = surface.get_size()
+    return sum(1 for x in range(w) for y in range(h) if surface.get_at((x, y))[:3] != (0, 0, 0))
+
+
+def test_draw_matches_font_size(game):
+    text = TextRenderer()
+    surface = pygame.Surface((400, 60))
+    for label in ("Kills: 17", "Time alive: 123 s", "PAUSED"):
+        rect = text.draw(surface, label, (255, 255, 255), (200, 30), 30)
+        w, h = text.font(30).size(label)
+        assert abs(rect.width - w) <= 1 and rect.height == h
+        assert rect.center == (200, 30)
+
+
+def test_changing_numbers_reuse_one_atlas(game):
+    text = TextRenderer()
+    surface = pygame.Surface((400, 60))
+    for n in range(100):
+        text.draw(surface, f"Kills: {n}", (255, 255, 255), (200, 30), 30)
+    stats = text.stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1 and stats["hits"] == 99
+
+
+def test_draw_paints_glyphs_and_shadow(game):
+    text = TextRenderer()
+    plain = pygame.Surface((100, 40))
+    shadowed = pygame.Surface((100, 40))
+    text.draw(plain, "4.2", (255, 255, 255), (50, 20), 16)
+    text.draw(shadowed, "4.2", (255, 255, 255), (50, 20), 16, shadow=(90, 0, 0))
+    assert _lit(plain) > 0
+    assert _lit(shadowed) > _lit(plain)
+
+
+def test_anchor_places_rect(game):
+    text = TextRenderer()
+    rect = text.draw(pygame.Surface((100, 100)), "Lv", (255, 255, 255), (50, 10), 14,
+                     anchor="midtop")
+    assert rect.midtop == (50, 10)
+
+
+def test_non_ascii_falls_back_to_whole_string(game):
+    text = TextRenderer()
+    rect = text.draw(pygame.Surface((200, 40)), "x×2", (255, 255, 255), (100, 20), 20)
+    assert rect.width == text.font(20).size("x×2")[0]
+    assert ("text", "x×2", 20, (255, 255, 255)) in text.cache
+
+
+def test_cache_is_bounded_by_bytes(game):
+    text = TextRenderer(max_bytes=200_000)
+    surface = pygame.Surface((200, 40))
+    for shade in range(40):
+        text.draw(surface, "Hi", (shade, 255, 255), (100, 20), 30)
+    stats = text.stats()
+    assert stats["bytes"] <= 200_000
+    assert stats["evictions"] > 0
+
+
+def test_missing_font_file_uses_bundled_default(game, tmp_path):
+    text = TextRenderer(str(tmp_path / "missing.ttf"))
+    assert text.font_path is None
+    assert text.font(20).get_height() > 0
@@ -144,8 +144,8 @@ def test_enemy_pickup_type_distribution():
     results = {None: 0}
     for cls in SECONDARY_WEAPONS:
         results[cls] = 0
-    import random
-    random.seed(42)
+    from engine.rng import seed_all
+    seed_all(42)
     for _ in range(1000):
         t = gw_cls._random_enemy_pickup_type()
         assert t is None or t in SECONDARY_WEAPONS